@@ -0,0 +1,211 @@
+# benchmarks/fakes.py
+"""부하 테스트용 외부 서비스 대역 (MySQL, Anthropic API, 슬랙 웹훅)
+
+- FakeNewsConnector: MySQLConnector와 같은 조회 인터페이스로 메모리의 뉴스 행 반환
+- FakeAnthropicServer: /v1/messages를 흉내 내는 로컬 HTTP 서버 (지연, 429/5xx 주입, 스트리밍 지원)
+- SlackSink: 받은 웹훅 페이로드를 기록하는 로컬 HTTP 서버 (실패 주입)
+"""
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional
+
+
+class FakeNewsConnector:
+    """뉴스 조회 쿼리에 시드 데이터를 반환하는 MySQLConnector 대역 (1,000행당 지연 주입)"""
+
+    def __init__(self, rows: List[Dict], latency_per_1k: float = 0.0, error_rate: float = 0.0, seed: int = 0):
+        self.rows = rows
+        self.latency_per_1k = latency_per_1k
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.queries = 0
+        self.errors = 0
+
+    def _before_query(self, row_count: int) -> None:
+        self.queries += 1
+        if self.error_rate and self.rng.random() < self.error_rate:
+            self.errors += 1
+            raise ConnectionError("주입된 DB 오류")
+        time.sleep(self.latency_per_1k * row_count / 1000)
+
+    def execute_query(self, query: str, params: tuple = None) -> Optional[list]:
+        self._before_query(len(self.rows))
+        return [dict(row) for row in self.rows]
+
+    def stream_query(self, query: str, params: tuple = None, batch_size: int = 1000) -> Iterator[list]:
+        for start in range(0, len(self.rows), batch_size):
+            batch = self.rows[start:start + batch_size]
+            self._before_query(len(batch))
+            yield [dict(row) for row in batch]
+
+    def execute_update(self, query: str, params: tuple = None) -> Optional[int]:
+        return 0
+
+
+class _LocalServer:
+    """백그라운드 스레드에서 실행하는 로컬 HTTP 서버"""
+
+    def __init__(self, handler):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_port}"
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _send(handler: BaseHTTPRequestHandler, status: int, body: bytes, headers: Dict[str, str] = None) -> None:
+    handler.send_response(status)
+    for name, value in {'content-type': 'application/json', 'content-length': str(len(body)), **(headers or {})}.items():
+        handler.send_header(name, value)
+    handler.end_headers()
+    handler.wfile.write(body)
+
+
+class FakeAnthropicServer(_LocalServer):
+    """Anthropic Messages API 대역
+
+    latency: 응답 지연(초), rate_limit_rate: 429 비율(retry-after 포함), error_rate: 529/500 비율,
+    points: 응답에 넣을 분석 포인트 수. 입력 토큰은 프롬프트 길이로 추정한다.
+    """
+
+    def __init__(self, latency: float = 0.5, rate_limit_rate: float = 0.0, error_rate: float = 0.0,
+                 retry_after: float = 1.0, points: int = 5, seed: int = 0):
+        self.latency = latency
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.points = points
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {'requests': 0, 'rate_limited': 0, 'errors': 0, 'input_tokens': 0, 'output_tokens': 0}
+        super().__init__(self._handler())
+
+    def response_text(self) -> str:
+        return json.dumps({'market_analysis': [{
+            'topic': f"부하 테스트 주제 {i}",
+            'impact': ('Positive', 'Negative', 'Neutral')[i % 3],
+            'score': (i % 11) - 5,
+            'affected_sectors': ['반도체', '금융'],
+            'duration': '단기',
+            'analysis': '테스트용 분석 문장입니다. ' * 8
+        } for i in range(1, self.points + 1)]}, ensure_ascii=False)
+
+    def _outcome(self) -> str:
+        with self.lock:
+            self.stats['requests'] += 1
+            draw = self.rng.random()
+            if draw < self.rate_limit_rate:
+                self.stats['rate_limited'] += 1
+                return 'rate_limited'
+            if draw < self.rate_limit_rate + self.error_rate:
+                self.stats['errors'] += 1
+                return 'error'
+        return 'ok'
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['content-length'])))
+                prompt = json.dumps(body.get('messages', []), ensure_ascii=False)
+                input_tokens = len(prompt) // 2
+                if self.path.endswith('/count_tokens'):
+                    return _send(self, 200, json.dumps({'input_tokens': input_tokens}).encode())
+
+                time.sleep(fake.latency)
+                outcome = fake._outcome()
+                if outcome == 'rate_limited':
+                    error = {'type': 'error', 'error': {'type': 'rate_limit_error', 'message': 'rate limited'}}
+                    return _send(self, 429, json.dumps(error).encode(), {'retry-after': str(fake.retry_after)})
+                if outcome == 'error':
+                    error = {'type': 'error', 'error': {'type': 'overloaded_error', 'message': 'overloaded'}}
+                    return _send(self, 529, json.dumps(error).encode())
+
+                text = fake.response_text()
+                output_tokens = len(text) // 2
+                with fake.lock:
+                    fake.stats['input_tokens'] += input_tokens
+                    fake.stats['output_tokens'] += output_tokens
+                if body.get('stream'):
+                    return self._stream(text, input_tokens, output_tokens)
+                message = {
+                    'id': 'msg_fake', 'type': 'message', 'role': 'assistant', 'model': body.get('model'),
+                    'content': [{'type': 'text', 'text': text}], 'stop_reason': 'end_turn', 'stop_sequence': None,
+                    'usage': {'input_tokens': input_tokens, 'output_tokens': output_tokens}
+                }
+                _send(self, 200, json.dumps(message, ensure_ascii=False).encode())
+
+            def _stream(self, text: str, input_tokens: int, output_tokens: int) -> None:
+                self.send_response(200)
+                self.send_header('content-type', 'text/event-stream')
+                self.end_headers()
+
+                def event(name: str, data: Dict) -> None:
+                    self.wfile.write(f"event: {name}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode())
+                    self.wfile.flush()
+
+                event('message_start', {'type': 'message_start', 'message': {
+                    'id': 'msg_fake', 'type': 'message', 'role': 'assistant', 'model': 'fake', 'content': [],
+                    'stop_reason': None, 'stop_sequence': None,
+                    'usage': {'input_tokens': input_tokens, 'output_tokens': 1}}})
+                event('content_block_start', {'type': 'content_block_start', 'index': 0,
+                                              'content_block': {'type': 'text', 'text': ''}})
+                for start in range(0, len(text), 40):
+                    event('content_block_delta', {'type': 'content_block_delta', 'index': 0,
+                                                  'delta': {'type': 'text_delta', 'text': text[start:start + 40]}})
+                event('content_block_stop', {'type': 'content_block_stop', 'index': 0})
+                event('message_delta', {'type': 'message_delta', 'delta': {'stop_reason': 'end_turn', 'stop_sequence': None},
+                                        'usage': {'output_tokens': output_tokens}})
+                event('message_stop', {'type': 'message_stop'})
+
+        return Handler
+
+
+class SlackSink(_LocalServer):
+    """슬랙 웹훅 대역 (받은 페이로드 기록, error_rate 비율로 500 응답)"""
+
+    def __init__(self, error_rate: float = 0.0, latency: float = 0.0, seed: int = 0):
+        self.error_rate = error_rate
+        self.latency = latency
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.payloads: List[Dict] = []
+        self.failures = 0
+        super().__init__(self._handler())
+
+    def _handler(self):
+        sink = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                payload = json.loads(self.rfile.read(int(self.headers['content-length'])))
+                time.sleep(sink.latency)
+                with sink.lock:
+                    failed = sink.rng.random() < sink.error_rate
+                    if failed:
+                        sink.failures += 1
+                    else:
+                        sink.payloads.append({'path': self.path, 'payload': payload})
+                if failed:
+                    return _send(self, 500, b'internal_error', {'content-type': 'text/plain'})
+                _send(self, 200, b'ok', {'content-type': 'text/plain'})
+
+        return Handler
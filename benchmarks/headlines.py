@@ -0,0 +1,84 @@
+# benchmarks/headlines.py
+"""벤치마크용 한국어 경제 뉴스 헤드라인 생성기 (시드 고정)
+
+뉴스 테이블 행과 같은 형식(news_id, title, section, link, pub_time, create_at)을 만든다.
+- 같은 사건을 여러 매체가 조금씩 다르게 쓴 유사 제목 묶음 (말머리, 어순, 문장부호 변형)
+- 섹션 비중 (경제/증권/산업/국제/IT 등)
+- 인용 부호가 들어간 제목 ("…", '…', 「…」)
+"""
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+SECTIONS = (('경제', 30), ('증권', 25), ('산업', 20), ('국제', 10), ('IT', 10), ('정치', 5))
+
+SUBJECTS = (
+    '삼성전자', 'SK하이닉스', '현대차', '기아', 'LG에너지솔루션', '삼성바이오로직스', '네이버', '카카오',
+    '셀트리온', 'POSCO홀딩스', 'KB금융', '신한지주', '한화에어로스페이스', 'HD현대중공업', '두산에너빌리티',
+    '한국은행', '금융위원회', '기획재정부', '금융감독원', '공정거래위원회', '미 연준', '코스피', '코스닥',
+    '원·달러 환율', '국고채 금리', '외국인', '개인투자자', '2차전지株', '반도체株', '조선株'
+)
+
+EVENTS = {
+    '시장_전반': ('기준금리 동결', '금리 인하 시사', '환율 1,400원 돌파', '지수 2% 급락', '외국인 순매수 전환',
+               '증시 반등 성공', '달러 강세 지속', 'ETF 자금 유입 확대', '나스닥 급등에 동반 상승'),
+    '기업_산업': ('3분기 실적 발표', '영업이익 시장 예상 상회', '신규 투자 계약 체결', 'M&A 추진 공식화',
+               '매출 역대 최대', '합병 승인', '인수 협상 결렬', '사업 구조 개편', '해외 공장 증설'),
+    '제도_정책': ('공매도 규제 강화', '세제 개편안 발표', '정부 부동산 대책', '금융 정책 전환', '감독 규제 완화',
+               '법안 국회 통과', '제도 개선안 마련', '정책 금리 조정'),
+    '기타': ('CEO 교체', '주주총회 개최', '사회공헌 활동', '신제품 공개 행사', '브랜드 캠페인 시작')
+}
+
+PREFIXES = ('', '', '', '[속보]', '[단독]', '[종합]', '[마감시황]', '(상보)')
+SUFFIXES = ('', '', '', '…증권가 "긍정적"', '…"시장 예상 상회"', " '주목'", '에 투자자 촉각', '…전망은',
+            ' 外', '「업계 긴장」')
+QUOTES = ('"{}"', "'{}'", '「{}」', '"{}…"')
+COMMENTS = ('올해가 고비', '바닥 찍었다', '더 오른다', '과열 우려', '하반기 반등', '불확실성 여전')
+
+
+def _headline(rng: random.Random, subject: str, event: str) -> str:
+    title = f"{subject}, {event}"
+    if rng.random() < 0.25:
+        title += f" {rng.choice(QUOTES).format(rng.choice(COMMENTS))}"
+    return title
+
+
+def _variant(rng: random.Random, title: str) -> str:
+    """같은 사건의 다른 매체 제목 (말머리, 쉼표/공백, 꼬리말 변형)"""
+    prefix = rng.choice(PREFIXES)
+    variant = title.replace(', ', ' ', 1) if rng.random() < 0.4 else title
+    if rng.random() < 0.3:
+        variant = variant.replace(' ', '  ', 1)
+    return f"{prefix} {variant}{rng.choice(SUFFIXES)}".strip()
+
+
+def generate_headlines(count: int, seed: int = 42, family_ratio: float = 0.6,
+                       start: datetime = datetime(2025, 1, 2, 6, 0)) -> List[Dict]:
+    """유사 제목 묶음이 섞인 뉴스 행 count개 생성 (family_ratio: 묶음에 속한 행 비율)"""
+    rng = random.Random(seed)
+    sections = [name for name, _ in SECTIONS]
+    section_weights = [weight for _, weight in SECTIONS]
+    categories = list(EVENTS)
+
+    rows: List[Dict] = []
+    while len(rows) < count:
+        category = rng.choices(categories, weights=(35, 35, 20, 10))[0]
+        base = _headline(rng, rng.choice(SUBJECTS), rng.choice(EVENTS[category]))
+        section = rng.choices(sections, weights=section_weights)[0]
+        family_size = rng.randint(2, 8) if rng.random() < family_ratio else 1
+        for member in range(family_size):
+            title = base if member == 0 else _variant(rng, base)
+            rows.append({'section': rng.choice(sections) if member and rng.random() < 0.2 else section,
+                         'title': title})
+
+    rows = rows[:count]
+    rng.shuffle(rows)
+    for news_id, row in enumerate(rows, 1):
+        created = start + timedelta(seconds=news_id * 37)
+        row.update({
+            'news_id': news_id,
+            'link': f"https://news.example.com/article/{news_id}",
+            'pub_time': created.strftime('%Y-%m-%d %H:%M:%S'),
+            'create_at': created
+        })
+    return rows
@@ -0,0 +1,151 @@
+# benchmarks/json_repair_bench.py
+"""관용 JSON 파서 코퍼스 검증/퍼징/벤치마크
+
+사용법: python -m benchmarks.json_repair_bench [--fuzz-iterations N] [--seed S]
+
+1. corpus/json_repair의 실제 형식 오류 응답에서 복구한 분석 항목 수를 expected.json과 비교
+2. 정상 응답을 무작위로 자르거나 변형해 예외 없이 완성된 항목만 복구하는지 확인
+3. 기존 정규식 정제 방식과 응답 크기별 파싱 시간 비교
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+from modules.json_repair import parse_tolerant_json
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), 'corpus', 'json_repair')
+
+
+def legacy_clean_and_parse_json(content: str):
+    """기존 ClaudeClient.clean_and_parse_json (비교용)"""
+    try:
+        json_start = content.find('{')
+        json_end = content.rfind('}') + 1
+        json_content = content[json_start:json_end]
+
+        def escape_quotes_in_title(match):
+            title = match.group(1)
+            escaped_title = title.replace('"', '\\"')
+            return f'"title": "{escaped_title}"'
+
+        json_content = re.sub(r'"title":\s*"([^"]*(?:"[^"]*)*)"', escape_quotes_in_title, json_content)
+        json_content = re.sub(r'\s+', ' ', json_content)
+        json_content = json_content.replace('…', '...')
+        json_content = json_content.replace('···', '...')
+        json_content = json_content.replace('&amp;', '&')
+
+        return json.loads(json_content)
+    except Exception:
+        return None
+
+
+def count_items(parsed) -> int:
+    if not isinstance(parsed, dict) or not isinstance(parsed.get('market_analysis'), list):
+        return 0
+    return sum(1 for item in parsed['market_analysis'] if isinstance(item, dict))
+
+
+def build_response(entries: int, rng: random.Random) -> str:
+    items = [{
+        'topic': f"주제 {i} \"{rng.choice(['반도체', '환율', '금리', '조선'])}\" 영향",
+        'impact': rng.choice(['Positive', 'Negative', 'Neutral']),
+        'score': rng.randint(-5, 5),
+        'affected_sectors': [f"섹터{j}" for j in range(rng.randint(1, 4))],
+        'duration': rng.choice(['단기', '중기', '장기']),
+        'analysis': '관련 뉴스에 따르면 ' * rng.randint(3, 20) + '영향이 예상됩니다.'
+    } for i in range(entries)]
+    return json.dumps({'market_analysis': items}, ensure_ascii=False, indent=4)
+
+
+def check_corpus() -> bool:
+    with open(os.path.join(CORPUS_DIR, 'expected.json'), encoding='utf-8') as f:
+        expected = json.load(f)
+
+    ok = True
+    print(f"{'파일':<34}{'기대':>6}{'신규':>6}{'기존':>6}  복구 종류")
+    for name, expected_count in sorted(expected.items()):
+        with open(os.path.join(CORPUS_DIR, name), encoding='utf-8') as f:
+            content = f.read()
+        parsed, repairs = parse_tolerant_json(content)
+        recovered = count_items(parsed)
+        legacy = count_items(legacy_clean_and_parse_json(content))
+        ok &= recovered >= expected_count
+        print(f"{name:<34}{expected_count:>6}{recovered:>6}{legacy:>6}  {', '.join(sorted(repairs))}")
+    return ok
+
+
+def mutate(text: str, rng: random.Random) -> str:
+    mutation = rng.choice(['truncate', 'fence', 'trailing_comma', 'drop_char', 'insert_quote'])
+    if mutation == 'truncate':
+        return text[:rng.randint(0, len(text))]
+    if mutation == 'fence':
+        return f"```json\n{text}\n```"
+    if mutation == 'trailing_comma':
+        return text.replace('}\n', '},\n', 1).replace(']\n', '],\n', 1)
+    position = rng.randint(0, max(len(text) - 1, 0))
+    if mutation == 'drop_char':
+        return text[:position] + text[position + 1:]
+    return text[:position] + '"' + text[position:]
+
+
+def fuzz(iterations: int, rng: random.Random) -> bool:
+    """변형된 응답에서 예외가 없고, 잘린 응답은 잘린 지점 이전에 완성된 항목 수만큼 복구하는지 확인"""
+    failures = 0
+    for _ in range(iterations):
+        entries = rng.randint(1, 8)
+        text = build_response(entries, rng)
+        mutated = mutate(text, rng)
+        try:
+            parsed, _ = parse_tolerant_json(mutated)
+        except Exception as e:
+            failures += 1
+            print(f"예외 발생: {type(e).__name__}: {e}\n입력: {mutated[:200]!r}")
+            continue
+
+        if not text.startswith(mutated):
+            continue
+        # 잘린 응답: 잘린 지점 전에 닫힌 항목 수와 일치해야 함
+        complete = min(entries, mutated.count('\n        }'))
+        recovered = count_items(parsed)
+        if recovered != complete:
+            failures += 1
+            print(f"잘린 응답 복구 불일치: 기대 {complete}, 복구 {recovered}")
+
+    print(f"퍼징 {iterations}회, 실패 {failures}회")
+    return failures == 0
+
+
+def benchmark(rng: random.Random) -> None:
+    """정상 응답과 후행 쉼표가 있는 응답(관용 파싱 경로)의 크기별 파싱 시간"""
+    print(f"\n{'항목 수':>8}{'크기(KB)':>10}{'신규/정상(ms)':>15}{'신규/복구(ms)':>15}{'기존(ms)':>10}")
+    for entries in (5, 50, 500, 2000):
+        text = build_response(entries, rng)
+        malformed = text.replace('\n    ]', ',\n    ]')
+        timings = []
+        for parse, content in ((parse_tolerant_json, text), (parse_tolerant_json, malformed),
+                               (legacy_clean_and_parse_json, text)):
+            start = time.perf_counter()
+            for _ in range(5):
+                parse(content)
+            timings.append((time.perf_counter() - start) / 5 * 1000)
+        print(f"{entries:>8}{len(text) / 1024:>10.1f}{timings[0]:>15.2f}{timings[1]:>15.2f}{timings[2]:>10.2f}")
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--fuzz-iterations', type=int, default=2000)
+    arg_parser.add_argument('--seed', type=int, default=42)
+    args = arg_parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus_ok = check_corpus()
+    fuzz_ok = fuzz(args.fuzz_iterations, rng)
+    benchmark(rng)
+    return 0 if corpus_ok and fuzz_ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
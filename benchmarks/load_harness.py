@@ -0,0 +1,182 @@
+# benchmarks/load_harness.py
+"""NewsAnalysisScheduler.run_analysis 전체 경로 부하 테스트 (외부 서비스는 로컬 대역 사용)
+
+사용법: python -m benchmarks.load_harness [--scales 1000,10000,50000] [--engine lsh]
+            [--claude-latency 0.5] [--claude-429-rate 0.1] [--claude-error-rate 0.05]
+            [--slack-error-rate 0.1] [--db-latency-per-1k 0.02] [--output result.json]
+
+MySQL은 FakeNewsConnector, Claude는 FakeAnthropicServer(CLAUDE_BASE_URL), 슬랙은 SlackSink로 대체한다.
+뉴스 규모마다 스케줄러를 새로 만들어 한 번 실행하고 단계별 소요 시간, 초당 처리 행 수,
+Claude 요청/429/오류 수, 분석 포인트 수, 슬랙 전송/실패 수, 워터마크 확정 여부를 출력한다.
+조회 방식은 워터마크 모드(임시 파일)로 고정해 실행 시각과 무관하게 전체 시드 데이터를 조회한다.
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+from benchmarks.fakes import FakeAnthropicServer, FakeNewsConnector, SlackSink
+from benchmarks.headlines import generate_headlines
+
+# (단계 이름, 대상 속성 경로, 메서드 이름)
+STAGES = (
+    ('fetch', 'data_loader', 'get_news'),
+    ('cluster', 'analyzer.claude_client', 'cluster_news'),
+    ('select', 'analyzer.claude_client', 'select_news'),
+    ('claude', 'analyzer.claude_client', 'analyze_with_claude'),
+    ('slack', 'slack_router', 'send_news_summary'),
+)
+
+
+class StageTimer:
+    """인스턴스 메서드를 감싸 단계별 누적 소요 시간과 마지막 반환값 기록"""
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = defaultdict(float)
+        self.last_result: Dict[str, object] = {}
+
+    def wrap(self, owner, method_name: str, stage: str) -> None:
+        original = getattr(owner, method_name)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                self.last_result[stage] = original(*args, **kwargs)
+                return self.last_result[stage]
+            finally:
+                self.seconds[stage] += time.perf_counter() - start
+
+        setattr(owner, method_name, timed)
+
+
+def resolve(root, path: str):
+    for name in path.split('.'):
+        root = getattr(root, name)
+    return root
+
+
+def configure_environment(args, claude: FakeAnthropicServer, sink: SlackSink, workdir: str) -> None:
+    """모듈 import 전에 로컬 대역을 가리키도록 환경변수 설정 (이미 설정된 튜닝 값은 유지)"""
+    for name in ('DB_HOST', 'DB_USER', 'DB_PASSWORD', 'DB_NAME', 'CLAUDE_API_KEY'):
+        os.environ.setdefault(name, 'load-harness')
+    os.environ.update({
+        'CLAUDE_BASE_URL': claude.url,
+        'SLACK_WEBHOOK_URL': f"{sink.url}/services/load-harness",
+        'SLACK_DESTINATIONS_PATH': '',
+        'NEWS_LOAD_MODE': 'watermark',
+        'NEWS_WATERMARK_PATH': os.path.join(workdir, 'watermark.json'),
+        'NEWS_WATERMARK_LOOKBACK_HOURS': '24',
+        'NEWS_CLUSTERING_ENGINE': args.engine,
+        'PIPELINE_MODE': 'sync',
+        'DB_STREAM_BATCH_SIZE': '0'
+    })
+    os.environ.setdefault('RETRY_DELAY', '0.5')
+    os.environ.setdefault('SLACK_OUTBOX_DIR', os.path.join(workdir, 'slack_outbox'))
+
+
+def run_scale(scale: int, args, claude: FakeAnthropicServer, sink: SlackSink, workdir: str) -> Dict:
+    from modules.news_scheduler import NewsAnalysisScheduler
+
+    rows = generate_headlines(scale, seed=args.seed)
+    scheduler = NewsAnalysisScheduler()
+    connector = FakeNewsConnector(rows, latency_per_1k=args.db_latency_per_1k,
+                                  error_rate=args.db_error_rate, seed=args.seed)
+    scheduler.db_connector = connector
+    scheduler.data_loader.mysql_connector = connector
+
+    watermark_path = os.environ['NEWS_WATERMARK_PATH']
+    if os.path.exists(watermark_path):
+        os.remove(watermark_path)
+
+    timer = StageTimer()
+    for stage, owner_path, method_name in STAGES:
+        timer.wrap(resolve(scheduler, owner_path), method_name, stage)
+
+    claude_before = dict(claude.stats)
+    slack_before = (len(sink.payloads), sink.failures)
+    start = time.perf_counter()
+    outcome = scheduler.run_analysis()
+    total = time.perf_counter() - start
+
+    analysis = timer.last_result.get('claude') or {}
+    return {
+        'rows': scale,
+        'status': outcome.get('status'),
+        'message': outcome.get('message', ''),
+        'total_seconds': round(total, 3),
+        'rows_per_second': round(scale / total, 1),
+        'stages': {stage: round(timer.seconds.get(stage, 0.0), 3) for stage, _, _ in STAGES},
+        'claude': {key: claude.stats[key] - claude_before[key] for key in claude.stats},
+        'analysis_points': len(analysis.get('market_analysis', [])),
+        'slack': {'payloads': len(sink.payloads) - slack_before[0], 'failures': sink.failures - slack_before[1]},
+        'watermark_committed': os.path.exists(watermark_path),
+        'db_queries': connector.queries,
+        'db_errors': connector.errors
+    }
+
+
+def print_report(results: List[Dict]) -> None:
+    stage_names = [stage for stage, _, _ in STAGES]
+    header = f"{'행 수':>8}{'상태':>13}{'전체(s)':>9}{'행/s':>10}" + ''.join(f"{name + '(s)':>11}" for name in stage_names)
+    print(header + f"{'Claude 요청/429/오류':>22}{'분석':>6}{'슬랙 전송/실패':>16}{'워터마크':>9}")
+    for result in results:
+        claude = result['claude']
+        slack = result['slack']
+        print(f"{result['rows']:>8}{result['status']:>13}{result['total_seconds']:>9.2f}{result['rows_per_second']:>10,.0f}"
+              + ''.join(f"{result['stages'][name]:>11.3f}" for name in stage_names)
+              + f"{claude['requests']:>12}/{claude['rate_limited']}/{claude['errors']:<6}"
+              + f"{result['analysis_points']:>8}"
+              + f"{slack['payloads']:>10}/{slack['failures']:<5}"
+              + f"{'확정' if result['watermark_committed'] else '미확정':>9}")
+        if result['message']:
+            print(f"{'':>8}  {result['message']}")
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--scales', default='1000,10000,50000')
+    arg_parser.add_argument('--engine', default='lsh', help='클러스터링 엔진 (exact는 대규모에서 매우 느림)')
+    arg_parser.add_argument('--seed', type=int, default=42)
+    arg_parser.add_argument('--claude-latency', type=float, default=0.5)
+    arg_parser.add_argument('--claude-429-rate', type=float, default=0.0)
+    arg_parser.add_argument('--claude-error-rate', type=float, default=0.0)
+    arg_parser.add_argument('--claude-retry-after', type=float, default=1.0)
+    arg_parser.add_argument('--slack-error-rate', type=float, default=0.0)
+    arg_parser.add_argument('--slack-latency', type=float, default=0.05)
+    arg_parser.add_argument('--db-latency-per-1k', type=float, default=0.0)
+    arg_parser.add_argument('--db-error-rate', type=float, default=0.0)
+    arg_parser.add_argument('--output', help='결과 JSON 저장 경로')
+    arg_parser.add_argument('--verbose', action='store_true', help='처리 로그(INFO) 출력')
+    args = arg_parser.parse_args()
+
+    claude = FakeAnthropicServer(latency=args.claude_latency, rate_limit_rate=args.claude_429_rate,
+                                 error_rate=args.claude_error_rate, retry_after=args.claude_retry_after,
+                                 seed=args.seed)
+    sink = SlackSink(error_rate=args.slack_error_rate, latency=args.slack_latency, seed=args.seed)
+    workdir = tempfile.mkdtemp(prefix='load-harness-')
+    configure_environment(args, claude, sink, workdir)
+    if not args.verbose:
+        logging.disable(logging.INFO)
+
+    results = []
+    try:
+        for scale in (int(scale) for scale in args.scales.split(',')):
+            results.append(run_scale(scale, args, claude, sink, workdir))
+    finally:
+        claude.close()
+        sink.close()
+
+    print_report(results)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'args': vars(args), 'results': results}, f, ensure_ascii=False, indent=2)
+    return 0 if all(result['status'] == 'success' for result in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,175 @@
+# benchmarks/suite.py
+"""주요 처리 함수 마이크로 벤치마크 (처리량/최대 메모리, 기준값 비교)
+
+사용법: python -m benchmarks.suite [--scales 1000,10000,50000] [--engines exact,lsh,matrix]
+                                   [--baseline PATH] [--save-baseline] [--tolerance 0.3]
+
+1. headlines.generate_headlines로 규모별 뉴스 행을 만들어 cluster_news(엔진별), determine_category,
+   select_news, format_news_message, split_message를 측정
+2. corpus/claude_responses의 응답 샘플로 clean_and_parse_json 측정
+3. 기준값 파일과 비교해 실행 시간 또는 최대 메모리가 tolerance 이상 늘어난 항목을 회귀로 표시
+
+exact 엔진은 O(n²)이므로 --quadratic-limit 이하 규모에서만 측정한다.
+DB/슬랙/Claude에는 연결하지 않으며, 필수 환경변수가 없으면 더미 값을 사용한다.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+for _name in ('DB_HOST', 'DB_USER', 'DB_PASSWORD', 'DB_NAME', 'SLACK_WEBHOOK_URL', 'CLAUDE_API_KEY'):
+    os.environ.setdefault(_name, 'benchmark')
+
+from benchmarks.headlines import generate_headlines
+from modules.claude_client import ClaudeClient
+from modules.news_clusterer import NewsClusterer
+from modules.slack_sender import SlackSender
+
+RESPONSES_DIR = os.path.join(os.path.dirname(__file__), 'corpus', 'claude_responses')
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+MIN_COUNTS = {'시장_전반': 4, '기업_산업': 3, '제도_정책': 3}
+
+# (이름, 처리 항목 수, 준비 함수) - 준비 함수는 측정 대상 호출을 반환 (준비 시간은 측정에서 제외)
+Case = Tuple[str, int, Callable[[], Callable[[], object]]]
+
+
+def load_responses() -> List[str]:
+    responses = []
+    for name in sorted(os.listdir(RESPONSES_DIR)):
+        with open(os.path.join(RESPONSES_DIR, name), encoding='utf-8') as f:
+            responses.append(f.read())
+    return responses
+
+
+def build_cases(scales: List[int], engines: List[str], quadratic_limit: int) -> List[Case]:
+    client = ClaudeClient(os.environ['CLAUDE_API_KEY'])
+    sender = SlackSender(os.environ['SLACK_WEBHOOK_URL'])
+    responses = load_responses()
+    market_analysis = client.clean_and_parse_json(responses[0])['market_analysis']
+    cases: List[Case] = []
+
+    for scale in scales:
+        rows = generate_headlines(scale)
+
+        for engine in engines:
+            if engine == 'exact' and scale > quadratic_limit:
+                continue
+
+            def prepare_cluster(engine=engine, rows=rows):
+                client.clusterer = NewsClusterer(client.similarity_threshold, engine=engine)
+                copies = [dict(row) for row in rows]
+                return lambda: client.cluster_news(copies)
+            cases.append((f"cluster_news[{engine}]", scale, prepare_cluster))
+
+        titles = [row['title'] for row in rows]
+        cases.append(('determine_category', scale,
+                      lambda titles=titles: lambda: [client.determine_category(title) for title in titles]))
+
+        client.clusterer = NewsClusterer(client.similarity_threshold, engine='lsh')
+        clustered = client.cluster_news([dict(row) for row in rows])
+        cases.append(('select_news', scale,
+                      lambda clustered=clustered: lambda: client.select_news(clustered, MIN_COUNTS)))
+
+        result = {'news_items': rows, 'market_analysis': market_analysis,
+                  'usage_info': {'total_tokens': 1200, 'input_tokens': 1000, 'output_tokens': 200}}
+        cases.append(('format_news_message', scale,
+                      lambda result=result: lambda: sender.format_news_message(result)))
+        message = sender.format_news_message(result)
+        cases.append(('split_message', scale, lambda message=message: lambda: sender.split_message(message)))
+
+    repeated = responses * 20
+    cases.append(('clean_and_parse_json', len(repeated),
+                  lambda: lambda: [client.clean_and_parse_json(response) for response in repeated]))
+    return cases
+
+
+def measure(prepare: Callable[[], Callable[[], object]], repeat: int) -> Dict:
+    """최소 실행 시간(초)과 최대 추가 메모리(KB)"""
+    best = float('inf')
+    for _ in range(repeat):
+        run = prepare()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+
+    run = prepare()
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {'seconds': round(best, 6), 'peak_kb': round(peak / 1024, 1)}
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> List[str]:
+    """기준값 대비 tolerance 이상 느려지거나 메모리가 늘어난 항목"""
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if not previous:
+            continue
+        for metric in ('seconds', 'peak_kb'):
+            if previous[metric] > 0 and current[metric] > previous[metric] * (1 + tolerance):
+                regressions.append(f"{key} {metric}: {previous[metric]} -> {current[metric]}")
+    return regressions
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--scales', default='1000,10000,50000')
+    arg_parser.add_argument('--engines', default='exact,lsh,matrix')
+    arg_parser.add_argument('--quadratic-limit', type=int, default=10000)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    arg_parser.add_argument('--save-baseline', action='store_true')
+    arg_parser.add_argument('--tolerance', type=float, default=0.3)
+    args = arg_parser.parse_args()
+
+    # 측정 중 처리 로그(INFO/WARNING)는 생략
+    logging.disable(logging.WARNING)
+    scales = [int(scale) for scale in args.scales.split(',')]
+    cases = build_cases(scales, args.engines.split(','), args.quadratic_limit)
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+
+    results = {}
+    print(f"{'함수':<26}{'규모':>8}{'시간(ms)':>12}{'처리량(건/s)':>16}{'메모리(KB)':>14}{'기준 대비':>10}")
+    for name, items, prepare in cases:
+        key = f"{name}@{items}"
+        results[key] = measure(prepare, args.repeat)
+        seconds = results[key]['seconds']
+        previous = baseline.get(key)
+        ratio = f"{seconds / previous['seconds']:.2f}x" if previous and previous['seconds'] else '-'
+        print(f"{name:<26}{items:>8}{seconds * 1000:>12.1f}{items / max(seconds, 1e-9):>16,.0f}"
+              f"{results[key]['peak_kb']:>14,.0f}{ratio:>10}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({
+                'meta': {'created_at': datetime.now().isoformat(timespec='seconds'),
+                         'python': platform.python_version(), 'machine': platform.machine()},
+                'results': results
+            }, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        print(f"\n기준값 저장: {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n성능 회귀 {len(regressions)}건 (허용 {args.tolerance:.0%}):")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,5 +4,5 @@
 # 로그 디렉토리 생성
 mkdir -p /app/logs
 
-# 메인 스크립트 실행
-exec python /app/main.py
\ No newline at end of file
+# 메인 스크립트 실행 (컨테이너 인자 전달, 예: --once, --period 08:40)
+exec python /app/main.py "$@"
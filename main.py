@@ -1,13 +1,69 @@
 # main.py
 import time
-from utils.config import Config
-from utils.logger import setup_logger
-from modules.news_scheduler import NewsAnalysisScheduler
 
-logger = setup_logger(__name__)
-config = Config.get_instance()
+# 프로세스 시작 시각 (모듈 import 전에 기록해 시작 후 첫 조회까지의 소요 시간 측정)
+STARTED_AT = time.perf_counter()
 
-def main():
+import argparse
+import re
+import sys
+from datetime import datetime
+
+# 1회 실행에서 정상 종료로 보는 결과 (warning: 분석할 뉴스 없음)
+SUCCESS_STATUSES = ('success', 'warning')
+
+
+def period_time(value: str) -> str:
+    """--period 인자 검증 (HH:MM)"""
+    if not re.fullmatch(r'([01]\d|2[0-3]):[0-5]\d', value):
+        raise argparse.ArgumentTypeError(f"HH:MM 형식이어야 합니다: {value}")
+    return value
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    arg_parser = argparse.ArgumentParser(description="뉴스 분석 서비스")
+    arg_parser.add_argument('--once', action='store_true',
+                            help='분석을 한 번 실행하고 종료 (cron/Kubernetes CronJob용)')
+    arg_parser.add_argument('--period', type=period_time, metavar='HH:MM',
+                            help='오늘 이 시각(KST)의 분석 구간으로 한 번 실행 (--once 포함, 예: 08:40)')
+    return arg_parser.parse_args(argv)
+
+
+def run_once(period: str = None) -> int:
+    """분석을 한 번 실행하고 종료 코드 반환 (오류, 슬랙 발송 실패 시 1)"""
+    # 무거운 의존성(DB 드라이버, Claude SDK 등)은 인자 처리 후에 import
+    from utils.config import KST
+    from utils.logger import setup_logger
+    from modules.news_scheduler import NewsAnalysisScheduler
+
+    logger = setup_logger(__name__)
+    run_at = None
+    if period:
+        # 실행이 지연되어도 지정한 구간을 조회하도록 분석 기준 시각 고정
+        now = datetime.now(KST)
+        hour, minute = map(int, period.split(':'))
+        run_at = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+    logger.info(f"뉴스 분석 1회 실행{f' (구간 기준 시각: {period} KST)' if period else ''}")
+    scheduler = NewsAnalysisScheduler()
+    logger.info(f"초기화 완료, 분석 시작까지 {time.perf_counter() - STARTED_AT:.2f}초")
+
+    outcome = scheduler.run_analysis(run_at)
+    # 이번 실행에서 발송할 메시지가 없었더라도 이전에 남은 아웃박스 메시지 재전송
+    scheduler.slack_router.flush_outbox()
+    logger.info(f"뉴스 분석 1회 실행 종료: {outcome.get('status')} (전체 {time.perf_counter() - STARTED_AT:.2f}초)")
+    return 0 if outcome.get('status') in SUCCESS_STATUSES else 1
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.once or args.period:
+        return run_once(args.period)
+
+    from utils.logger import setup_logger
+    from modules.news_scheduler import NewsAnalysisScheduler
+
+    logger = setup_logger(__name__)
     try:
         logger.info("뉴스 분석 서비스 시작")
 
@@ -33,6 +89,7 @@ def main():
     except Exception as e:
         logger.error(f"서비스 실행 중 오류 발생: {str(e)}", exc_info=True)
         raise
+    return 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
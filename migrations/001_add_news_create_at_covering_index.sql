@@ -0,0 +1,8 @@
+-- migrations/001_add_news_create_at_covering_index.sql
+-- 구간 조회(NewsDataLoader.PERIOD_QUERY)용 커버링 인덱스
+-- create_at 범위 스캔 후 테이블 접근 없이 조회 컬럼을 모두 인덱스에서 읽는다.
+-- title/link가 TEXT 타입이거나 인덱스 키 길이 제한(3072 bytes)을 넘으면
+-- 해당 컬럼에 접두어 길이를 지정해야 하며, 이 경우 커버링은 되지 않고 범위 스캔만 적용된다.
+
+CREATE INDEX idx_news_create_at_covering
+    ON news (create_at, news_id, title, section, link, pub_time);
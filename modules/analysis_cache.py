@@ -0,0 +1,157 @@
+# modules/analysis_cache.py
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class AnalysisCache:
+    """Claude 시장 분석 결과 디스크 캐시
+
+    키는 모델 + 프롬프트 템플릿 버전 + 정렬된 선별 뉴스 ID의 해시이며,
+    ttl_hours가 지난 항목은 만료되고 max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 제거된다.
+    near_hit_ratio(0~1)를 지정하면 뉴스 ID 집합의 겹침 비율(Jaccard)이 그 이상인 항목도 재사용한다.
+    """
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, cache_dir: str, ttl_hours: int = 24, max_entries: int = 200,
+                 near_hit_ratio: float = 0.0):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.near_hit_ratio = near_hit_ratio
+        self._lock = threading.Lock()
+
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        self.index = self._load_index()
+
+    @staticmethod
+    def make_key(model: str, prompt_version: str, news_ids: Iterable) -> str:
+        payload = json.dumps([model, prompt_version, sorted(str(news_id) for news_id in news_ids)])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _index_path(self) -> str:
+        return os.path.join(self.cache_dir, self.INDEX_FILE)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self._index_path(), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.error(f"분석 캐시 인덱스 로드 실패, 캐시를 비웁니다: {str(e)}")
+            return {}
+
+    def _write_json(self, path: str, data) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _remove(self, key: str) -> None:
+        self.index.pop(key, None)
+        try:
+            os.remove(self._entry_path(key))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self, now: float) -> None:
+        """만료 항목 제거 후 최대 개수를 넘는 항목을 LRU 순서로 제거"""
+        for key in [k for k, meta in self.index.items() if now - meta['created_at'] > self.ttl_seconds]:
+            self._remove(key)
+
+        overflow = len(self.index) - self.max_entries
+        if overflow > 0:
+            for key in sorted(self.index, key=lambda k: self.index[k]['last_access'])[:overflow]:
+                self._remove(key)
+
+    def _find_near_hit(self, model: str, prompt_version: str, news_ids: set) -> Optional[tuple]:
+        best = None
+        for key, meta in self.index.items():
+            if meta['model'] != model or meta['prompt_version'] != prompt_version:
+                continue
+            cached_ids = set(meta['news_ids'])
+            overlap = len(news_ids & cached_ids) / len(news_ids | cached_ids)
+            if overlap >= self.near_hit_ratio and (best is None or (overlap, meta['created_at']) > best[1:]):
+                best = (key, overlap, meta['created_at'])
+        return best[:2] if best else None
+
+    def get(self, model: str, prompt_version: str, news_ids: List) -> Optional[Dict]:
+        """캐시된 분석 결과 조회 (없으면 None)"""
+        news_ids = {str(news_id) for news_id in news_ids}
+        if not news_ids:
+            return None
+
+        with self._lock:
+            now = time.time()
+            self._evict(now)
+
+            key = self.make_key(model, prompt_version, news_ids)
+            match, overlap = 'exact', 1.0
+            if key not in self.index:
+                near_hit = self._find_near_hit(model, prompt_version, news_ids) if self.near_hit_ratio > 0 else None
+                if not near_hit:
+                    return None
+                key, overlap = near_hit
+                match = 'near'
+
+            try:
+                with open(self._entry_path(key), 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"분석 캐시 항목을 읽지 못해 제거합니다: {str(e)}")
+                self._remove(key)
+                self._write_json(self._index_path(), self.index)
+                return None
+
+            self.index[key]['last_access'] = now
+            self._write_json(self._index_path(), self.index)
+
+        logger.info(f"분석 캐시 적중 ({match}, 겹침 비율: {overlap:.2f})")
+        return {
+            'market_analysis': entry['market_analysis'],
+            'usage_info': {
+                'input_tokens': 0,
+                'output_tokens': 0,
+                'total_tokens': 0,
+                'api_time': 0,
+                'cost_usd': 0.0,
+                'cached': True,
+                'cache_match': match,
+                'cache_overlap': round(overlap, 4),
+                'cache_age_sec': round(now - self.index[key]['created_at']),
+                'saved_cost_usd': entry.get('usage_info', {}).get('cost_usd', 0.0)
+            }
+        }
+
+    def put(self, model: str, prompt_version: str, news_ids: List, market_analysis: List[Dict],
+            usage_info: Dict) -> None:
+        """분석 결과 저장"""
+        news_ids = sorted({str(news_id) for news_id in news_ids})
+        key = self.make_key(model, prompt_version, news_ids)
+
+        with self._lock:
+            now = time.time()
+            self._write_json(self._entry_path(key), {
+                'market_analysis': market_analysis,
+                'usage_info': usage_info
+            })
+            self.index[key] = {
+                'model': model,
+                'prompt_version': prompt_version,
+                'news_ids': news_ids,
+                'created_at': now,
+                'last_access': now
+            }
+            self._evict(now)
+            self._write_json(self._index_path(), self.index)
@@ -0,0 +1,91 @@
+# modules/analysis_stream_parser.py
+from typing import Dict, List, Optional
+from modules.json_repair import parse_tolerant_json
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class MarketAnalysisStreamParser:
+    """스트리밍 응답에서 market_analysis 배열의 항목을 완성되는 즉시 추출
+
+    입력을 한 번만 순회하며(청크 경계와 무관) 문자열/이스케이프 상태와 중괄호 깊이를 추적한다.
+    배열 안의 객체가 닫히는 시점에 해당 구간만 파싱하여 반환한다.
+    """
+    ARRAY_KEY = '"market_analysis"'
+
+    def __init__(self):
+        self.text = ''
+        self.items: List[Dict] = []
+        self.done = False
+        self._pos = 0
+        self._state = 'key'  # key -> array -> items
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._object_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[Dict]:
+        """청크를 추가하고 새로 완성된 분석 항목 목록 반환"""
+        self.text += chunk
+        completed = []
+        if self.done:
+            return completed
+
+        text = self.text
+        while self._pos < len(text) and not self.done:
+            if self._state == 'key':
+                key_pos = text.find(self.ARRAY_KEY, self._pos)
+                if key_pos == -1:
+                    # 키가 청크 경계에 걸칠 수 있으므로 키 길이만큼 남겨둠
+                    self._pos = max(self._pos, len(text) - len(self.ARRAY_KEY))
+                    break
+                self._pos = key_pos + len(self.ARRAY_KEY)
+                self._state = 'array'
+                continue
+
+            if self._state == 'array':
+                array_pos = text.find('[', self._pos)
+                if array_pos == -1:
+                    self._pos = len(text)
+                    break
+                self._pos = array_pos + 1
+                self._state = 'items'
+                continue
+
+            char = text[self._pos]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == '{':
+                if self._depth == 0:
+                    self._object_start = self._pos
+                self._depth += 1
+            elif char == '}':
+                self._depth -= 1
+                if self._depth == 0 and self._object_start is not None:
+                    item = self._parse_object(text[self._object_start:self._pos + 1])
+                    self._object_start = None
+                    if item is not None:
+                        self.items.append(item)
+                        completed.append(item)
+            elif char == ']' and self._depth == 0:
+                self.done = True
+            self._pos += 1
+
+        return completed
+
+    @staticmethod
+    def _parse_object(object_text: str) -> Optional[Dict]:
+        # 전체 응답 파싱(clean_and_parse_json)과 같은 관용 파서로 문자열 정규화 및 형식 오류 복구
+        item, repairs = parse_tolerant_json(object_text)
+        if 'truncated' in repairs or not isinstance(item, dict):
+            logger.warning("스트리밍 분석 항목 파싱 실패, 전체 응답 파싱으로 대체합니다")
+            return None
+        return item
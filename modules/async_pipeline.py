@@ -0,0 +1,92 @@
+# modules/async_pipeline.py
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Optional
+from modules.news_analyzer import NewsAnalyzer
+from modules.slack_router import SlackRouter
+from utils.config import Config, KST
+from utils.logger import setup_logger
+from utils.metrics import PipelineMetrics
+
+logger = setup_logger(__name__)
+config = Config.get_instance()
+metrics = PipelineMetrics.get_instance()
+
+
+class AsyncNewsPipeline:
+    """조회 → 클러스터링 → Claude → 슬랙 비동기 파이프라인 (NewsAnalysisScheduler.run_analysis 대안)
+
+    - DB 조회와 CPU 작업인 클러스터링/선별은 스레드 풀에서 실행
+    - 헤드라인 발송과 Claude 분석을 동시에 진행
+    - Claude는 AsyncAnthropic으로 호출하고, 슬랙은 SlackRouter 스트리밍 세션으로 발송
+      (목적지 필터, 재시도, 아웃박스는 동기 실행과 동일)
+    """
+
+    def __init__(self, analyzer: NewsAnalyzer, slack_router: SlackRouter):
+        self.analyzer = analyzer
+        self.slack_router = slack_router
+        self.executor = ThreadPoolExecutor(
+            max_workers=config.get('pipeline.workers', 2),
+            thread_name_prefix='news-pipeline'
+        )
+        # 헤드라인 → 분석 포인트 → 사용 정보 순서를 지키도록 슬랙 발송은 전용 스레드 하나에서 차례로 실행
+        self.slack_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='news-pipeline-slack')
+
+    async def run(self, now: Optional[datetime] = None) -> Dict:
+        """뉴스 분석 및 발송 실행 (run_analysis와 동일한 결과 형식, now: 분석 기준 시각)"""
+        try:
+            return await self._run(now)
+        finally:
+            # 실행마다 새 이벤트 루프를 쓰므로 이번 루프에 묶인 Claude 비동기 클라이언트를 닫고 다음 실행에서 새로 생성
+            await self.analyzer.claude_client.close_async_client()
+
+    async def _run(self, now: Optional[datetime]) -> Dict:
+        loop = asyncio.get_running_loop()
+        now = now or datetime.now(KST)
+        logger.info(f"비동기 뉴스 분석 시작: {now.strftime('%Y-%m-%d %H:%M')} KST")
+
+        # 스레드 풀 작업도 실행 스팬의 하위 스팬으로 기록되도록 현재 스팬 전달
+        prepared = await loop.run_in_executor(self.executor, metrics.propagate(self.analyzer.prepare_selection), now)
+        if not prepared:
+            logger.warning("분석할 뉴스가 없습니다.")
+            return {"status": "warning", "message": "분석할 뉴스가 없습니다."}
+
+        session = self.slack_router.stream_session()
+        slack_tasks = []
+
+        def post(send: Callable, *args) -> None:
+            # Claude 분석을 기다리지 않고 발송 스레드에 예약
+            slack_tasks.append(loop.run_in_executor(self.slack_executor, metrics.propagate(send), *args))
+
+        # 헤드라인은 입력 토큰 예산 적용 후, 분석 포인트는 완성되는 대로 발송
+        analyzed_result = await self.analyzer.claude_client.analyze_with_claude_async(
+            prepared['news_items'],
+            on_analysis=lambda analysis: post(session.send_analysis, analysis),
+            on_selected=lambda news_items: post(session.send_headlines, news_items)
+        )
+        result = self.analyzer.build_result(prepared, analyzed_result)
+
+        post(session.finish, result['usage_info'])
+        outcomes = await asyncio.gather(*slack_tasks, return_exceptions=True)
+        errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+        if errors or not outcomes[-1]:
+            error_msg = f"슬랙 메시지 전송 오류: {str(errors[0])}" if errors else "슬랙 메시지 전송 실패"
+            logger.error(error_msg)
+            return {"status": "undelivered", "message": error_msg}
+
+        if result.get('error'):
+            # 분석 없이 헤드라인만 발송된 경우 다음 실행에서 같은 뉴스를 다시 분석
+            error_msg = "Claude 분석 실패로 처리 위치를 확정하지 않았습니다."
+            logger.error(error_msg)
+            return {"status": "error", "message": error_msg}
+
+        # 발송까지 완료된 경우에만 처리 위치 확정
+        await loop.run_in_executor(self.executor, self.analyzer.data_loader.commit_watermark, result.get('watermark'))
+        await loop.run_in_executor(self.executor, self.analyzer.mark_reported, result['news_items'])
+
+        logger.info(f"비동기 뉴스 분석 완료: {result['selected_count']}개 기사 발송")
+        return {
+            "status": "success",
+            "analyzed_count": result['selected_count']
+        }
@@ -1,131 +1,276 @@
 # modules/claude_client.py
-from anthropic import Anthropic
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from fuzzywuzzy import fuzz
+from typing import Callable, List, Dict, Iterable, Optional, Tuple
+import asyncio
 import json
-import re
+import threading
 import time
 from utils.config import Config
 from utils.logger import setup_logger
-from fuzzywuzzy import fuzz
+from utils.metrics import PipelineMetrics
+from modules.news_clusterer import NewsClusterer, normalize_title
+from modules.cluster_index import ClusterIndex
+from modules.analysis_cache import AnalysisCache
+from modules.analysis_stream_parser import MarketAnalysisStreamParser
+from modules.json_repair import parse_tolerant_json
+from modules.keyword_matcher import KeywordMatcher, load_keywords
+from modules.news_selector import RankedPools
+from modules.rate_limiter import ClaudeRateLimiter
+from modules.reported_filter import ReportedFilter
+from modules.token_budget import TokenBudget, compact_whitespace, estimate_tokens
 
 logger = setup_logger(__name__)
 config = Config.get_instance()
+metrics = PipelineMetrics.get_instance()
 
 
 class ClaudeClient:
+    # 분석 프롬프트 템플릿 버전 (분석 캐시 키에 포함)
+    PROMPT_VERSION = 'v1'
+    ANALYSIS_MODES = ('single', 'sharded')
+    REPORTED_MODES = ('off', 'demote', 'skip')
+    REDUCE_MODES = ('local', 'claude')
+    # 로컬 병합 시 같은 주제로 볼 주제명 유사도 (짧은 문자열이라 제목 임계값보다 엄격하게 적용)
+    TOPIC_SIMILARITY = 80
+
     def __init__(self, api_key: str):
-        self.client = Anthropic(api_key=api_key)
+        # 요청 한도/재시도 관리 (사용 시 SDK 자체 재시도는 끔)
+        self.rate_limiter = None
+        client_options = {'api_key': api_key}
+        if config.get('claude.base_url'):
+            client_options['base_url'] = config.get('claude.base_url')
+        if config.get('claude.rate_limit_enabled', False):
+            self.rate_limiter = ClaudeRateLimiter(
+                requests_per_minute=config.get('claude.requests_per_minute', 50),
+                tokens_per_minute=config.get('claude.tokens_per_minute', 40000),
+                max_concurrency=config.get('claude.max_concurrency', 4),
+                min_concurrency=config.get('claude.min_concurrency', 1),
+                max_retries=config.get('claude.max_retries', 5),
+                backoff_base=config.get('claude.backoff_base', 1.0),
+                backoff_max=config.get('claude.backoff_max', 60.0)
+            )
+            client_options['max_retries'] = 0
+
+        # anthropic SDK는 import 비용이 커서 첫 API 호출 시 클라이언트 생성 (DB 조회를 먼저 시작)
+        self._client_options = client_options
+        self._client = None
+        self._async_client = None
+        self._client_lock = threading.Lock()
         self.model = config.get('claude.model')
         self.max_tokens = config.get('claude.max_tokens')
         self.max_news_items = config.get('claude.max_news_items')
+
+        # 요청 전 입력 토큰 추정 및 예산 초과 시 프롬프트 축약
+        self.token_budget = TokenBudget(
+            max_input_tokens=config.get('claude.max_input_tokens', 0),
+            exact=config.get('claude.exact_token_count', False),
+            client=self.client if config.get('claude.exact_token_count', False) else None,
+            model=self.model
+        )
+        self.streaming = config.get('claude.streaming', False)
         self.similarity_threshold = config.get('news.similarity_threshold', 65)
 
+        # 분석 방식 (sharded: 카테고리별 병렬 분석 후 병합)
+        self.analysis_mode = config.get('claude.analysis_mode', 'single')
+        self.shard_workers = max(1, config.get('claude.shard_workers', 4))
+        self.reduce_mode = config.get('claude.reduce_mode', 'local')
+        self.max_analysis_points = config.get('claude.max_analysis_points', 5)
+        if self.analysis_mode not in self.ANALYSIS_MODES:
+            raise ValueError(f"지원하지 않는 분석 방식입니다: {self.analysis_mode}")
+        if self.reduce_mode not in self.REDUCE_MODES:
+            raise ValueError(f"지원하지 않는 병합 방식입니다: {self.reduce_mode}")
+
+        # 분석 방식이 다르면 결과도 달라지므로 캐시 키를 분리
+        self.prompt_version = self.PROMPT_VERSION
+        if self.analysis_mode == 'sharded':
+            self.prompt_version = f"{self.PROMPT_VERSION}-sharded-{self.reduce_mode}"
+
+        clustering_engine = config.get('news.clustering_engine', 'exact')
+        cluster_index = None
+        if clustering_engine == 'incremental':
+            cluster_index = ClusterIndex(
+                config.get('news.cluster_index_path', 'data/cluster_index.json'),
+                self.similarity_threshold,
+                ttl_hours=config.get('news.cluster_index_ttl_hours', 48),
+                num_perm=config.get('news.lsh_num_perm', 64),
+                bands=config.get('news.lsh_bands', 64)
+            )
+        self.clusterer = NewsClusterer(
+            self.similarity_threshold,
+            engine=clustering_engine,
+            num_perm=config.get('news.lsh_num_perm', 64),
+            bands=config.get('news.lsh_bands', 64),
+            block_size=config.get('news.matrix_block_size', 1024),
+            verify_margin=config.get('news.matrix_verify_margin', 0),
+            cluster_index=cluster_index
+        )
+
         # 토큰당 비용 설정
         self.input_token_cost = config.get('claude.input_token_cost', 0.003)
         self.output_token_cost = config.get('claude.output_token_cost', 0.015)
 
-        # 뉴스 카테고리 키워드 정의
+        # 분석 결과 캐시 (선택)
+        self.analysis_cache = None
+        if config.get('claude.cache_enabled', False):
+            self.analysis_cache = AnalysisCache(
+                config.get('claude.cache_dir', 'data/analysis_cache'),
+                ttl_hours=config.get('claude.cache_ttl_hours', 24),
+                max_entries=config.get('claude.cache_max_entries', 200),
+                near_hit_ratio=config.get('claude.cache_near_hit_ratio', 0.0)
+            )
+
+        # 뉴스 카테고리 키워드 정의 (news.keywords_path 지정 시 파일에서 로드)
         self.keywords = {
             '시장_전반': ['금리', '환율', '증시', '코스피', '나스닥', 'ETF', '주가', '지수', '시장', '달러'],
             '기업_산업': ['실적', '투자', '계약', 'M&A', '기업', '매출', '영업이익', '사업', '합병', '인수'],
             '제도_정책': ['규제', '정책', '제도', '금융위', '감독', '개정', '법안', '법률', '시행']
         }
+        if config.get('news.keywords_path'):
+            self.keywords = load_keywords(config.get('news.keywords_path'))
+        self.keyword_matcher = KeywordMatcher(self.keywords)
+
+        # 이전 실행에서 이미 발송한 뉴스 처리 (demote: 순위 하향, skip: 선별 제외)
+        self.reported_mode = config.get('news.reported_mode', 'off')
+        if self.reported_mode not in self.REPORTED_MODES:
+            raise ValueError(f"지원하지 않는 발송 이력 처리 방식입니다: {self.reported_mode}")
+        self.reported_filter = None
+        if self.reported_mode != 'off':
+            self.reported_filter = ReportedFilter(
+                config.get('news.reported_dir', 'data/reported'),
+                capacity=config.get('news.reported_capacity', 20000),
+                error_rate=config.get('news.reported_error_rate', 0.001),
+                retention_days=config.get('news.reported_retention_days', 2)
+            )
+
+    @property
+    def client(self):
+        """동기 Anthropic 클라이언트 (첫 사용 시 생성)"""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    from anthropic import Anthropic
+                    self._client = Anthropic(**self._client_options)
+        return self._client
+
+    @property
+    def async_client(self):
+        """비동기 Anthropic 클라이언트 (첫 사용 시 생성)"""
+        if self._async_client is None:
+            with self._client_lock:
+                if self._async_client is None:
+                    from anthropic import AsyncAnthropic
+                    self._async_client = AsyncAnthropic(**self._client_options)
+        return self._async_client
+
+    async def close_async_client(self) -> None:
+        """비동기 클라이언트 종료 (연결 풀이 실행한 이벤트 루프에 묶이므로 asyncio.run마다 호출)"""
+        with self._client_lock:
+            async_client, self._async_client = self._async_client, None
+        if async_client is not None:
+            await async_client.close()
 
     def determine_category(self, title: str) -> str:
-        """뉴스 제목을 기반으로 카테고리 판별"""
-        title = title.lower()
-        for category, keywords in self.keywords.items():
-            if any(keyword in title for keyword in keywords):
-                return category
-        return '기타'
-
-    def cluster_news(self, news_list: List[Dict]) -> Dict[str, List[Dict]]:
-        """뉴스를 카테고리별로 클러스터링"""
-        clustered = {
-            '시장_전반': [],
-            '기업_산업': [],
-            '제도_정책': [],
-            '기타': []
-        }
+        """뉴스 제목을 기반으로 카테고리 판별 (키워드 일치 점수가 가장 높은 카테고리)"""
+        return self.keyword_matcher.classify(title, default='기타')
 
-        # 첫 번째 패스: 카테고리별 분류
+    def _categorize(self, news_list: Iterable[Dict]):
+        """뉴스별 카테고리를 지정하며 (카테고리, 뉴스) 순회"""
         for news in news_list:
             category = self.determine_category(news['title'])
             news['category'] = category
-            clustered[category].append(news)
-
-        # 두 번째 패스: 각 카테고리 내에서 유사도 기반 클러스터링
-        for category in clustered.keys():
-            cluster_groups = []
-            used_indices = set()
-
-            for i, news in enumerate(clustered[category]):
-                if i in used_indices:
-                    continue
-
-                current_cluster = [news]
-                for j, other_news in enumerate(clustered[category][i + 1:], start=i + 1):
-                    if j in used_indices:
-                        continue
-
-                    ratio = fuzz.token_set_ratio(news['title'], other_news['title'])
-                    if ratio >= self.similarity_threshold:
-                        current_cluster.append(other_news)
-                        used_indices.add(j)
-
-                if current_cluster:
-                    # 클러스터의 대표 뉴스 선정 (가장 긴 제목을 가진 뉴스)
-                    representative = max(current_cluster, key=lambda x: len(x['title']))
-                    representative['related_count'] = len(current_cluster) - 1
-                    cluster_groups.append(representative)
-
-            clustered[category] = cluster_groups
+            yield category, news
+
+    def cluster_news(self, news_list: Iterable[Dict]) -> Dict[str, List[Dict]]:
+        """뉴스를 카테고리별로 클러스터링 (리스트 또는 행 제너레이터 입력)"""
+        clustered = {category: [] for category in self.keywords}
+        clustered['기타'] = []
+        self.clusterer.comparisons = 0
+
+        if self.clusterer.engine == 'incremental':
+            # 행 단위로 바로 클러스터에 배정하여 대표 뉴스만 메모리에 유지 (분류와 클러스터링을 한 스팬으로 기록)
+            with metrics.span('cluster', engine=self.clusterer.engine) as span:
+                clustered.update(self.clusterer.cluster_stream(self._categorize(news_list)))
+                self.clusterer.persist()
+                span.set(comparisons=self.clusterer.comparisons,
+                         clusters=sum(len(items) for items in clustered.values()))
+        else:
+            # 첫 번째 패스: 카테고리별 분류 (스트리밍 조회 시 배치 조회 시간 포함)
+            with metrics.span('categorize') as span:
+                for category, news in self._categorize(news_list):
+                    clustered[category].append(news)
+                span.set(rows=sum(len(items) for items in clustered.values()))
+
+            # 두 번째 패스: 각 카테고리 내에서 유사도 기반 클러스터링
+            with metrics.span('cluster', engine=self.clusterer.engine) as span:
+                for category in clustered.keys():
+                    clustered[category] = self.clusterer.cluster(clustered[category], category)
+                self.clusterer.persist()
+                span.set(comparisons=self.clusterer.comparisons,
+                         clusters=sum(len(items) for items in clustered.values()))
+
+        logger.info(f"유사도 클러스터링 완료 (엔진: {self.clusterer.engine}, 비교 횟수: {self.clusterer.comparisons})")
 
         return clustered
 
-    def select_news(self, clustered_news: Dict[str, List[Dict]], min_counts: Dict[str, int]) -> List[Dict]:
-        """카테고리별 최소 요구사항을 충족하도록 뉴스 선별"""
-        selected = []
-
-        # Config에서 설정된 최대 뉴스 개수 사용
+    def _max_items(self) -> int:
+        """Config에서 설정된 최대 뉴스 개수 (최소 요구사항 10개 보장)"""
         max_items = self.max_news_items
         min_items = 10  # 최소 요구사항
 
         if max_items < min_items:
             logger.warning(f"설정된 max_news_items({max_items})가 최소 요구사항({min_items})보다 작습니다. {min_items}로 조정됩니다.")
             max_items = min_items
+        return max_items
+
+    def screen_reported(self, clustered_news: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
+        """이미 발송한 뉴스를 선별에서 제외하거나 순위 하향 표시"""
+        if self.reported_filter is None:
+            return clustered_news
+
+        screened = {}
+        reported_count = 0
+        for category, pool in clustered_news.items():
+            kept = []
+            for news in pool:
+                news['reported'] = news['title'] in self.reported_filter
+                if news['reported']:
+                    reported_count += 1
+                    if self.reported_mode == 'skip':
+                        continue
+                kept.append(news)
+            screened[category] = kept
+
+        if reported_count:
+            action = '제외' if self.reported_mode == 'skip' else '순위 하향'
+            logger.info(f"이미 발송한 뉴스 {reported_count}건 {action}")
+        return screened
+
+    def mark_reported(self, news_items: List[Dict]) -> None:
+        """발송 완료한 뉴스를 발송 이력 필터에 기록"""
+        if self.reported_filter is None:
+            return
+        try:
+            added = self.reported_filter.add(news['title'] for news in news_items)
+            logger.info(f"발송 이력 기록: {added}건")
+        except OSError as e:
+            logger.error(f"발송 이력 기록 실패: {str(e)}")
+
+    def rank_pools(self, clustered_news: Dict[str, List[Dict]], min_counts: Dict[str, int]) -> RankedPools:
+        """카테고리별 중요도 상위 뉴스 계산 (요구사항을 완화해 재선별할 때도 재사용)"""
+        clustered_news = self.screen_reported(clustered_news)
+        limit = max([self.max_news_items, 10, *min_counts.values()])
+        return RankedPools(clustered_news, self.rank_key, limit)
+
+    def select_news(self, clustered_news: Dict[str, List[Dict]], min_counts: Dict[str, int],
+                    ranked: Optional[RankedPools] = None) -> List[Dict]:
+        """카테고리별 최소 요구사항을 충족하도록 뉴스 선별"""
+        max_items = self._max_items()
+        if ranked is None:
+            ranked = self.rank_pools(clustered_news, min_counts)
 
-        # 1단계: 각 카테고리별 최소 요구사항 충족
-        for category, required in min_counts.items():
-            news_pool = clustered_news.get(category, [])
-            if not news_pool:
-                continue
-
-            # 관련 기사 수와 제목 길이로 정렬
-            sorted_news = sorted(
-                news_pool,
-                key=lambda x: (x.get('related_count', 0), len(x['title'])),
-                reverse=True
-            )
-
-            # 최소 요구사항만큼 선택
-            selected.extend(sorted_news[:required])
-
-        # 2단계: 남은 슬롯 채우기 (max_items 제한)
-        remaining_slots = max_items - len(selected)
-        if remaining_slots > 0:
-            remaining_pool = []
-            for category, news_list in clustered_news.items():
-                remaining_pool.extend([n for n in news_list if n not in selected])
-
-            # 남은 뉴스들 중에서 중요도순으로 정렬
-            additional_news = sorted(
-                remaining_pool,
-                key=lambda x: (x.get('related_count', 0), len(x['title'])),
-                reverse=True
-            )[:remaining_slots]
-
-            selected.extend(additional_news)
+        # 카테고리별 최소 요구사항을 채운 뒤 남은 슬롯을 중요도순으로 채움
+        selected = ranked.select(min_counts, max_items)
 
         logger.info(f"뉴스 선별 완료: 총 {len(selected)}개 (max_items: {max_items})")
         return selected
@@ -142,7 +287,7 @@ class ClaudeClient:
         }
 
         for news in selected_news:
-            category = news.get('category', self.determine_category(news['title']))
+            category = news.get('category') or self.determine_category(news['title'])
             if category in categories:
                 categories[category] += 1
 
@@ -154,40 +299,41 @@ class ClaudeClient:
         ])
 
     def clean_and_parse_json(self, content: str) -> Optional[Dict]:
-        """Claude 응답의 JSON 파싱 및 정제"""
-        try:
-            json_start = content.find('{')
-            json_end = content.rfind('}') + 1
-            json_content = content[json_start:json_end]
-
-            def escape_quotes_in_title(match):
-                title = match.group(1)
-                escaped_title = title.replace('"', '\\"')
-                return f'"title": "{escaped_title}"'
-
-            json_content = re.sub(r'"title":\s*"([^"]*(?:"[^"]*)*)"', escape_quotes_in_title, json_content)
-            json_content = re.sub(r'\s+', ' ', json_content)
-            json_content = json_content.replace('…', '...')
-            json_content = json_content.replace('···', '...')
-            json_content = json_content.replace('&amp;', '&')
-
-            return json.loads(json_content)
-
-        except Exception as e:
-            logger.error(f"JSON 파싱 오류: {str(e)}")
+        """Claude 응답의 JSON 파싱 및 정제 (형식 오류는 관용 파서로 복구)"""
+        parsed, repairs = parse_tolerant_json(content)
+        if not isinstance(parsed, dict):
+            logger.error("JSON 파싱 오류: 응답에서 JSON 객체를 찾지 못했습니다.")
             return None
 
-    def analyze_with_claude(self, selected_news: List[Dict]) -> Dict:
-        """선별된 뉴스에 대한 Claude의 시장 영향도 분석"""
-        titles_text = "\n".join([
-            f"- {news['news_id']}|||{news['title']}"
-            for news in selected_news
-        ])
+        if repairs:
+            logger.warning(f"응답 JSON 형식 오류 복구: {', '.join(sorted(repairs))}")
+
+        # 완성된 분석 항목만 유지
+        market_analysis = parsed.get('market_analysis')
+        if isinstance(market_analysis, list):
+            parsed['market_analysis'] = [item for item in market_analysis if isinstance(item, dict)]
+        return parsed
+
+    def build_prompt(self, selected_news: List[Dict], point_range: str = '3-5', compact: bool = False) -> str:
+        """선별된 뉴스로 시장 영향도 분석 프롬프트 생성 (변경 시 PROMPT_VERSION 갱신)
+
+        compact=True이면 공백을 정리하고 news_id 대신 짧은 순번을 사용한다.
+        """
+        if compact:
+            titles_text = "\n".join([
+                f"- {idx}|{news['title']}"
+                for idx, news in enumerate(selected_news, 1)
+            ])
+        else:
+            titles_text = "\n".join([
+                f"- {news['news_id']}|||{news['title']}"
+                for news in selected_news
+            ])
 
         prompt = f"""다음은 선별된 주요 뉴스 목록입니다. 시장 영향도를 분석해주세요.
 
         [시장 영향도 분석]
-        선별된 뉴스들을 종합적으로 분석하여 3-5개의 주요 시장 영향 포인트를 도출해주세요.
+        선별된 뉴스들을 종합적으로 분석하여 {point_range}개의 주요 시장 영향 포인트를 도출해주세요.
         각 포인트별로 다음 내용을 포함해주세요:
         - 주제 (예: 환율 리스크, 반도체 업황 등)
         - 시장 영향 (Positive/Negative/Neutral)
@@ -212,63 +358,559 @@ class ClaudeClient:
                 }}
             ]
         }}"""
+        return compact_whitespace(prompt) if compact else prompt
+
+    def build_reduce_prompt(self, points: List[Dict]) -> str:
+        """카테고리별 분석 포인트를 하나의 분석으로 병합하는 프롬프트 생성"""
+        points_text = json.dumps(points, ensure_ascii=False)
+
+        return f"""다음은 뉴스 카테고리별로 따로 도출한 시장 영향 분석 포인트입니다.
+        중복되거나 겹치는 주제는 하나로 합치고, 시장 영향력이 큰 순서로 최대 {self.max_analysis_points}개의 포인트를 남겨주세요.
+        각 포인트의 형식은 그대로 유지해주세요.
+
+        분석 포인트:
+        {points_text}
+
+        JSON 형식으로 다음과 같이 응답해주세요:
+        {{
+            "market_analysis": [
+                {{
+                    "topic": "분석 주제",
+                    "impact": "Positive/Negative/Neutral",
+                    "score": 영향력 점수(-5 ~ +5),
+                    "affected_sectors": ["영향 받을 섹터/종목 목록"],
+                    "duration": "단기/중기/장기",
+                    "analysis": "상세 분석 내용"
+                }}
+            ]
+        }}"""
 
+    def build_usage_info(self, input_tokens: int, output_tokens: int, api_time: float,
+                         stats_before: Optional[Tuple[int, int, int]] = None) -> Dict:
+        """토큰 사용량 및 비용 정보 생성 (stats_before: 분석 시작 시점의 _stats_snapshot())"""
+        usage_info = {
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
+            'total_tokens': input_tokens + output_tokens,
+            'api_time': round(api_time, 2)
+        }
+        usage_info['cost_usd'] = round(
+            (usage_info['input_tokens'] * self.input_token_cost +
+             usage_info['output_tokens'] * self.output_token_cost) / 1000,
+            4
+        )
+
+        if stats_before is not None:
+            retries, projected, trimmed = (
+                now - before for now, before in zip(self._stats_snapshot(), stats_before)
+            )
+            # 요청 전 예상한 입력 토큰/비용 (출력 토큰은 응답 전에 알 수 없어 입력 기준)
+            usage_info['projected_input_tokens'] = projected
+            usage_info['projected_cost_usd'] = round(projected * self.input_token_cost / 1000, 4)
+            if trimmed:
+                usage_info['trimmed_items'] = trimmed
+            if self.rate_limiter:
+                usage_info['retries'] = retries
+
+        logger.info(f"API 사용량: {usage_info['total_tokens']} tokens")
+        logger.info(f"API 호출 시간: {usage_info['api_time']}초")
+        logger.info(f"API 사용 비용: ${usage_info['cost_usd']}")
+        return usage_info
+
+    @staticmethod
+    def _record_usage(span, usage_info: Dict) -> None:
+        """Claude 스팬에 토큰/비용/재시도 횟수 기록"""
+        span.set(**{key: usage_info[key] for key in ('input_tokens', 'output_tokens', 'cost_usd', 'retries')
+                    if key in usage_info})
+
+    @staticmethod
+    def _emit(callback: Optional[Callable], items: List[Dict]) -> None:
+        """분석 항목 콜백 호출 (콜백 오류가 분석을 중단시키지 않도록 격리)"""
+        if not callback:
+            return
+        for item in items:
+            try:
+                callback(item)
+            except Exception as e:
+                logger.error(f"분석 항목 콜백 처리 중 오류 발생: {str(e)}")
+
+    def _stats_snapshot(self) -> Tuple[int, int, int]:
+        """재시도 횟수/예상 입력 토큰/제외 뉴스 수 누적값 (분석 전후 차이로 이번 분석 값 계산)"""
+        return (
+            self.rate_limiter.retries if self.rate_limiter else 0,
+            self.token_budget.projected_tokens,
+            self.token_budget.trimmed
+        )
+
+    def rank_key(self, news: Dict) -> tuple:
+        """뉴스 중요도 정렬 키 (미발송 우선, 관련 기사 수, 제목 길이)"""
+        return not news.get('reported', False), news.get('related_count', 0), len(news['title'])
+
+    def budget_prompt(self, news_items: List[Dict], point_range: str = '3-5') -> Tuple[str, List[Dict]]:
+        """입력 토큰 예산에 맞춘 (분석 프롬프트, 프롬프트에 포함된 뉴스 목록) 생성"""
+        with metrics.span('prompt_build', news=len(news_items)) as span:
+            prompt, fitted = self.token_budget.fit(
+                news_items,
+                lambda items, compact: self.build_prompt(items, point_range, compact),
+                self.rank_key
+            )
+            span.set(prompt_chars=len(prompt))
+        return prompt, fitted
+
+    @staticmethod
+    def _fitted_selection(selected_news: List[Dict], budgeted: Iterable[Tuple[str, List[Dict]]]) -> List[Dict]:
+        """예산 조정 후 프롬프트에 포함된 뉴스만 선별 순서대로 반환"""
+        included = {id(news) for _, news_items in budgeted for news in news_items}
+        return [news for news in selected_news if id(news) in included]
+
+    @staticmethod
+    def _notify_selected(on_selected: Optional[Callable], news_items: List[Dict]) -> None:
+        """분석 대상 확정 콜백 호출 (콜백 오류가 분석을 중단시키지 않도록 격리)"""
+        if not on_selected:
+            return
         try:
-            start_time = time.time()
+            on_selected(news_items)
+        except Exception as e:
+            logger.error(f"선별 결과 콜백 처리 중 오류 발생: {str(e)}")
+
+    async def budget_prompt_async(self, news_items: List[Dict],
+                                  point_range: str = '3-5') -> Tuple[str, List[Dict]]:
+        """budget_prompt의 비동기 버전 (정확한 토큰 카운트는 API 호출이므로 스레드에서 실행)"""
+        if self.token_budget.exact:
+            return await asyncio.to_thread(self.budget_prompt, news_items, point_range)
+        return self.budget_prompt(news_items, point_range)
+
+    def _call(self, request: Callable, prompt: str):
+        """요청 한도/재시도 정책을 적용해 (결과, usage)를 반환하는 request() 실행"""
+        if not self.rate_limiter:
+            return request()
+        estimated = estimate_tokens(prompt)
+        result = self.rate_limiter.call(request, estimated)
+        self.rate_limiter.settle(estimated, result[1].input_tokens + result[1].output_tokens)
+        return result
+
+    async def _call_async(self, request: Callable, prompt: str):
+        """_call의 비동기 버전"""
+        if not self.rate_limiter:
+            return await request()
+        estimated = estimate_tokens(prompt)
+        result = await self.rate_limiter.call_async(request, estimated)
+        self.rate_limiter.settle(estimated, result[1].input_tokens + result[1].output_tokens)
+        return result
+
+    def _emit_new(self, callback: Optional[Callable], parser: MarketAnalysisStreamParser,
+                  items: List[Dict], emitted: int) -> int:
+        """새로 완성된 항목 중 아직 전달하지 않은 항목만 콜백으로 전달 (재시도 시 중복 방지)"""
+        start = len(parser.items) - len(items)
+        self._emit(callback, items[max(0, emitted - start):])
+        return max(emitted, len(parser.items))
+
+    def _create(self, prompt: str):
+        def request():
             response = self.client.messages.create(
                 model=self.model,
                 max_tokens=self.max_tokens,
                 messages=[{"role": "user", "content": prompt}]
             )
-            end_time = time.time()
+            return response.content[0].text.strip(), response.usage
 
-            usage_info = {
-                'input_tokens': response.usage.input_tokens,
-                'output_tokens': response.usage.output_tokens,
-                'total_tokens': response.usage.input_tokens + response.usage.output_tokens,
-                'api_time': round(end_time - start_time, 2)
-            }
-            usage_info['cost_usd'] = round(
-                (usage_info['input_tokens'] * self.input_token_cost +
-                 usage_info['output_tokens'] * self.output_token_cost) / 1000,
-                4
+        return self._call(request, prompt)
+
+    async def _create_async(self, prompt: str):
+        async def request():
+            response = await self.async_client.messages.create(
+                model=self.model,
+                max_tokens=self.max_tokens,
+                messages=[{"role": "user", "content": prompt}]
             )
+            return response.content[0].text.strip(), response.usage
+
+        return await self._call_async(request, prompt)
+
+    def _request_streaming(self, prompt: str, on_analysis: Optional[Callable] = None):
+        """스트리밍으로 응답을 받으며 완성된 분석 항목을 즉시 콜백으로 전달"""
+        emitted = 0
+
+        def request():
+            nonlocal emitted
+            parser = MarketAnalysisStreamParser()
+            with self.client.messages.stream(
+                model=self.model,
+                max_tokens=self.max_tokens,
+                messages=[{"role": "user", "content": prompt}]
+            ) as stream:
+                for text in stream.text_stream:
+                    emitted = self._emit_new(on_analysis, parser, parser.feed(text), emitted)
+                message = stream.get_final_message()
+            return parser, message.usage
+
+        return self._call(request, prompt)
+
+    async def _request_streaming_async(self, prompt: str, on_analysis: Optional[Callable] = None):
+        """_request_streaming의 비동기 버전"""
+        emitted = 0
+
+        async def request():
+            nonlocal emitted
+            parser = MarketAnalysisStreamParser()
+            async with self.async_client.messages.stream(
+                model=self.model,
+                max_tokens=self.max_tokens,
+                messages=[{"role": "user", "content": prompt}]
+            ) as stream:
+                async for text in stream.text_stream:
+                    emitted = self._emit_new(on_analysis, parser, parser.feed(text), emitted)
+                message = await stream.get_final_message()
+            return parser, message.usage
 
-            logger.info(f"API 사용량: {usage_info['total_tokens']} tokens")
-            logger.info(f"API 호출 시간: {usage_info['api_time']}초")
-            logger.info(f"API 사용 비용: ${usage_info['cost_usd']}")
+        return await self._call_async(request, prompt)
 
-            content = response.content[0].text.strip()
+    def _cached_result(self, news_items: List[Dict], on_selected: Optional[Callable] = None,
+                       on_analysis: Optional[Callable] = None) -> Optional[Dict]:
+        if not self.analysis_cache:
+            return None
+        cached = self.analysis_cache.get(self.model, self.prompt_version, [news['news_id'] for news in news_items])
+        if cached:
+            self._notify_selected(on_selected, news_items)
+            self._emit(on_analysis, cached['market_analysis'])
+            cached['news_items'] = news_items
+        return cached
+
+    def _finalize_analysis(self, content: str, usage, api_time: float, streamed: List[Dict],
+                           news_ids: List, on_analysis: Optional[Callable] = None,
+                           stats_before: Optional[Tuple[int, int, int]] = None) -> Dict:
+        """응답 본문과 사용량으로 분석 결과 구성 (캐시 저장 포함)"""
+        usage_info = self.build_usage_info(usage.input_tokens, usage.output_tokens, api_time, stats_before)
+
+        # 스트리밍 파서는 내부 따옴표 오류 등으로 항목을 놓칠 수 있으므로 항상 전체 응답을 파싱해 기준으로 사용
+        with metrics.span('parse', response_chars=len(content)):
             parsed_response = self.clean_and_parse_json(content)
+        market_analysis = parsed_response.get('market_analysis', []) if parsed_response else []
+
+        if streamed:
+            # 스트리밍 중 추출하지 못한 항목만 추가로 전달
+            missed = [item for item in market_analysis if item not in streamed]
+            if missed:
+                logger.warning(f"스트리밍 중 추출하지 못한 분석 항목 {len(missed)}개를 전체 응답에서 복구했습니다")
+                self._emit(on_analysis, missed)
+            if not market_analysis:
+                market_analysis = streamed
+        elif not parsed_response:
+            return {'market_analysis': [], 'usage_info': usage_info, 'error': True}
+        else:
+            self._emit(on_analysis, market_analysis)
+
+        if self.analysis_cache and market_analysis:
+            self.analysis_cache.put(self.model, self.prompt_version, news_ids, market_analysis, usage_info)
+
+        return {
+            'market_analysis': market_analysis,
+            'usage_info': usage_info
+        }
 
-            if not parsed_response:
-                return {'market_analysis': [], 'usage_info': usage_info}
+    def analyze_with_claude(self, selected_news: List[Dict], on_analysis: Optional[Callable] = None,
+                            on_selected: Optional[Callable] = None) -> Dict:
+        """선별된 뉴스에 대한 Claude의 시장 영향도 분석
 
-            return {
-                'market_analysis': parsed_response.get('market_analysis', []),
-                'usage_info': usage_info
-            }
+        입력 토큰 예산으로 제외된 뉴스를 뺀 분석 대상을 결과의 news_items로 반환하며,
+        on_selected가 주어지면 분석 요청 전에 같은 목록으로 한 번 호출된다.
+        on_analysis가 주어지면 분석 항목마다 한 번씩 호출된다.
+        스트리밍 모드에서는 항목이 생성되는 즉시, 그 외에는 응답 파싱 후 호출된다.
+        API 호출이나 응답 파싱에 실패하면 결과의 error가 True로 설정된다.
+        """
+        if self.analysis_mode == 'sharded':
+            return self._analyze_sharded(selected_news, on_analysis, on_selected)
+
+        try:
+            stats_before = self._stats_snapshot()
+            prompt, fitted = self.budget_prompt(selected_news)
+            cached = self._cached_result(fitted, on_selected, on_analysis)
+            if cached:
+                return cached
+            self._notify_selected(on_selected, fitted)
+
+            news_ids = [news['news_id'] for news in fitted]
+            with metrics.span('claude', model=self.model, streaming=self.streaming) as span:
+                start_time = time.time()
+                streamed = []
+                if self.streaming:
+                    parser, usage = self._request_streaming(prompt, on_analysis)
+                    content, streamed = parser.text.strip(), parser.items
+                else:
+                    content, usage = self._create(prompt)
+                end_time = time.time()
+
+            result = self._finalize_analysis(content, usage, end_time - start_time, streamed, news_ids,
+                                             on_analysis, stats_before)
+            self._record_usage(span, result['usage_info'])
+            result['news_items'] = fitted
+            return result
 
         except Exception as e:
             logger.error(f"Claude API 호출 중 오류 발생: {str(e)}")
-            return {'market_analysis': [], 'usage_info': {}}
+            return {'market_analysis': [], 'usage_info': {}, 'error': True}
+
+    async def analyze_with_claude_async(self, selected_news: List[Dict], on_analysis: Optional[Callable] = None,
+                                        on_selected: Optional[Callable] = None) -> Dict:
+        """analyze_with_claude의 비동기 버전 (AsyncAnthropic 클라이언트 사용)"""
+        if self.analysis_mode == 'sharded':
+            return await self._analyze_sharded_async(selected_news, on_analysis, on_selected)
 
-    def analyze_news(self, news_list: List[Dict]) -> Dict:
-        """메인 분석 프로세스"""
         try:
-            # 1. 뉴스 클러스터링
-            clustered = self.cluster_news(news_list)
-            logger.info(f"카테고리별 클러스터링 완료: {{k: len(v) for k, v in clustered.items()}}")
-
-            # 2. 카테고리별 최소 요구사항 설정
-            min_counts = {
-                '시장_전반': 4,
-                '기업_산업': 3,
-                '제도_정책': 3
-            }
+            stats_before = self._stats_snapshot()
+            prompt, fitted = await self.budget_prompt_async(selected_news)
+            cached = self._cached_result(fitted, on_selected, on_analysis)
+            if cached:
+                return cached
+            self._notify_selected(on_selected, fitted)
+
+            news_ids = [news['news_id'] for news in fitted]
+            with metrics.span('claude', model=self.model, streaming=self.streaming) as span:
+                start_time = time.time()
+                streamed = []
+                if self.streaming:
+                    parser, usage = await self._request_streaming_async(prompt, on_analysis)
+                    content, streamed = parser.text.strip(), parser.items
+                else:
+                    content, usage = await self._create_async(prompt)
+                end_time = time.time()
+
+            result = self._finalize_analysis(content, usage, end_time - start_time, streamed, news_ids,
+                                             on_analysis, stats_before)
+            self._record_usage(span, result['usage_info'])
+            result['news_items'] = fitted
+            return result
+
+        except Exception as e:
+            logger.error(f"Claude API 호출 중 오류 발생: {str(e)}")
+            return {'market_analysis': [], 'usage_info': {}, 'error': True}
+
+    def shard_news(self, selected_news: List[Dict]) -> Dict[str, List[Dict]]:
+        """선별된 뉴스를 카테고리별 샤드로 분할 (선별 순서 유지)"""
+        shards = {}
+        for news in selected_news:
+            category = news.get('category') or self.determine_category(news['title'])
+            shards.setdefault(category, []).append(news)
+        return shards
+
+    def _parse_points(self, content: str) -> List[Dict]:
+        with metrics.span('parse', response_chars=len(content)):
+            parsed_response = self.clean_and_parse_json(content)
+        if not parsed_response:
+            return []
+        return parsed_response.get('market_analysis', [])
+
+    @staticmethod
+    def _point_score(point: Dict) -> float:
+        try:
+            return abs(float(point.get('score', 0)))
+        except (TypeError, ValueError):
+            return 0.0
+
+    def merge_points(self, points: List[Dict]) -> List[Dict]:
+        """샤드별 분석 포인트를 주제 유사도로 중복 제거 후 영향력 절대값 순으로 정렬"""
+        merged = []
+        for point in sorted(points, key=self._point_score, reverse=True):
+            topic = normalize_title(str(point.get('topic', '')))
+            duplicate = next(
+                (kept for kept in merged
+                 if fuzz.ratio(topic, normalize_title(str(kept.get('topic', '')))) >= self.TOPIC_SIMILARITY),
+                None
+            )
+            if duplicate is None:
+                merged.append(dict(point))
+                continue
+
+            # 점수가 더 큰 포인트를 남기고 영향 섹터만 합침
+            sectors = duplicate.get('affected_sectors') or []
+            for sector in point.get('affected_sectors') or []:
+                if sector not in sectors:
+                    sectors.append(sector)
+            duplicate['affected_sectors'] = sectors
+
+        return merged[:self.max_analysis_points]
+
+    def _sharded_result(self, points: List[Dict], usages: List, api_time: float, shard_count: int,
+                        news_ids: List, on_analysis: Optional[Callable] = None,
+                        stats_before: Optional[Tuple[int, int, int]] = None) -> Dict:
+        """샤드/병합 호출 사용량을 합산해 분석 결과 구성 (캐시 저장 포함)"""
+        usage_info = self.build_usage_info(
+            sum(usage.input_tokens for usage in usages),
+            sum(usage.output_tokens for usage in usages),
+            api_time,
+            stats_before
+        )
+        usage_info['shards'] = shard_count
+        self._emit(on_analysis, points)
+
+        if self.analysis_cache and points:
+            self.analysis_cache.put(self.model, self.prompt_version, news_ids, points, usage_info)
+
+        return {
+            'market_analysis': points,
+            'usage_info': usage_info
+        }
+
+    def _request_points(self, prompt: str) -> Tuple[List[Dict], object]:
+        content, usage = self._create(prompt)
+        return self._parse_points(content), usage
+
+    def _analyze_shard(self, category: str, prompt: str, shard: List[Dict]) -> Tuple[List[Dict], Optional[object]]:
+        try:
+            points, usage = self._request_points(prompt)
+            logger.info(f"샤드 분석 완료 ({category}): {len(shard)}개 뉴스, {len(points)}개 포인트")
+            return points, usage
+        except Exception as e:
+            logger.error(f"샤드 분석 중 오류 발생 ({category}): {str(e)}")
+            return [], None
+
+    def _reduce(self, points: List[Dict]) -> Tuple[List[Dict], List]:
+        """샤드 결과 병합 (claude 병합 실패 시 로컬 병합으로 대체)"""
+        if self.reduce_mode == 'claude' and len(points) > 1:
+            try:
+                prompt = self.build_reduce_prompt(points)
+                self.token_budget.project(prompt)
+                reduced, usage = self._request_points(prompt)
+                if reduced:
+                    return reduced[:self.max_analysis_points], [usage]
+                logger.warning("병합 응답을 파싱하지 못해 로컬 병합으로 대체합니다.")
+            except Exception as e:
+                logger.error(f"병합 호출 중 오류 발생, 로컬 병합으로 대체합니다: {str(e)}")
+        return self.merge_points(points), []
+
+    def _analyze_sharded(self, selected_news: List[Dict], on_analysis: Optional[Callable] = None,
+                         on_selected: Optional[Callable] = None) -> Dict:
+        """카테고리별 샤드를 병렬로 분석한 뒤 결과 병합 (map-reduce)"""
+        shards = self.shard_news(selected_news)
+        if not shards:
+            return {'market_analysis': [], 'usage_info': {}}
+
+        stats_before = self._stats_snapshot()
+        workers = min(self.shard_workers, len(shards))
+        # 샤드별 예산 조정을 먼저 마쳐 분석 대상(캐시 키, 헤드라인)을 확정
+        budget = metrics.propagate(lambda shard: self.budget_prompt(shard, point_range='1-3'))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            budgeted = dict(zip(shards, executor.map(budget, shards.values())))
+        fitted = self._fitted_selection(selected_news, budgeted.values())
+        cached = self._cached_result(fitted, on_selected, on_analysis)
+        if cached:
+            return cached
+        self._notify_selected(on_selected, fitted)
+
+        with metrics.span('claude', model=self.model, shards=len(shards)) as span:
+            start_time = time.time()
+            analyze_shard = metrics.propagate(lambda item: self._analyze_shard(item[0], *item[1]))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(analyze_shard, budgeted.items()))
+
+            points = [point for shard_points, _ in results for point in shard_points]
+            usages = [usage for _, usage in results if usage is not None]
+            if not usages:
+                # 모든 샤드 호출이 실패한 경우
+                return {'market_analysis': [], 'usage_info': {}, 'news_items': fitted, 'error': True}
+
+            reduced, reduce_usages = self._reduce(points)
+            api_time = time.time() - start_time
+
+        result = self._sharded_result(reduced, usages + reduce_usages, api_time, len(shards),
+                                      [news['news_id'] for news in fitted], on_analysis, stats_before)
+        self._record_usage(span, result['usage_info'])
+        result['news_items'] = fitted
+        return result
+
+    async def _request_points_async(self, prompt: str) -> Tuple[List[Dict], object]:
+        content, usage = await self._create_async(prompt)
+        return self._parse_points(content), usage
+
+    async def _budget_shard_async(self, shard: List[Dict], semaphore: asyncio.Semaphore) -> Tuple[str, List[Dict]]:
+        async with semaphore:
+            return await self.budget_prompt_async(shard, point_range='1-3')
+
+    async def _analyze_shard_async(self, category: str, prompt: str, shard: List[Dict],
+                                   semaphore: asyncio.Semaphore) -> Tuple[List[Dict], Optional[object]]:
+        async with semaphore:
+            try:
+                points, usage = await self._request_points_async(prompt)
+                logger.info(f"샤드 분석 완료 ({category}): {len(shard)}개 뉴스, {len(points)}개 포인트")
+                return points, usage
+            except Exception as e:
+                logger.error(f"샤드 분석 중 오류 발생 ({category}): {str(e)}")
+                return [], None
+
+    async def _reduce_async(self, points: List[Dict]) -> Tuple[List[Dict], List]:
+        if self.reduce_mode == 'claude' and len(points) > 1:
+            try:
+                prompt = self.build_reduce_prompt(points)
+                if self.token_budget.exact:
+                    await asyncio.to_thread(self.token_budget.project, prompt)
+                else:
+                    self.token_budget.project(prompt)
+                reduced, usage = await self._request_points_async(prompt)
+                if reduced:
+                    return reduced[:self.max_analysis_points], [usage]
+                logger.warning("병합 응답을 파싱하지 못해 로컬 병합으로 대체합니다.")
+            except Exception as e:
+                logger.error(f"병합 호출 중 오류 발생, 로컬 병합으로 대체합니다: {str(e)}")
+        return self.merge_points(points), []
+
+    async def _analyze_sharded_async(self, selected_news: List[Dict], on_analysis: Optional[Callable] = None,
+                                     on_selected: Optional[Callable] = None) -> Dict:
+        """_analyze_sharded의 비동기 버전"""
+        shards = self.shard_news(selected_news)
+        if not shards:
+            return {'market_analysis': [], 'usage_info': {}}
+
+        stats_before = self._stats_snapshot()
+        semaphore = asyncio.Semaphore(self.shard_workers)
+        # 샤드별 예산 조정을 먼저 마쳐 분석 대상(캐시 키, 헤드라인)을 확정
+        budgeted = dict(zip(shards, await asyncio.gather(*(
+            self._budget_shard_async(shard, semaphore) for shard in shards.values()
+        ))))
+        fitted = self._fitted_selection(selected_news, budgeted.values())
+        cached = self._cached_result(fitted, on_selected, on_analysis)
+        if cached:
+            return cached
+        self._notify_selected(on_selected, fitted)
+
+        with metrics.span('claude', model=self.model, shards=len(shards)) as span:
+            start_time = time.time()
+            results = await asyncio.gather(*(
+                self._analyze_shard_async(category, prompt, shard, semaphore)
+                for category, (prompt, shard) in budgeted.items()
+            ))
+
+            points = [point for shard_points, _ in results for point in shard_points]
+            usages = [usage for _, usage in results if usage is not None]
+            if not usages:
+                # 모든 샤드 호출이 실패한 경우
+                return {'market_analysis': [], 'usage_info': {}, 'news_items': fitted, 'error': True}
+
+            reduced, reduce_usages = await self._reduce_async(points)
+            api_time = time.time() - start_time
+
+        result = self._sharded_result(reduced, usages + reduce_usages, api_time, len(shards),
+                                      [news['news_id'] for news in fitted], on_analysis, stats_before)
+        self._record_usage(span, result['usage_info'])
+        result['news_items'] = fitted
+        return result
+
+    def cluster_and_select(self, news_list: Iterable[Dict]) -> List[Dict]:
+        """클러스터링 후 카테고리별 요구사항에 맞춰 분석 대상 뉴스 선별"""
+        # 1. 뉴스 클러스터링
+        clustered = self.cluster_news(news_list)
+        logger.info(f"카테고리별 클러스터링 완료: {{k: len(v) for k, v in clustered.items()}}")
+
+        # 2. 카테고리별 최소 요구사항 설정
+        min_counts = {
+            '시장_전반': 4,
+            '기업_산업': 3,
+            '제도_정책': 3
+        }
 
-            # 3. 뉴스 선별
-            selected = self.select_news(clustered, min_counts)
+        with metrics.span('select') as span:
+            # 3. 뉴스 선별 (카테고리별 순위는 한 번만 계산해 재시도에도 사용)
+            ranked = self.rank_pools(clustered, min_counts)
+            selected = self.select_news(clustered, min_counts, ranked)
             logger.info(f"1차 선별 완료: {len(selected)}개 뉴스")
 
             # 4. 선별 결과 검증
@@ -276,16 +918,27 @@ class ClaudeClient:
                 logger.warning("선별된 뉴스가 요구사항을 충족하지 못함")
                 # 검증 실패시 카테고리 요구사항을 조정하여 재시도
                 min_counts = {k: max(v - 1, 2) for k, v in min_counts.items()}
-                selected = self.select_news(clustered, min_counts)
+                selected = self.select_news(clustered, min_counts, ranked)
+            span.set(selected=len(selected))
 
-            # 5. Claude API 호출 및 분석
-            analysis_result = self.analyze_with_claude(selected)
+        return selected
+
+    def analyze_news(self, news_list: Iterable[Dict], on_selected: Optional[Callable] = None,
+                     on_analysis: Optional[Callable] = None) -> Dict:
+        """메인 분석 프로세스 (on_selected: 선별 완료 시, on_analysis: 분석 항목마다 호출)"""
+        try:
+            selected = self.cluster_and_select(news_list)
+
+            # 5. Claude API 호출 및 분석 (입력 토큰 예산으로 제외된 뉴스는 분석 대상에서 빠짐)
+            analysis_result = self.analyze_with_claude(selected, on_analysis, on_selected)
+            selected = analysis_result.get('news_items', selected)
 
             logger.info(f"뉴스 분석 완료: {len(selected)}개 선별")
             return {
                 'news_items': selected,
                 'market_analysis': analysis_result.get('market_analysis', []),
-                'usage_info': analysis_result.get('usage_info', {})
+                'usage_info': analysis_result.get('usage_info', {}),
+                'error': analysis_result.get('error', False)
             }
 
         except Exception as e:
@@ -293,5 +946,6 @@ class ClaudeClient:
             return {
                 'news_items': [],
                 'market_analysis': [],
-                'usage_info': {}
-            }
\ No newline at end of file
+                'usage_info': {},
+                'error': True
+            }
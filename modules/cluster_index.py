@@ -0,0 +1,130 @@
+# modules/cluster_index.py
+import json
+import os
+import time
+from typing import Dict, Optional
+from fuzzywuzzy import fuzz
+from modules.news_clusterer import MinHasher, LSHIndex, title_shingles
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class ClusterIndex:
+    """실행 간 유지되는 뉴스 클러스터 인덱스 (로컬 JSON 파일)
+
+    클러스터마다 최초 제목(seed)과 MinHash 시그니처를 저장하고,
+    새 뉴스는 같은 카테고리의 LSH 후보 클러스터와만 비교한다.
+    마지막으로 새 뉴스가 합류한 지 ttl_hours가 지난 클러스터는 제거된다.
+    (조회 구간이 겹쳐 이미 배정된 뉴스를 다시 읽는 것은 갱신으로 보지 않는다)
+    """
+
+    def __init__(self, path: str, similarity_threshold: int, ttl_hours: int = 48,
+                 num_perm: int = 64, bands: int = 64):
+        self.path = path
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_hours * 3600
+        self.num_perm = num_perm
+        self.bands = bands
+        self.minhasher = MinHasher(num_perm)
+
+        self.clusters: Dict[str, Dict] = {}
+        self.news_to_cluster: Dict[str, str] = {}
+        self.lsh_by_category: Dict[str, LSHIndex] = {}
+        self.next_id = 1
+        self.comparisons = 0
+
+        self.load()
+
+    def load(self) -> None:
+        """인덱스 파일 로드 후 만료 클러스터 제거"""
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.clusters = data.get('clusters', {})
+                self.next_id = data.get('next_id', 1)
+            except (OSError, ValueError) as e:
+                logger.error(f"클러스터 인덱스 로드 실패, 새 인덱스로 시작합니다: {str(e)}")
+                self.clusters = {}
+
+        self.evict()
+        logger.info(f"클러스터 인덱스 로드 완료: {len(self.clusters)}개 클러스터")
+
+    def save(self) -> None:
+        """인덱스 파일 저장 (임시 파일 작성 후 교체)"""
+        self.evict()
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'next_id': self.next_id, 'clusters': self.clusters}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def evict(self, now: Optional[float] = None) -> None:
+        """ttl을 초과한 클러스터 제거 및 검색 인덱스 재구성"""
+        now = now or time.time()
+        expired = [
+            cluster_id for cluster_id, cluster in self.clusters.items()
+            if now - cluster['last_seen'] > self.ttl_seconds
+        ]
+        for cluster_id in expired:
+            del self.clusters[cluster_id]
+
+        if expired:
+            logger.info(f"만료된 클러스터 {len(expired)}개 제거")
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        self.news_to_cluster = {}
+        self.lsh_by_category = {}
+        for cluster_id, cluster in self.clusters.items():
+            for news_id in cluster['news_ids']:
+                self.news_to_cluster[news_id] = cluster_id
+            self._lsh(cluster['category']).insert(cluster_id, tuple(cluster['signature']))
+
+    def _lsh(self, category: str) -> LSHIndex:
+        if category not in self.lsh_by_category:
+            self.lsh_by_category[category] = LSHIndex(self.num_perm, self.bands)
+        return self.lsh_by_category[category]
+
+    def assign(self, news: Dict, category: str, now: Optional[float] = None) -> str:
+        """뉴스를 기존 클러스터에 배정하거나 새 클러스터 생성 후 클러스터 ID 반환"""
+        now = now or time.time()
+        news_id = str(news['news_id'])
+
+        # 이전 실행에서 이미 배정된 뉴스는 비교 없이 바로 반환 (만료 시각은 연장하지 않음)
+        cluster_id = self.news_to_cluster.get(news_id)
+        if cluster_id is not None:
+            return cluster_id
+
+        signature = self.minhasher.signature(title_shingles(news['title']))
+        lsh = self._lsh(category)
+
+        best_id, best_ratio = None, -1
+        for candidate_id in lsh.query(signature):
+            self.comparisons += 1
+            ratio = fuzz.token_set_ratio(news['title'], self.clusters[candidate_id]['title'])
+            if ratio >= self.similarity_threshold and ratio > best_ratio:
+                best_id, best_ratio = candidate_id, ratio
+
+        if best_id is None:
+            best_id = str(self.next_id)
+            self.next_id += 1
+            self.clusters[best_id] = {
+                'category': category,
+                'title': news['title'],
+                'signature': list(signature),
+                'news_ids': [],
+                'first_seen': now,
+                'last_seen': now
+            }
+            lsh.insert(best_id, signature)
+
+        cluster = self.clusters[best_id]
+        cluster['news_ids'].append(news_id)
+        cluster['last_seen'] = now
+        self.news_to_cluster[news_id] = best_id
+        return best_id
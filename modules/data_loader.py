@@ -1,8 +1,9 @@
 # modules/data_loader.py
-from typing import Dict, Optional, Any
-from datetime import datetime
+from typing import Dict, Optional, Any, Tuple
+from datetime import datetime, timedelta
 import pytz
 from modules.mysql_connector import MySQLConnector
+from modules.watermark_store import WatermarkStore
 from utils.config import Config
 from utils.logger import setup_logger
 
@@ -17,11 +18,63 @@ class NewsDataLoader:
         "15:10": {"start": "08:30", "end": "15:00"},  # 당일 12:00 - 15:00
     }
 
+    # create_at 인덱스 범위 스캔이 가능하도록 컬럼을 함수로 감싸지 않은 반열린 구간 조건 사용
+    PERIOD_QUERY = """
+    SELECT news_id, title, section, link, pub_time, create_at
+    FROM news
+    WHERE create_at >= %s AND create_at < %s
+    ORDER BY create_at
+    """
+    DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+    # 워터마크 이후 뉴스만 조회하는 키셋 쿼리 ((create_at, news_id) 순서 기준)
+    WATERMARK_QUERY = """
+    SELECT news_id, title, section, link, pub_time, create_at
+    FROM news
+    WHERE create_at >= %s AND (create_at > %s OR news_id > %s)
+    ORDER BY create_at, news_id
+    """
+    INITIAL_WATERMARK_QUERY = """
+    SELECT news_id, title, section, link, pub_time, create_at
+    FROM news
+    WHERE create_at >= %s
+    ORDER BY create_at, news_id
+    """
+    WATERMARK_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+
+    # 구간 조회용 커버링 인덱스
+    COVERING_INDEX_NAME = 'idx_news_create_at_covering'
+    COVERING_INDEX_COLUMNS = ('create_at', 'news_id', 'title', 'section', 'link', 'pub_time')
+
     def __init__(self, mysql_connector: MySQLConnector):
         self.mysql_connector = mysql_connector
         self.kst = pytz.timezone('Asia/Seoul')
+        self.load_mode = config.get('news.load_mode', 'period')
+        self.watermark_lookback_hours = config.get('news.watermark_lookback_hours', 18)
+        self.watermark_store = WatermarkStore(config.get('news.watermark_path', 'data/watermark.json'))
+
+    def get_news(self, current_time: datetime) -> Optional[Dict[str, Any]]:
+        """설정된 조회 방식(period/watermark)으로 뉴스 조회"""
+        if self.load_mode == 'watermark':
+            return self.get_news_since_watermark(current_time)
+        return self.get_news_by_period(current_time)
+
+    def stream_news(self, current_time: datetime, batch_size: int = 1000) -> Optional[Dict[str, Any]]:
+        """설정된 조회 방식(period/watermark)으로 뉴스를 배치 스트리밍 조회"""
+        if self.load_mode == 'watermark':
+            return self.stream_news_since_watermark(current_time, batch_size)
+        return self.stream_news_by_period(current_time, batch_size)
+
+    def _to_kst(self, current_time: datetime) -> datetime:
+        """KST 시각으로 변환 (시간대가 없으면 KST로 간주)"""
+        if current_time.tzinfo is None:
+            return self.kst.localize(current_time)
+        return current_time.astimezone(self.kst)
+
+    def _period_range(self, current_time: datetime) -> Optional[Tuple[datetime, datetime]]:
+        """현재 시각에 해당하는 분석 구간을 KST 기준 [시작, 종료) 범위로 계산"""
+        current_time = self._to_kst(current_time)
 
-    def get_news_by_period(self, current_time: datetime) -> Optional[Dict[str, Any]]:
         target_time = current_time.time()
         target_date = current_time.date()
 
@@ -35,48 +88,40 @@ class NewsDataLoader:
             time_diff = abs(current_minutes - check_minutes)
 
             if time_diff <= 5:  # 5분 이내
-                selected_period = (analysis_time, period)
+                selected_period = period
                 break
 
         if not selected_period:
             logger.info("현재 시각은 뉴스 분석 시간이 아닙니다.")
             return None
 
-        analysis_time, period = selected_period
+        start = datetime.combine(target_date, datetime.strptime(selected_period['start'], "%H:%M").time())
+        end = datetime.combine(target_date, datetime.strptime(selected_period['end'], "%H:%M").time())
 
-        # 첫 번째 시간대(09:10)의 경우 전날 데이터도 포함
-        if analysis_time == "08:40":
-            query = """
-            SELECT news_id, title, section, link, pub_time, create_at
-            FROM news
-            WHERE (
-                (DATE(create_at) = DATE_SUB(%s, INTERVAL 1 DAY) AND TIME(create_at) >= %s)
-                OR (DATE(create_at) = %s AND TIME(create_at) <= %s)
-            )
-            ORDER BY create_at
-            """
-            params = (
-                target_date.strftime('%Y-%m-%d'),
-                period['start'],
-                target_date.strftime('%Y-%m-%d'),
-                period['end']
-            )
-        else:
-            # 일반적인 경우
-            query = """
-            SELECT news_id, title, section, link, pub_time, create_at
-            FROM news
-            WHERE DATE(create_at) = %s 
-            AND TIME(create_at) BETWEEN %s AND %s
-            ORDER BY create_at
-            """
-            params = (
-                target_date.strftime('%Y-%m-%d'),
-                period['start'],
-                period['end']
-            )
+        # 시작 시각이 종료 시각보다 늦으면 전날부터 조회 (08:40 구간)
+        if start >= end:
+            start -= timedelta(days=1)
+
+        return start, end
 
-        period_str = f"{target_date.strftime('%Y-%m-%d')} {period['start']} ~ {period['end']}"
+    def _build_period_query(self, current_time: datetime) -> Optional[Tuple[str, tuple, str]]:
+        """현재 시각에 해당하는 분석 구간의 조회 쿼리, 파라미터, 구간 문자열 생성"""
+        period_range = self._period_range(current_time)
+        if not period_range:
+            return None
+
+        start, end = period_range
+        params = (start.strftime(self.DATETIME_FORMAT), end.strftime(self.DATETIME_FORMAT))
+        period_str = f"{start.strftime('%Y-%m-%d %H:%M')} ~ {end.strftime('%Y-%m-%d %H:%M')}"
+        return self.PERIOD_QUERY, params, period_str
+
+    def get_news_by_period(self, current_time: datetime) -> Optional[Dict[str, Any]]:
+        period_query = self._build_period_query(current_time)
+        if not period_query:
+            return None
+
+        query, params, period_str = period_query
+        target_date = self._to_kst(current_time).date()
         logger.info(f"뉴스 조회 시작: {period_str}")
 
         results = self.mysql_connector.execute_query(query, params)
@@ -92,4 +137,135 @@ class NewsDataLoader:
             'period': period_str,
             'date': target_date.strftime('%Y-%m-%d'),
             'total_count': len(results)
-        }
\ No newline at end of file
+        }
+
+    def stream_news_by_period(self, current_time: datetime, batch_size: int = 1000) -> Optional[Dict[str, Any]]:
+        """구간별 뉴스를 배치 단위 제너레이터로 반환 (전체 건수는 소비 후 확인 가능)"""
+        period_query = self._build_period_query(current_time)
+        if not period_query:
+            return None
+
+        query, params, period_str = period_query
+        target_date = self._to_kst(current_time).date()
+        logger.info(f"뉴스 스트리밍 조회 시작: {period_str} (배치 크기: {batch_size})")
+
+        return {
+            'news_batches': self.mysql_connector.stream_query(query, params, batch_size),
+            'period': period_str,
+            'date': target_date.strftime('%Y-%m-%d')
+        }
+
+    def ensure_covering_index(self) -> bool:
+        """구간 조회용 커버링 인덱스가 없으면 생성 (migrations/001 과 동일)"""
+        existing = self.mysql_connector.execute_query(
+            """
+            SELECT 1
+            FROM information_schema.statistics
+            WHERE table_schema = DATABASE() AND table_name = 'news' AND index_name = %s
+            LIMIT 1
+            """,
+            (self.COVERING_INDEX_NAME,)
+        )
+        if existing:
+            logger.info(f"커버링 인덱스가 이미 존재합니다: {self.COVERING_INDEX_NAME}")
+            return True
+
+        logger.info(f"커버링 인덱스 생성 시작: {self.COVERING_INDEX_NAME}")
+        result = self.mysql_connector.execute_update(
+            f"CREATE INDEX {self.COVERING_INDEX_NAME} ON news ({', '.join(self.COVERING_INDEX_COLUMNS)})"
+        )
+        if result is None:
+            logger.error(f"커버링 인덱스 생성 실패: {self.COVERING_INDEX_NAME}")
+            return False
+
+        logger.info(f"커버링 인덱스 생성 완료: {self.COVERING_INDEX_NAME}")
+        return True
+
+    def check_query_plan(self) -> bool:
+        """구간 조회 쿼리의 실행 계획이 인덱스 범위 스캔인지 확인"""
+        end = datetime.now(self.kst).replace(tzinfo=None)
+        start = end - timedelta(days=1)
+        plan = self.mysql_connector.execute_query(
+            f"EXPLAIN {self.PERIOD_QUERY}",
+            (start.strftime(self.DATETIME_FORMAT), end.strftime(self.DATETIME_FORMAT))
+        )
+
+        if not plan:
+            logger.warning("구간 조회 쿼리의 실행 계획을 확인하지 못했습니다.")
+            return False
+
+        access_type = plan[0].get('type')
+        key = plan[0].get('key')
+        if access_type != 'range' or not key:
+            logger.warning(
+                f"구간 조회 쿼리가 인덱스 범위 스캔을 사용하지 않습니다 "
+                f"(type: {access_type}, key: {key}, rows: {plan[0].get('rows')}). "
+                f"{self.COVERING_INDEX_NAME} 인덱스를 확인하세요."
+            )
+            return False
+
+        logger.info(f"구간 조회 쿼리 실행 계획 확인: type={access_type}, key={key}, Extra={plan[0].get('Extra')}")
+        return True
+
+    def _build_watermark_query(self, current_time: datetime) -> Tuple[str, tuple, str]:
+        """저장된 워터마크 이후 조회 쿼리 생성 (워터마크가 없으면 lookback 구간부터)"""
+        watermark = self.watermark_store.load()
+        if watermark:
+            params = (watermark['create_at'], watermark['create_at'], watermark['news_id'])
+            return self.WATERMARK_QUERY, params, f"{watermark['create_at']} (news_id {watermark['news_id']}) 이후"
+
+        current_time = self._to_kst(current_time).replace(tzinfo=None)
+        start = current_time - timedelta(hours=self.watermark_lookback_hours)
+        logger.info(f"저장된 워터마크가 없어 최근 {self.watermark_lookback_hours}시간 뉴스부터 조회합니다.")
+        return self.INITIAL_WATERMARK_QUERY, (start.strftime(self.DATETIME_FORMAT),), f"{start.strftime('%Y-%m-%d %H:%M')} 이후"
+
+    def _row_watermark(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        create_at = row['create_at']
+        if isinstance(create_at, datetime):
+            create_at = create_at.strftime(self.WATERMARK_DATETIME_FORMAT)
+        return {'create_at': str(create_at), 'news_id': row['news_id']}
+
+    def get_news_since_watermark(self, current_time: datetime) -> Optional[Dict[str, Any]]:
+        """워터마크 이후 새로 수집된 뉴스 조회 (워터마크는 commit_watermark로 확정)"""
+        query, params, period_str = self._build_watermark_query(current_time)
+        logger.info(f"뉴스 조회 시작: {period_str}")
+
+        results = self.mysql_connector.execute_query(query, params)
+
+        if not results:
+            logger.warning("조회된 뉴스가 없습니다.")
+            return None
+
+        logger.info(f"뉴스 조회 완료: {period_str}, {len(results)}건")
+
+        return {
+            'news_list': results,
+            'period': period_str,
+            'date': self._to_kst(current_time).strftime('%Y-%m-%d'),
+            'total_count': len(results),
+            'watermark': self._row_watermark(results[-1])
+        }
+
+    def stream_news_since_watermark(self, current_time: datetime, batch_size: int = 1000) -> Optional[Dict[str, Any]]:
+        """워터마크 이후 뉴스를 배치 스트리밍 조회 (watermark는 소비한 마지막 행 기준으로 갱신)"""
+        query, params, period_str = self._build_watermark_query(current_time)
+        logger.info(f"뉴스 스트리밍 조회 시작: {period_str} (배치 크기: {batch_size})")
+
+        news_data = {
+            'period': period_str,
+            'date': self._to_kst(current_time).strftime('%Y-%m-%d'),
+            'watermark': None
+        }
+
+        def news_batches():
+            for batch in self.mysql_connector.stream_query(query, params, batch_size):
+                news_data['watermark'] = self._row_watermark(batch[-1])
+                yield batch
+
+        news_data['news_batches'] = news_batches()
+        return news_data
+
+    def commit_watermark(self, watermark: Optional[Dict[str, Any]]) -> None:
+        """분석 및 발송이 끝난 뒤 처리 위치 확정"""
+        if watermark:
+            self.watermark_store.save(watermark)
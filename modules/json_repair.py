@@ -0,0 +1,286 @@
+# modules/json_repair.py
+import json
+import re
+from typing import Any, List, Optional, Set, Tuple
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_WHITESPACE = ' \t\r\n'
+_ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+_LITERALS = {'true': True, 'false': False, 'null': None, 'True': True, 'False': False, 'None': None}
+_VALUE_START = set('"{[-+0123456789')
+# 문자열 값 정규화 (기존 정제 규칙 유지)
+_TEXT_REPLACEMENTS = (('···', '...'), ('…', '...'), ('&amp;', '&'))
+_STRING_SPECIAL = re.compile(r'["\\]')
+_NON_WHITESPACE = re.compile(r'[^ \t\r\n]')
+
+
+class TolerantJSONParser:
+    """LLM 응답용 관용 JSON 파서 (입력을 한 번만 순회하는 재귀 하향 파서)
+
+    다음 오류를 복구하며, 복구한 종류는 repairs에 기록한다.
+    - 코드 펜스/앞뒤 설명 문장: 첫 '{' 또는 '['부터 파싱하고 나머지는 무시
+    - 이스케이프되지 않은 문자열 내부 따옴표: 뒤따르는 문자로 닫는 따옴표인지 판단
+    - 후행 쉼표, 누락된 쉼표, '+' 부호 숫자, 문자열 내 제어 문자
+    - 잘린 출력: 끝까지 완성되지 않은 값은 버리고 열린 괄호를 닫음
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.length = len(text)
+        self.pos = 0
+        self.repairs: Set[str] = set()
+
+    def parse(self) -> Optional[Any]:
+        start = self._find_start()
+        if start == -1:
+            return None
+
+        # 형식이 올바른 응답은 표준 파서로 처리 (문자열 정규화만 적용)
+        end = max(self.text.rfind('}'), self.text.rfind(']')) + 1
+        try:
+            return self._normalize_value(json.loads(self.text[start:end]))
+        except ValueError:
+            pass
+
+        self.pos = start
+        value, complete = self._parse_value()
+        if not complete:
+            self.repairs.add('truncated')
+        return value
+
+    def _find_start(self) -> int:
+        # 설명 문장 속 대괄호([시장 영향도 분석] 등)를 피하기 위해 객체 시작을 우선
+        start = self.text.find('{')
+        if start == -1:
+            start = self.text.find('[')
+        if start == -1:
+            return -1
+        if self.text.lstrip()[:1] not in ('{', '['):
+            self.repairs.add('code_fence' if '```' in self.text[:start] else 'leading_text')
+        return start
+
+    def _skip_whitespace(self) -> None:
+        self.pos = self._peek_after_whitespace(self.pos)[1]
+
+    def _peek_after_whitespace(self, pos: int) -> Tuple[str, int]:
+        """pos부터 공백을 건너뛴 첫 문자와 위치 (끝이면 '')"""
+        match = _NON_WHITESPACE.search(self.text, pos)
+        if match is None:
+            return '', self.length
+        return match.group(), match.start()
+
+    def _parse_value(self) -> Tuple[Any, bool]:
+        """(값, 완결 여부) 반환"""
+        self._skip_whitespace()
+        if self.pos >= self.length:
+            return None, False
+
+        char = self.text[self.pos]
+        if char == '{':
+            return self._parse_object()
+        if char == '[':
+            return self._parse_array()
+        if char == '"':
+            return self._parse_string()
+        return self._parse_scalar()
+
+    def _parse_object(self) -> Tuple[dict, bool]:
+        self.pos += 1
+        result = {}
+        while True:
+            self._skip_whitespace()
+            if self.pos >= self.length:
+                return result, False
+
+            char = self.text[self.pos]
+            if char == '}':
+                self.pos += 1
+                return result, True
+            if char == ',':
+                self.pos += 1
+                if self._peek_after_whitespace(self.pos)[0] == '}':
+                    self.repairs.add('trailing_comma')
+                continue
+            if char == ']':
+                # 닫는 괄호 불일치: 객체를 닫은 것으로 간주
+                self.repairs.add('bracket_mismatch')
+                return result, True
+
+            if char == '"':
+                key, complete = self._parse_string(is_key=True)
+            else:
+                key, complete = self._parse_bare_key()
+            if not complete:
+                return result, False
+
+            self._skip_whitespace()
+            if self.pos < self.length and self.text[self.pos] == ':':
+                self.pos += 1
+            elif self.pos < self.length:
+                self.repairs.add('missing_colon')
+            value, complete = self._parse_value()
+            if not complete:
+                # 잘린 배열/객체는 그 안의 완성된 부분만 유지
+                if isinstance(value, (dict, list)):
+                    result[key] = value
+                return result, False
+            result[key] = value
+
+            next_char, _ = self._peek_after_whitespace(self.pos)
+            if next_char and next_char not in ',}]':
+                self.repairs.add('missing_comma')
+
+    def _parse_array(self) -> Tuple[list, bool]:
+        self.pos += 1
+        result: List[Any] = []
+        while True:
+            self._skip_whitespace()
+            if self.pos >= self.length:
+                return result, False
+
+            char = self.text[self.pos]
+            if char == ']':
+                self.pos += 1
+                return result, True
+            if char == ',':
+                self.pos += 1
+                if self._peek_after_whitespace(self.pos)[0] == ']':
+                    self.repairs.add('trailing_comma')
+                continue
+            if char == '}':
+                self.repairs.add('bracket_mismatch')
+                return result, True
+
+            value, complete = self._parse_value()
+            if not complete:
+                # 잘린 마지막 항목은 버리고 완성된 항목만 유지
+                return result, False
+            result.append(value)
+
+            next_char, _ = self._peek_after_whitespace(self.pos)
+            if next_char and next_char not in ',]}':
+                self.repairs.add('missing_comma')
+
+    def _closes_string(self, pos: int, is_key: bool) -> bool:
+        """pos의 따옴표가 문자열을 닫는 따옴표인지 뒤따르는 문자로 판단"""
+        next_char, next_pos = self._peek_after_whitespace(pos + 1)
+        if is_key:
+            return next_char in (':', '')
+        if next_char in ('}', ']', ':', ''):
+            return True
+        if next_char == ',':
+            after_comma, after_pos = self._peek_after_whitespace(next_pos + 1)
+            if after_comma in _VALUE_START or after_comma in ('}', ']', ''):
+                return True
+            return any(self.text.startswith(literal, after_pos) for literal in _LITERALS)
+        if next_char == '"':
+            # 쉼표 없이 다음 키/값이 이어지는 경우 (줄바꿈 후 따옴표)
+            return '\n' in self.text[pos + 1:next_pos]
+        return False
+
+    def _parse_string(self, is_key: bool = False) -> Tuple[str, bool]:
+        text, length = self.text, self.length
+        pos = self.pos + 1
+        chunks = []
+        segment_start = pos
+
+        while True:
+            # 따옴표/역슬래시까지 한 번에 건너뜀
+            match = _STRING_SPECIAL.search(text, pos)
+            if match is None:
+                break
+            pos = match.start()
+            char = text[pos]
+            if char == '\\':
+                chunks.append(text[segment_start:pos])
+                if pos + 1 >= length:
+                    self.pos = length
+                    return '', False
+                escape = text[pos + 1]
+                if escape == 'u' and pos + 6 <= length:
+                    try:
+                        chunks.append(chr(int(text[pos + 2:pos + 6], 16)))
+                        pos += 6
+                    except ValueError:
+                        chunks.append(escape)
+                        pos += 2
+                else:
+                    chunks.append(_ESCAPES.get(escape, escape))
+                    pos += 2
+                segment_start = pos
+                continue
+
+            if char == '"':
+                if self._closes_string(pos, is_key):
+                    chunks.append(text[segment_start:pos])
+                    self.pos = pos + 1
+                    return self._normalize(''.join(chunks)), True
+                self.repairs.add('inner_quote')
+            pos += 1
+
+        self.pos = length
+        return '', False
+
+    def _normalize_value(self, value: Any) -> Any:
+        if isinstance(value, str):
+            return self._normalize(value)
+        if isinstance(value, list):
+            return [self._normalize_value(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._normalize_value(item) for key, item in value.items()}
+        return value
+
+    @staticmethod
+    def _normalize(value: str) -> str:
+        if any(char in value for char in _WHITESPACE[1:]) or '  ' in value:
+            value = ' '.join(value.split())
+        for old, new in _TEXT_REPLACEMENTS:
+            if old in value:
+                value = value.replace(old, new)
+        return value
+
+    def _parse_bare_key(self) -> Tuple[str, bool]:
+        """따옴표 없는 키 (key: value 형식)"""
+        text, length = self.text, self.length
+        start = pos = self.pos
+        while pos < length and text[pos] not in ':,}]' and text[pos] not in _WHITESPACE:
+            pos += 1
+        self.pos = pos
+        if pos >= length:
+            return '', False
+        self.repairs.add('unquoted_key')
+        return text[start:pos].strip("'"), True
+
+    def _parse_scalar(self) -> Tuple[Any, bool]:
+        text, length = self.text, self.length
+        start = pos = self.pos
+        while pos < length and text[pos] not in ',}]' and text[pos] not in _WHITESPACE:
+            pos += 1
+        self.pos = pos
+        token = text[start:pos]
+        if pos >= length:
+            # 끝에서 잘린 숫자/리터럴은 완결 여부를 알 수 없음
+            return None, False
+
+        if token in _LITERALS:
+            return _LITERALS[token], True
+        if token.startswith('+'):
+            self.repairs.add('plus_sign')
+            token = token[1:]
+        try:
+            return int(token), True
+        except ValueError:
+            pass
+        try:
+            return float(token), True
+        except ValueError:
+            self.repairs.add('bare_value')
+            return token, True
+
+
+def parse_tolerant_json(text: str) -> Tuple[Optional[Any], Set[str]]:
+    """관용 파싱 결과와 적용된 복구 종류 반환 (JSON 시작 문자가 없으면 None)"""
+    parser = TolerantJSONParser(text)
+    return parser.parse(), parser.repairs
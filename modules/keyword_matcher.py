@@ -0,0 +1,96 @@
+# modules/keyword_matcher.py
+import json
+from collections import deque
+from typing import Dict, List, Tuple, Union
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# {카테고리: [키워드, ...]} 또는 {카테고리: {키워드: 가중치, ...}}
+KeywordSpec = Dict[str, Union[List[str], Dict[str, float]]]
+
+
+def load_keywords(path: str) -> KeywordSpec:
+    """카테고리별 키워드 JSON 파일 로드"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            keywords = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error(f"키워드 파일 로드 실패: {path} ({str(e)})")
+        raise
+
+    if not isinstance(keywords, dict) or not all(isinstance(v, (list, dict)) for v in keywords.values()):
+        raise ValueError(f"키워드 파일 형식이 올바르지 않습니다: {path}")
+    logger.info(f"키워드 파일 로드 완료: {path} ({sum(len(v) for v in keywords.values())}개 키워드)")
+    return keywords
+
+
+class KeywordMatcher:
+    """Aho-Corasick 오토마톤 기반 다중 키워드 매칭
+
+    모든 키워드를 소문자로 한 번만 컴파일해 두고, 제목을 한 번 순회하며
+    카테고리별 점수(일치한 키워드 가중치 합)를 계산한다.
+    제목당 비용은 키워드 수와 무관하게 제목 길이와 일치 건수에 비례한다.
+    """
+
+    def __init__(self, keywords: KeywordSpec):
+        self.categories = list(keywords.keys())
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, float]]] = [[]]
+
+        for index, category in enumerate(self.categories):
+            terms = keywords[category]
+            weights = terms if isinstance(terms, dict) else dict.fromkeys(terms, 1.0)
+            for keyword, weight in weights.items():
+                keyword = keyword.strip().lower()
+                if keyword:
+                    self._insert(keyword, index, float(weight))
+        self._build_failure_links()
+
+    def _insert(self, keyword: str, category_index: int, weight: float) -> None:
+        node = 0
+        for char in keyword:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append((category_index, weight))
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                # 접미사로 끝나는 키워드도 함께 출력
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def scores(self, text: str) -> List[float]:
+        """카테고리 순서대로 일치한 키워드 가중치 합 반환"""
+        goto, fail, output = self._goto, self._fail, self._output
+        scores = [0.0] * len(self.categories)
+        node = 0
+        for char in text.lower():
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for category_index, weight in output[node]:
+                scores[category_index] += weight
+        return scores
+
+    def classify(self, text: str, default: str = '기타') -> str:
+        """점수가 가장 높은 카테고리 (동점이면 먼저 정의된 카테고리, 일치가 없으면 default)"""
+        scores = self.scores(text)
+        best_index = max(range(len(scores)), key=lambda i: (scores[i], -i), default=None)
+        if best_index is None or scores[best_index] <= 0:
+            return default
+        return self.categories[best_index]
@@ -1,7 +1,11 @@
 # modules/mysql_connector.py
 import mysql.connector
 from mysql.connector import Error
-from typing import Optional
+from mysql.connector.errors import PoolError
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+import queue
+import threading
 import time
 from utils.config import Config
 from utils.logger import setup_logger
@@ -9,15 +13,119 @@ from utils.logger import setup_logger
 logger = setup_logger(__name__)
 config = Config.get_instance()
 
+
+class ConnectionPool:
+    """스레드 안전 MySQL 커넥션 풀 (대여 시 상태 점검, 유휴 커넥션 재생성)"""
+
+    def __init__(self, db_config: Dict, pool_size: int = 5, recycle_seconds: int = 1800,
+                 borrow_timeout: int = 30):
+        self.db_config = db_config
+        self.pool_size = pool_size
+        self.recycle_seconds = recycle_seconds
+        self.borrow_timeout = borrow_timeout
+        self._idle = queue.LifoQueue(maxsize=pool_size)
+        self._slots = threading.BoundedSemaphore(pool_size)
+
+    def acquire(self):
+        """커넥션 대여 (풀이 가득 찬 경우 borrow_timeout까지 대기)"""
+        if not self._slots.acquire(timeout=self.borrow_timeout):
+            raise PoolError(f"커넥션 풀 대기 시간 초과 ({self.borrow_timeout}초, 크기: {self.pool_size})")
+
+        try:
+            try:
+                connection, last_used = self._idle.get_nowait()
+            except queue.Empty:
+                connection, last_used = None, 0
+
+            # 오래 유휴 상태였던 커넥션은 서버 측 타임아웃 전에 재생성
+            if connection is not None and time.time() - last_used > self.recycle_seconds:
+                self._close_quietly(connection)
+                connection = None
+
+            if connection is not None:
+                try:
+                    connection.ping(reconnect=False)
+                except Error:
+                    logger.warning("풀 커넥션 상태 점검 실패, 새 커넥션으로 교체합니다.")
+                    self._close_quietly(connection)
+                    connection = None
+
+            if connection is None:
+                connection = mysql.connector.connect(**self.db_config)
+                logger.info("MySQL 풀 커넥션 생성")
+
+            return connection
+
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, connection, discard: bool = False) -> None:
+        """커넥션 반납 (discard=True이면 폐기)
+
+        autocommit이 꺼진 커넥션은 조회만 해도 트랜잭션 스냅샷이 유지되어 다음 대여자가
+        이후 추가된 행을 보지 못하므로, 반납 전에 롤백해 트랜잭션을 종료한다.
+        """
+        try:
+            if not discard and connection.is_connected():
+                try:
+                    connection.rollback()
+                except Error as e:
+                    logger.warning(f"풀 커넥션 롤백 실패, 폐기합니다: {str(e)}")
+                    discard = True
+            if discard or not connection.is_connected():
+                self._close_quietly(connection)
+            else:
+                self._idle.put_nowait((connection, time.time()))
+        finally:
+            self._slots.release()
+
+    def close_all(self) -> None:
+        """유휴 커넥션 모두 종료"""
+        while True:
+            try:
+                connection, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._close_quietly(connection)
+
+    @staticmethod
+    def _close_quietly(connection) -> None:
+        try:
+            connection.close()
+        except Error:
+            pass
+
+
 class MySQLConnector:
     # DB 설정 키 목록
     DB_CONFIG_KEYS = ['host', 'port', 'user', 'password', 'database']
 
+    # 동일 DB 설정을 사용하는 커넥터 간 공유되는 커넥션 풀
+    _pools: Dict[tuple, ConnectionPool] = {}
+    _pools_lock = threading.Lock()
+
     def __init__(self):
         self.config = {key: config.get(f'db.{key}') for key in self.DB_CONFIG_KEYS}
         self._connection = None
         self.max_retries = config.get('retry.max_retries', 3)
         self.retry_delay = config.get('retry.retry_delay', 5)
+        self._pool = self._get_pool() if config.get('db.pool_enabled', False) else None
+
+    def _get_pool(self) -> ConnectionPool:
+        pool_size = config.get('db.pool_size', 5)
+        pool_key = tuple(self.config[key] for key in self.DB_CONFIG_KEYS) + (pool_size,)
+
+        with self._pools_lock:
+            if pool_key not in self._pools:
+                self._pools[pool_key] = ConnectionPool(
+                    self.config,
+                    pool_size=pool_size,
+                    recycle_seconds=config.get('db.pool_recycle', 1800),
+                    borrow_timeout=config.get('db.pool_timeout', 30)
+                )
+                logger.info(f"MySQL 커넥션 풀 생성 (크기: {pool_size})")
+            return self._pools[pool_key]
 
     def connect(self) -> None:
         """데이터베이스 연결 (재시도 로직 포함)"""
@@ -49,6 +157,28 @@ class MySQLConnector:
             self._connection.close()
             logger.info("MySQL 데이터베이스 연결 해제")
 
+    @contextmanager
+    def connection(self):
+        """작업용 커넥션 제공 (풀 모드는 대여/반납, 단일 모드는 연결/해제)"""
+        if self._pool is None:
+            self.connect()
+            try:
+                yield self._connection
+            finally:
+                self.disconnect()
+            return
+
+        connection = self._pool.acquire()
+        discard = False
+        try:
+            yield connection
+        except BaseException:
+            # 오류나 중단으로 읽지 않은 결과가 남았을 수 있는 커넥션은 풀에 되돌리지 않음
+            discard = True
+            raise
+        finally:
+            self._pool.release(connection, discard=discard)
+
     def execute_with_retry(self, operation: callable):
         """재시도 로직을 포함한 데이터베이스 작업 실행"""
         retries = 0
@@ -75,13 +205,49 @@ class MySQLConnector:
         """쿼리 실행 및 결과 반환"""
 
         def execute():
-            self.connect()
-            cursor = self._connection.cursor(dictionary=True)
+            with self.connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+                try:
+                    cursor.execute(query, params)
+                    return cursor.fetchall()
+                finally:
+                    cursor.close()
+
+        return self.execute_with_retry(execute)
+
+    def execute_update(self, query: str, params: tuple = None) -> Optional[int]:
+        """변경 쿼리(DML/DDL) 실행 후 커밋하고 영향받은 행 수 반환"""
+
+        def execute():
+            with self.connection() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(query, params)
+                    connection.commit()
+                    return cursor.rowcount
+                finally:
+                    cursor.close()
+
+        return self.execute_with_retry(execute)
+
+    def stream_query(self, query: str, params: tuple = None, batch_size: int = 1000) -> Iterator[list]:
+        """쿼리 결과를 batch_size 단위로 스트리밍 (비버퍼 커서 사용)
+
+        결과 전체를 클라이언트에 적재하지 않으므로 메모리 사용량이 배치 크기로 제한된다.
+        스트리밍 도중 발생한 오류는 재시도하지 않고 호출자에게 전달된다.
+        """
+        with self.connection() as connection:
+            cursor = connection.cursor(dictionary=True, buffered=False)
             try:
                 cursor.execute(query, params)
-                return cursor.fetchall()
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield rows
             finally:
-                cursor.close()
-                self.disconnect()
-
-        return self.execute_with_retry(execute)
\ No newline at end of file
+                try:
+                    cursor.close()
+                except Error:
+                    # 소비가 중단되어 읽지 않은 결과가 남은 경우
+                    pass
@@ -1,56 +1,134 @@
 # modules/news_analyzer.py
 from datetime import datetime
+from itertools import chain
 import pytz
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterable, List, Optional
 from modules.claude_client import ClaudeClient
 from modules.data_loader import NewsDataLoader
 from utils.config import Config
 from utils.logger import setup_logger
+from utils.metrics import PipelineMetrics
 
 logger = setup_logger(__name__)
 config = Config.get_instance()
+metrics = PipelineMetrics.get_instance()
 
 class NewsAnalyzer:
     def __init__(self, data_loader: NewsDataLoader, claude_api_key: str):
         self.data_loader = data_loader
         self.claude_client = ClaudeClient(claude_api_key)
         self.kst = pytz.timezone('Asia/Seoul')
+        self.stream_batch_size = config.get('db.stream_batch_size', 0)
 
-    def analyze_news_by_period(self) -> Optional[Dict]:
-        """현재 시간 기준으로 구간별 뉴스 분석"""
-        try:
-            now = datetime.now(self.kst)
-            logger.info(f"현재 시각: {now.strftime('%Y-%m-%d %H:%M:%S %Z')}")
+    @staticmethod
+    def _iter_rows(news_batches: Iterable[list], counter: Dict):
+        """배치 제너레이터를 행 단위로 펼치며 건수 집계"""
+        for batch in news_batches:
+            counter['rows'] += len(batch)
+            yield from batch
+
+    def _select_streaming(self, now: datetime) -> Optional[Dict]:
+        """배치 스트리밍 조회 결과를 제너레이터 파이프라인으로 클러스터링 및 선별"""
+        # 첫 배치 이후의 조회 시간은 분류 단계(categorize)에 포함됨
+        with metrics.span('db_fetch', streaming=True) as fetch_span:
+            news_data = self.data_loader.stream_news(now, self.stream_batch_size)
+            if not news_data:
+                return None
+
+            # 첫 배치를 미리 확인하여 빈 구간이면 분석을 시작하지 않음
+            news_batches = iter(news_data['news_batches'])
+            first_batch = next(news_batches, None)
+        if not first_batch:
+            logger.warning("조회된 뉴스가 없습니다")
+            return None
+
+        counter = {'rows': 0}
+        selected = self.claude_client.cluster_and_select(
+            self._iter_rows(chain([first_batch], news_batches), counter)
+        )
+        fetch_span.set(rows=counter['rows'])
+        logger.info(f"스트리밍 조회 뉴스 {counter['rows']}건 선별 완료")
 
+        return {
+            'date': news_data['date'],
+            'period': news_data['period'],
+            'total_count': counter['rows'],
+            'watermark': news_data.get('watermark'),
+            'news_items': selected
+        }
+
+    def prepare_selection(self, now: datetime) -> Optional[Dict]:
+        """뉴스 조회, 클러스터링, 선별까지 수행 (Claude 호출 전 단계)"""
+        if self.stream_batch_size > 0:
+            # 배치 단위 스트리밍 조회 및 선별
+            prepared = self._select_streaming(now)
+        else:
             # DB에서 뉴스 조회
-            news_data = self.data_loader.get_news_by_period(now)
+            with metrics.span('db_fetch') as span:
+                news_data = self.data_loader.get_news(now)
+                span.set(rows=len(news_data['news_list']) if news_data else 0)
 
             if not news_data or not news_data['news_list']:
                 logger.warning("조회된 뉴스가 없습니다")
                 return None
 
             logger.info(f"뉴스 {len(news_data['news_list'])}건에 대해 분석을 시작합니다.")
-
-            # Claude를 통한 뉴스 분석
-            analyzed_result = self.claude_client.analyze_news(news_data['news_list'])
-
-            if not analyzed_result or not analyzed_result['news_items']:
-                logger.warning("분석된 뉴스가 없습니다")
-                return None
-
-            result = {
+            prepared = {
                 'date': news_data['date'],
                 'period': news_data['period'],
                 'total_count': news_data['total_count'],
-                'selected_count': len(analyzed_result['news_items']),
-                'news_items': analyzed_result['news_items'],
-                'market_analysis': analyzed_result.get('market_analysis', []),
-                'usage_info': analyzed_result.get('usage_info', {})
+                'watermark': news_data.get('watermark'),
+                'news_items': self.claude_client.cluster_and_select(news_data['news_list'])
             }
 
-            logger.info(f"뉴스 분석 완료: 전체 {result['total_count']}건 중 {result['selected_count']}건 선택")
-            return result
+        if not prepared or not prepared['news_items']:
+            logger.warning("분석된 뉴스가 없습니다")
+            return None
+
+        return prepared
+
+    def build_result(self, prepared: Dict, analyzed_result: Dict) -> Dict:
+        """선별 결과와 Claude 분석 결과를 합쳐 발송용 결과 구성 (입력 토큰 예산으로 제외된 뉴스는 빠짐)"""
+        news_items = analyzed_result.get('news_items', prepared['news_items'])
+        result = {
+            'date': prepared['date'],
+            'period': prepared['period'],
+            'total_count': prepared['total_count'],
+            'selected_count': len(news_items),
+            'news_items': news_items,
+            'market_analysis': analyzed_result.get('market_analysis', []),
+            'usage_info': analyzed_result.get('usage_info', {}),
+            'watermark': prepared.get('watermark'),
+            # Claude 분석 실패 시 처리 위치를 확정하지 않도록 표시
+            'error': analyzed_result.get('error', False)
+        }
+
+        logger.info(f"뉴스 분석 완료: 전체 {result['total_count']}건 중 {result['selected_count']}건 선택")
+        return result
+
+    def mark_reported(self, news_items: List[Dict]) -> None:
+        """슬랙 발송까지 완료한 뉴스를 다음 실행의 선별에서 제외/하향하도록 기록"""
+        self.claude_client.mark_reported(news_items)
+
+    def analyze_news_by_period(self, on_selected: Optional[Callable] = None,
+                               on_analysis: Optional[Callable] = None,
+                               now: Optional[datetime] = None) -> Optional[Dict]:
+        """현재 시간(now 지정 시 해당 시각) 기준으로 구간별 뉴스 분석
+
+        on_selected: 분석 대상 확정 시 (입력 토큰 예산 적용 후), on_analysis: 분석 항목마다 호출
+        """
+        try:
+            now = now or datetime.now(self.kst)
+            logger.info(f"현재 시각: {now.strftime('%Y-%m-%d %H:%M:%S %Z')}")
+
+            prepared = self.prepare_selection(now)
+            if not prepared:
+                return None
+
+            # Claude를 통한 뉴스 분석
+            analyzed_result = self.claude_client.analyze_with_claude(prepared['news_items'], on_analysis, on_selected)
+            return self.build_result(prepared, analyzed_result)
 
         except Exception as e:
             logger.error(f"뉴스 분석 중 오류 발생: {str(e)}", exc_info=True)
-            return None
\ No newline at end of file
+            return None
@@ -0,0 +1,294 @@
+# modules/news_clusterer.py
+import random
+import re
+import zlib
+from collections import defaultdict
+from typing import List, Dict, Iterable, Set, Tuple
+from fuzzywuzzy import fuzz, utils as fuzz_utils
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_NON_WORD = re.compile(r'[^0-9a-z가-힣]+')
+
+
+def normalize_title(title: str) -> str:
+    """제목 정규화 (소문자화, 특수문자 제거, 공백 정리)"""
+    return _NON_WORD.sub(' ', title.lower()).strip()
+
+
+def title_shingles(title: str, size: int = 2) -> Set[str]:
+    """제목을 토큰 및 문자 n-gram 슁글 집합으로 변환"""
+    tokens = normalize_title(title).split()
+    shingles = set(tokens)
+    for token in tokens:
+        if len(token) <= size:
+            continue
+        shingles.update(token[i:i + size] for i in range(len(token) - size + 1))
+    return shingles
+
+
+class MinHasher:
+    """슁글 집합의 MinHash 시그니처 생성"""
+    MERSENNE_PRIME = (1 << 61) - 1
+    MAX_HASH = (1 << 32) - 1
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.permutations = [
+            (rng.randint(1, self.MERSENNE_PRIME - 1), rng.randint(0, self.MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, shingles: Set[str]) -> Tuple[int, ...]:
+        hashes = [zlib.crc32(shingle.encode('utf-8')) for shingle in shingles]
+        if not hashes:
+            return (self.MAX_HASH,) * self.num_perm
+
+        prime, max_hash = self.MERSENNE_PRIME, self.MAX_HASH
+        return tuple(
+            min(((a * h + b) % prime) & max_hash for h in hashes)
+            for a, b in self.permutations
+        )
+
+
+class LSHIndex:
+    """MinHash 시그니처 밴딩 기반 후보 검색 인덱스"""
+
+    def __init__(self, num_perm: int = 64, bands: int = 64):
+        if bands <= 0 or num_perm % bands != 0:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})로 나누어 떨어져야 합니다.")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.buckets = [defaultdict(list) for _ in range(bands)]
+
+    def _band_keys(self, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    def insert(self, key, signature: Tuple[int, ...]) -> None:
+        for band, band_key in self._band_keys(signature):
+            self.buckets[band][band_key].append(key)
+
+    def query(self, signature: Tuple[int, ...]) -> Set:
+        candidates = set()
+        for band, band_key in self._band_keys(signature):
+            candidates.update(self.buckets[band].get(band_key, ()))
+        return candidates
+
+
+class NewsClusterer:
+    """제목 유사도 기반 뉴스 클러스터링
+
+    - exact: 모든 제목 쌍을 fuzz.token_set_ratio로 비교 (O(n²))
+    - lsh: MinHash/LSH로 후보 쌍만 생성한 뒤 동일한 임계값으로 검증
+    - matrix: 제목별 토큰 특징을 한 번만 계산해 희소 행렬 곱으로 전체 쌍 유사도를
+      블록 단위 계산하고, 임계값 이상인 쌍에 exact와 동일한 탐욕적 묶음을 적용
+    - incremental: 실행 간 유지되는 ClusterIndex에 새 뉴스만 배정 (O(신규 뉴스))
+    """
+    ENGINES = ('exact', 'lsh', 'matrix', 'incremental')
+
+    def __init__(self, similarity_threshold: int, engine: str = 'exact',
+                 num_perm: int = 64, bands: int = 64, block_size: int = 1024,
+                 verify_margin: int = 0, cluster_index=None):
+        if engine not in self.ENGINES:
+            raise ValueError(f"지원하지 않는 클러스터링 엔진입니다: {engine}")
+        if engine == 'incremental' and cluster_index is None:
+            raise ValueError("incremental 엔진에는 cluster_index가 필요합니다.")
+
+        self.similarity_threshold = similarity_threshold
+        self.engine = engine
+        self.num_perm = num_perm
+        self.bands = bands
+        self.block_size = block_size
+        self.verify_margin = verify_margin
+        self.cluster_index = cluster_index
+        self.minhasher = MinHasher(num_perm) if engine == 'lsh' else None
+        self.comparisons = 0
+
+    def cluster(self, news_items: List[Dict], category: str = '기타') -> List[Dict]:
+        """뉴스 목록을 클러스터링하여 대표 뉴스 목록 반환"""
+        if self.engine == 'incremental':
+            return self._cluster_incremental(news_items, category)
+
+        if self.engine == 'lsh':
+            groups = self._group_lsh(news_items)
+        elif self.engine == 'matrix':
+            groups = self._group_matrix(news_items)
+        else:
+            groups = self._group_exact(news_items)
+
+        return [self._representative([news_items[i] for i in group]) for group in groups]
+
+    def persist(self) -> None:
+        """상태를 유지하는 엔진의 클러스터 인덱스 저장"""
+        if self.cluster_index is not None:
+            self.cluster_index.save()
+
+    def _cluster_incremental(self, news_items: List[Dict], category: str) -> List[Dict]:
+        return self.cluster_stream((category, news) for news in news_items).get(category, [])
+
+    def cluster_stream(self, categorized_news: Iterable[Tuple[str, Dict]]) -> Dict[str, List[Dict]]:
+        """(카테고리, 뉴스) 스트림을 행 단위로 클러스터에 배정 (incremental 엔진 전용)
+
+        클러스터별 대표 뉴스와 이번 실행의 기사 수만 유지하므로
+        메모리 사용량이 입력 건수가 아닌 클러스터 수에 비례한다.
+        """
+        if self.engine != 'incremental':
+            raise ValueError("cluster_stream은 incremental 엔진에서만 사용할 수 있습니다.")
+
+        groups = {}
+        comparisons_before = self.cluster_index.comparisons
+        for category, news in categorized_news:
+            cluster_id = self.cluster_index.assign(news, category)
+            group = groups.get(cluster_id)
+            if group is None:
+                groups[cluster_id] = [category, news, 1]
+                continue
+            if len(news['title']) > len(group[1]['title']):
+                group[1] = news
+            group[2] += 1
+        self.comparisons += self.cluster_index.comparisons - comparisons_before
+
+        clustered = {}
+        for cluster_id, (category, representative, count) in groups.items():
+            representative['related_count'] = count - 1
+            representative['cluster_id'] = cluster_id
+            clustered.setdefault(category, []).append(representative)
+        return clustered
+
+    def _is_similar(self, title: str, other_title: str) -> bool:
+        self.comparisons += 1
+        return fuzz.token_set_ratio(title, other_title) >= self.similarity_threshold
+
+    def _group_exact(self, news_items: List[Dict]) -> List[List[int]]:
+        groups = []
+        used_indices = set()
+
+        for i, news in enumerate(news_items):
+            if i in used_indices:
+                continue
+
+            group = [i]
+            for j in range(i + 1, len(news_items)):
+                if j in used_indices:
+                    continue
+                if self._is_similar(news['title'], news_items[j]['title']):
+                    group.append(j)
+                    used_indices.add(j)
+
+            groups.append(group)
+
+        return groups
+
+    def _group_lsh(self, news_items: List[Dict]) -> List[List[int]]:
+        lsh_index = LSHIndex(self.num_perm, self.bands)
+        signatures = []
+        for i, news in enumerate(news_items):
+            signature = self.minhasher.signature(title_shingles(news['title']))
+            signatures.append(signature)
+            lsh_index.insert(i, signature)
+
+        groups = []
+        used_indices = set()
+
+        # exact 엔진과 동일한 탐욕적 순서를 유지하되 후보 쌍만 검증
+        for i, news in enumerate(news_items):
+            if i in used_indices:
+                continue
+
+            group = [i]
+            candidates = sorted(j for j in lsh_index.query(signatures[i]) if j > i and j not in used_indices)
+            for j in candidates:
+                if self._is_similar(news['title'], news_items[j]['title']):
+                    group.append(j)
+                    used_indices.add(j)
+
+            groups.append(group)
+
+        return groups
+
+    def _group_matrix(self, news_items: List[Dict]) -> List[List[int]]:
+        """token_set_ratio의 하한을 희소 행렬 연산으로 일괄 계산
+
+        두 제목의 공통 토큰 문자열 길이를 L0, 각 제목의 정렬된 토큰 문자열 길이를
+        La, Lb라 하면 token_set_ratio >= 200 * L0 / (L0 + min(La, Lb)) 이다.
+        L0는 (토큰 길이 + 1) 가중치 행렬과 이진 행렬의 곱으로 구한다.
+        """
+        import numpy as np
+        from scipy import sparse
+
+        vocabulary = {}
+        rows, cols = [], []
+        for i, news in enumerate(news_items):
+            for token in set(fuzz_utils.full_process(news['title']).split()):
+                rows.append(i)
+                cols.append(vocabulary.setdefault(token, len(vocabulary)))
+
+        size = len(news_items)
+        neighbors = [[] for _ in range(size)]
+        if not vocabulary:
+            return [[i] for i in range(size)]
+
+        token_weights = np.zeros(len(vocabulary))
+        for token, column in vocabulary.items():
+            token_weights[column] = len(token) + 1
+
+        binary = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(size, len(vocabulary))
+        )
+        weighted = binary.multiply(token_weights).tocsr()
+        binary_t = binary.T.tocsr()
+        title_lengths = np.asarray(weighted.sum(axis=1)).ravel() - 1
+
+        # fuzz는 점수를 반올림하므로 0.5 여유를 둠
+        threshold = self.similarity_threshold - 0.5
+
+        for start in range(0, size, self.block_size):
+            shared = (weighted[start:start + self.block_size] @ binary_t).tocoo()
+            left = shared.row + start
+            right = shared.col
+            mask = right > left
+            left, right = left[mask], right[mask]
+            common_length = shared.data[mask] - 1
+
+            self.comparisons += len(common_length)
+            scores = 200 * common_length / (
+                common_length + np.minimum(title_lengths[left], title_lengths[right])
+            )
+            passed = scores >= threshold
+            for a, b in zip(left[passed].tolist(), right[passed].tolist()):
+                neighbors[a].append(b)
+
+            # 하한이 임계값 근처인 쌍은 fuzz로 재검증 (토큰이 조금씩 다른 경우 보정)
+            borderline = ~passed & (scores >= threshold - self.verify_margin)
+            for a, b in zip(left[borderline].tolist(), right[borderline].tolist()):
+                if self._is_similar(news_items[a]['title'], news_items[b]['title']):
+                    neighbors[a].append(b)
+
+        # 연결 요소(union-find)로 묶으면 전이적으로 클러스터가 번지므로
+        # (generate_headlines 1,000건에서 exact 153개 → 24개, 최대 394건이 한 클러스터)
+        # exact 엔진과 같은 순서의 탐욕적 묶음으로 클러스터를 추출
+        groups = []
+        used_indices = set()
+        for i in range(size):
+            if i in used_indices:
+                continue
+
+            group = [i]
+            for j in sorted(neighbors[i]):
+                if j not in used_indices:
+                    group.append(j)
+                    used_indices.add(j)
+
+            groups.append(group)
+
+        return groups
+
+    @staticmethod
+    def _representative(cluster: List[Dict]) -> Dict:
+        # 클러스터의 대표 뉴스 선정 (가장 긴 제목을 가진 뉴스)
+        representative = max(cluster, key=lambda x: len(x['title']))
+        representative['related_count'] = len(cluster) - 1
+        return representative
@@ -1,17 +1,23 @@
 # modules/news_scheduler.py
-import schedule
+import asyncio
 import time
 import threading
 from datetime import datetime
+from typing import Optional
 from modules.mysql_connector import MySQLConnector
 from modules.news_analyzer import NewsAnalyzer
-from modules.slack_sender import SlackSender
+from modules.async_pipeline import AsyncNewsPipeline
+from modules.slack_router import SlackRouter
 from modules.data_loader import NewsDataLoader
 from utils.config import Config, KST
 from utils.logger import setup_logger
+from utils.metrics import PipelineMetrics
+from utils.profiler import RunProfiler
 
 logger = setup_logger(__name__)
 config = Config.get_instance()
+metrics = PipelineMetrics.get_instance()
+profiler = RunProfiler.get_instance()
 
 
 class NewsAnalysisScheduler(threading.Thread):
@@ -28,16 +34,30 @@ class NewsAnalysisScheduler(threading.Thread):
         self.db_connector = MySQLConnector()
         self.data_loader = NewsDataLoader(self.db_connector)
 
+        # 구간 조회 인덱스 생성 및 실행 계획 점검 (선택)
+        if config.get('db.ensure_index', False):
+            self.data_loader.ensure_covering_index()
+        if config.get('db.explain_check', False):
+            self.data_loader.check_query_plan()
+
         # 분석기 및 슬랙 발송 객체 초기화
         self.analyzer = NewsAnalyzer(
             self.data_loader,
             config.get('claude.api_key')
         )
-        self.slack_sender = SlackSender(
-            config.get('slack.webhook_url')
-        )
+        self.slack_router = SlackRouter.from_config()
+        self.slack_sender = self.slack_router.primary_sender
+
+        # 비동기 파이프라인 (pipeline.mode=async 일 때 사용)
+        self.pipeline_mode = config.get('pipeline.mode', 'sync')
+        self.async_pipeline = AsyncNewsPipeline(self.analyzer, self.slack_router)
+
+        # 프로파일링 (profiling.enabled일 때 대상 메서드를 감쌈)
+        profiler.install(self)
 
     def run(self):
+        import schedule  # 상주 실행에서만 사용
+
         self.is_running = True
 
         # 스케줄 등록
@@ -53,22 +73,64 @@ class NewsAnalysisScheduler(threading.Thread):
             self.run_analysis()
 
         while self.is_running:
+            # 이전 실행에서 전송하지 못한 슬랙 메시지 재전송
+            self.slack_router.flush_outbox()
             schedule.run_pending()
             time.sleep(60)
 
     def stop(self):
         self.is_running = False
 
-    def run_analysis(self):
-        """뉴스 분석 및 발송 실행"""
+    def run_analysis(self, now: Optional[datetime] = None):
+        """뉴스 분석 및 발송 실행 (실행 단위로 단계별 스팬/지표 기록, now: 분석 기준 시각)"""
+        with metrics.trace('run_analysis', pipeline_mode=self.pipeline_mode) as span:
+            if self.pipeline_mode == 'async':
+                outcome = self.run_analysis_async(now)
+            else:
+                outcome = self.run_analysis_sync(now)
+            span.set(status=outcome['status'], analyzed_count=outcome.get('analyzed_count', 0))
+            return outcome
+
+    def run_analysis_sync(self, now: Optional[datetime] = None):
+        """뉴스 분석 및 발송 순차 실행"""
         try:
-            current_datetime = datetime.now(KST)
+            current_datetime = now or datetime.now(KST)
             logger.info(f"뉴스 분석 시작: {current_datetime.strftime('%Y-%m-%d %H:%M')} KST")
 
-            analysis_result = self.analyzer.analyze_news_by_period()
+            stream_session = None
+            if config.get('claude.streaming', False):
+                # 헤드라인과 분석 포인트를 생성되는 대로 슬랙 발송
+                stream_session = self.slack_router.stream_session()
+                analysis_result = self.analyzer.analyze_news_by_period(
+                    on_selected=stream_session.send_headlines,
+                    on_analysis=stream_session.send_analysis,
+                    now=now
+                )
+            else:
+                analysis_result = self.analyzer.analyze_news_by_period(now=now)
 
             if analysis_result and analysis_result['news_items']:
-                self.slack_sender.send_news_summary(analysis_result)
+                if stream_session:
+                    sent = stream_session.finish(analysis_result.get('usage_info', {}))
+                else:
+                    sent = self.slack_router.send_news_summary(analysis_result)
+                metrics.annotate(delivered=sent)
+
+                if not sent:
+                    # 처리 위치를 확정하지 않으므로 다음 실행에서 같은 뉴스를 다시 조회
+                    error_msg = "슬랙 발송 실패로 처리 위치를 확정하지 않았습니다."
+                    logger.error(error_msg)
+                    return {"status": "undelivered", "message": error_msg}
+
+                if analysis_result.get('error'):
+                    # 분석 없이 헤드라인만 발송된 경우 다음 실행에서 같은 뉴스를 다시 분석
+                    error_msg = "Claude 분석 실패로 처리 위치를 확정하지 않았습니다."
+                    logger.error(error_msg)
+                    return {"status": "error", "message": error_msg}
+
+                # 발송까지 완료된 경우에만 처리 위치를 확정하여 실패 시 다음 실행에서 다시 조회
+                self.data_loader.commit_watermark(analysis_result.get('watermark'))
+                self.analyzer.mark_reported(analysis_result['news_items'])
 
                 logger.info(f"뉴스 분석 완료: {analysis_result['selected_count']}개 기사 발송")
                 return {
@@ -85,4 +147,13 @@ class NewsAnalysisScheduler(threading.Thread):
         except Exception as e:
             error_msg = f"뉴스 분석 중 오류 발생: {str(e)}"
             logger.error(error_msg, exc_info=True)
-            return {"status": "error", "message": error_msg}
\ No newline at end of file
+            return {"status": "error", "message": error_msg}
+
+    def run_analysis_async(self, now: Optional[datetime] = None):
+        """비동기 파이프라인으로 뉴스 분석 및 발송 실행"""
+        try:
+            return asyncio.run(self.async_pipeline.run(now))
+        except Exception as e:
+            error_msg = f"비동기 뉴스 분석 중 오류 발생: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            return {"status": "error", "message": error_msg}
@@ -0,0 +1,55 @@
+# modules/news_selector.py
+import heapq
+from operator import itemgetter
+from typing import Callable, Dict, List
+
+# (중요도 키, -카테고리 순서, -풀 내 위치, 뉴스) 중 정렬에 쓰는 부분
+_ORDER = itemgetter(0, 1, 2)
+
+
+class RankedPools:
+    """카테고리별 상위 뉴스를 한 번만 계산해 두고 여러 쿼터 조합의 선별에 재사용
+
+    각 풀에서 중요도 키를 한 번씩만 계산하고 heapq로 상위 limit개만 유지한다.
+    동점은 카테고리 순서, 풀 내 순서로 정해지므로 정렬 기반 선별과 같은 결과를 낸다.
+    """
+
+    def __init__(self, clustered_news: Dict[str, List[Dict]], rank_key: Callable[[Dict], tuple], limit: int):
+        self.limit = limit
+        self.ranked: Dict[str, List[tuple]] = {}
+        for category_index, (category, pool) in enumerate(clustered_news.items()):
+            decorated = (
+                (rank_key(news), -category_index, -position, news)
+                for position, news in enumerate(pool)
+            )
+            self.ranked[category] = heapq.nlargest(limit, decorated, key=_ORDER)
+
+    def select(self, min_counts: Dict[str, int], max_items: int) -> List[Dict]:
+        """카테고리별 최소 개수를 채운 뒤 남은 슬롯을 전체 중요도 순으로 채움"""
+        selected = []
+        selected_ids = set()
+        taken = {}
+
+        # 1단계: 카테고리별 최소 요구사항 충족
+        for category, required in min_counts.items():
+            head = self.ranked.get(category, [])[:min(required, self.limit)]
+            taken[category] = len(head)
+            for entry in head:
+                selected.append(entry[3])
+                selected_ids.add(entry[3]['news_id'])
+
+        # 2단계: 각 풀의 남은 부분을 병합하며 남은 슬롯 채우기
+        remaining_slots = max_items - len(selected)
+        if remaining_slots > 0:
+            tails = [ranked[taken.get(category, 0):] for category, ranked in self.ranked.items()]
+            for entry in heapq.merge(*tails, key=_ORDER, reverse=True):
+                news = entry[3]
+                if news['news_id'] in selected_ids:
+                    continue
+                selected.append(news)
+                selected_ids.add(news['news_id'])
+                remaining_slots -= 1
+                if remaining_slots == 0:
+                    break
+
+        return selected
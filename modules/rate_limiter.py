@@ -0,0 +1,202 @@
+# modules/rate_limiter.py
+import asyncio
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Optional
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 재시도 대상 HTTP 상태 (429: 요청 한도 초과, 529: 과부하)
+RETRYABLE_STATUS = (408, 409, 429, 500, 502, 503, 504, 529)
+THROTTLE_STATUS = (429, 529)
+
+
+class TokenBucket:
+    """분당 허용량 기반 토큰 버킷 (최대 1분치까지 누적)"""
+
+    def __init__(self, per_minute: float):
+        self.rate = per_minute / 60.0
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount만큼 사용 가능할 때까지 남은 시간 (즉시 가능하면 0)"""
+        self._refill(now)
+        # 한 번에 버킷 용량보다 큰 요청은 가득 찬 상태에서 허용
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float) -> None:
+        self.tokens -= amount
+
+
+class ClaudeRateLimiter:
+    """Claude API 클라이언트 측 요청/토큰 한도 및 재시도 관리
+
+    - 분당 요청 수(RPM)와 분당 토큰 수(TPM)를 각각 토큰 버킷으로 제한
+    - 429/529/일시 오류는 retry-after 헤더를 우선하고, 없으면 지터를 준 지수 백오프로 재시도
+    - 동시 요청 수는 AIMD 방식으로 조정 (한도 초과 시 절반으로 감소, 정상 응답이 이어지면 1씩 증가)
+    스레드와 asyncio 양쪽에서 같은 인스턴스를 사용할 수 있다.
+    """
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, requests_per_minute: int = 50, tokens_per_minute: int = 40000,
+                 max_concurrency: int = 4, min_concurrency: int = 1, max_retries: int = 5,
+                 backoff_base: float = 1.0, backoff_max: float = 60.0):
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        self.min_concurrency = max(1, min_concurrency)
+        self.max_concurrency = max(self.min_concurrency, max_concurrency)
+        self.concurrency = self.max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.in_flight = 0
+        self.retries = 0
+        self.throttled = 0
+        self._successes = 0
+        self._lock = threading.Lock()
+
+    def _try_acquire(self, estimated_tokens: int) -> float:
+        """슬롯과 버킷을 확보하면 0, 아니면 다시 시도할 때까지의 대기 시간 반환"""
+        with self._lock:
+            if self.in_flight >= self.concurrency:
+                return self.POLL_INTERVAL
+
+            now = time.monotonic()
+            wait = max(
+                self.request_bucket.wait_time(1, now),
+                self.token_bucket.wait_time(estimated_tokens, now)
+            )
+            if wait > 0:
+                return wait
+
+            self.request_bucket.consume(1)
+            self.token_bucket.consume(estimated_tokens)
+            self.in_flight += 1
+            return 0.0
+
+    def _release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def settle(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """응답 후 실제 사용 토큰과 추정치의 차이를 토큰 버킷에 반영"""
+        with self._lock:
+            self.token_bucket.consume(actual_tokens - estimated_tokens)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self.concurrency and self.concurrency < self.max_concurrency:
+                self.concurrency += 1
+                self._successes = 0
+                logger.info(f"Claude 동시 요청 한도 증가: {self.concurrency}")
+
+    def on_throttle(self) -> None:
+        with self._lock:
+            self.throttled += 1
+            self._successes = 0
+            reduced = max(self.min_concurrency, self.concurrency // 2)
+            if reduced != self.concurrency:
+                self.concurrency = reduced
+                logger.warning(f"Claude 동시 요청 한도 감소: {self.concurrency}")
+
+    @staticmethod
+    def status_code(error: Exception) -> Optional[int]:
+        return getattr(error, 'status_code', None)
+
+    def is_retryable(self, error: Exception) -> bool:
+        import anthropic  # 오류 처리 시점에는 SDK가 이미 로드되어 있음
+        if isinstance(error, anthropic.APIConnectionError):
+            return True
+        return self.status_code(error) in RETRYABLE_STATUS
+
+    @staticmethod
+    def retry_after(error: Exception) -> Optional[float]:
+        """응답의 retry-after 헤더 값 (초)"""
+        response = getattr(error, 'response', None)
+        if response is None:
+            return None
+        value = response.headers.get('retry-after')
+        try:
+            return max(0.0, float(value)) if value is not None else None
+        except ValueError:
+            return None
+
+    def backoff(self, attempt: int, error: Exception) -> float:
+        """재시도 대기 시간 (retry-after 우선, 없으면 full jitter 지수 백오프)"""
+        retry_after = self.retry_after(error)
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _handle_error(self, attempt: int, error: Exception) -> float:
+        """재시도 가능하면 대기 시간을 반환하고, 아니면 예외를 다시 발생"""
+        if attempt >= self.max_retries or not self.is_retryable(error):
+            raise error
+
+        if self.status_code(error) in THROTTLE_STATUS:
+            self.on_throttle()
+        delay = self.backoff(attempt, error)
+        with self._lock:
+            self.retries += 1
+        logger.warning(f"Claude API 재시도 ({attempt + 1}/{self.max_retries}), "
+                       f"{delay:.1f}초 후 재시도... 오류: {str(error)}")
+        return delay
+
+    def call(self, request: Callable, estimated_tokens: int = 0):
+        """한도 내에서 request()를 실행하고 재시도 가능한 오류는 백오프 후 재시도"""
+        attempt = 0
+        while True:
+            wait = self._try_acquire(estimated_tokens)
+            while wait > 0:
+                time.sleep(wait)
+                wait = self._try_acquire(estimated_tokens)
+
+            error = None
+            try:
+                result = request()
+            except Exception as e:
+                error = e
+            finally:
+                self._release()
+
+            if error is None:
+                self.on_success()
+                return result
+            time.sleep(self._handle_error(attempt, error))
+            attempt += 1
+
+    async def call_async(self, request: Callable[[], Awaitable], estimated_tokens: int = 0):
+        """call의 비동기 버전 (request는 매 시도마다 새 코루틴을 반환하는 함수)"""
+        attempt = 0
+        while True:
+            wait = self._try_acquire(estimated_tokens)
+            while wait > 0:
+                await asyncio.sleep(wait)
+                wait = self._try_acquire(estimated_tokens)
+
+            error = None
+            try:
+                result = await request()
+            except Exception as e:
+                error = e
+            finally:
+                self._release()
+
+            if error is None:
+                self.on_success()
+                return result
+            await asyncio.sleep(self._handle_error(attempt, error))
+            attempt += 1
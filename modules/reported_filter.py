@@ -0,0 +1,164 @@
+# modules/reported_filter.py
+import hashlib
+import math
+import os
+import struct
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
+from modules.news_clusterer import normalize_title
+from utils.config import KST
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 파일 헤더: 매직, 비트 수, 해시 함수 수, 추가된 항목 수
+_HEADER = struct.Struct('>4sQII')
+_MAGIC = b'BLM1'
+
+
+class BloomFilter:
+    """고정 크기 비트 배열 Bloom 필터 (blake2b 이중 해싱)
+
+    capacity개까지 추가해도 오탐률이 error_rate 이하가 되도록 비트 수와 해시 수를 정한다.
+    메모리는 추가한 항목 수와 무관하게 비트 배열 크기로 고정된다.
+    """
+
+    def __init__(self, capacity: int = 20000, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.size = max(64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> bool:
+        """항목 추가 (새 항목이면 True)"""
+        added = False
+        for position in self._positions(item):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not self.bits[byte] & mask:
+                self.bits[byte] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def to_bytes(self) -> bytes:
+        return _HEADER.pack(_MAGIC, self.size, self.hash_count, self.count) + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BloomFilter':
+        magic, size, hash_count, count = _HEADER.unpack_from(data)
+        bits = data[_HEADER.size:]
+        if magic != _MAGIC or len(bits) != (size + 7) // 8:
+            raise ValueError("Bloom 필터 파일 형식이 올바르지 않습니다")
+        bloom = cls.__new__(cls)
+        bloom.capacity = round(size * math.log(2) / hash_count)
+        bloom.size, bloom.hash_count, bloom.count = size, hash_count, count
+        bloom.bits = bytearray(bits)
+        return bloom
+
+
+class ReportedFilter:
+    """이미 발송한 뉴스 제목 지문을 날짜별 Bloom 필터로 보관
+
+    발송일(KST)마다 필터 파일 하나를 쓰고 retention_days가 지난 필터는 삭제하므로
+    조회 비용과 메모리는 발송 이력 길이와 무관하게 일정하다.
+    """
+
+    def __init__(self, directory: str, capacity: int = 20000, error_rate: float = 0.001,
+                 retention_days: int = 2):
+        self.directory = directory
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.retention_days = max(1, retention_days)
+        self._filters: Dict[str, BloomFilter] = {}
+        # 다음 만료 확인 시각 (다음 KST 자정의 epoch 초)
+        self._rotate_at = 0.0
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def fingerprint(title: str) -> Optional[str]:
+        """정규화한 제목 (비어 있으면 None)"""
+        normalized = ' '.join(normalize_title(title or '').split())
+        return normalized or None
+
+    def _path(self, day: str) -> str:
+        return os.path.join(self.directory, f"{day}.bloom")
+
+    def _load(self) -> None:
+        if not os.path.exists(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if not name.endswith('.bloom'):
+                continue
+            try:
+                with open(os.path.join(self.directory, name), 'rb') as f:
+                    self._filters[name[:-6]] = BloomFilter.from_bytes(f.read())
+            except (OSError, ValueError, struct.error) as e:
+                logger.error(f"발송 이력 필터 로드 실패: {name} ({str(e)})")
+        self._rotate(datetime.now(KST))
+        if self._filters:
+            logger.info(f"발송 이력 필터 로드: {', '.join(sorted(self._filters))}")
+
+    def _rotate(self, now: datetime) -> None:
+        """보관 기간이 지난 날짜의 필터 삭제"""
+        next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        self._rotate_at = KST.localize(next_midnight).timestamp()
+        oldest = (now - timedelta(days=self.retention_days - 1)).strftime('%Y-%m-%d')
+        for day in [day for day in self._filters if day < oldest]:
+            del self._filters[day]
+            try:
+                os.remove(self._path(day))
+            except FileNotFoundError:
+                pass
+            logger.info(f"발송 이력 필터 만료: {day}")
+
+    def _save(self, day: str) -> None:
+        """필터 저장 (임시 파일 작성 후 교체)"""
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory)
+        tmp_path = f"{self._path(day)}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(self._filters[day].to_bytes())
+        os.replace(tmp_path, self._path(day))
+
+    def contains(self, title: str, now: Optional[datetime] = None) -> bool:
+        """보관 기간 안에 발송한 제목인지 확인 (상주 실행 중 날짜가 바뀌면 만료된 필터를 먼저 삭제)"""
+        fingerprint = self.fingerprint(title)
+        if fingerprint is None:
+            return False
+        with self._lock:
+            # 조회마다 현재 시각을 KST로 만들지 않도록 자정이 지난 경우에만 만료 확인
+            if now is not None or time.time() >= self._rotate_at:
+                self._rotate(now or datetime.now(KST))
+            return any(fingerprint in bloom for bloom in self._filters.values())
+
+    def __contains__(self, title: str) -> bool:
+        return self.contains(title)
+
+    def add(self, titles: Iterable[str], now: Optional[datetime] = None) -> int:
+        """발송한 제목을 오늘 필터에 기록하고 새로 추가된 수 반환"""
+        now = now or datetime.now(KST)
+        today = now.strftime('%Y-%m-%d')
+        with self._lock:
+            self._rotate(now)
+            bloom = self._filters.setdefault(today, BloomFilter(self.capacity, self.error_rate))
+            added = sum(1 for title in titles
+                        if (fingerprint := self.fingerprint(title)) and bloom.add(fingerprint))
+            if added:
+                self._save(today)
+            if bloom.count > bloom.capacity:
+                logger.warning(f"발송 이력 필터 용량 초과 ({bloom.count}/{bloom.capacity}), 오탐률이 증가합니다")
+        return added
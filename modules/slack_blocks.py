@@ -0,0 +1,130 @@
+# modules/slack_blocks.py
+from typing import Dict, Iterable, Iterator, List
+
+# 슬랙 Block Kit 제한
+MAX_BLOCKS = 50  # 메시지당 블록 수
+MAX_SECTION_TEXT = 3000  # section 블록 텍스트 길이
+MAX_HEADER_TEXT = 150  # header 블록 텍스트 길이
+MAX_FALLBACK_TEXT = 150  # 알림용 대체 텍스트 길이
+
+IMPACT_SYMBOLS = {'Negative': "🔴", 'Positive': "🟢"}
+
+
+def escape_mrkdwn(text: str) -> str:
+    """mrkdwn 제어 문자 이스케이프"""
+    return str(text).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def chunk_lines(lines: Iterable[str], limit: int) -> Iterator[str]:
+    """줄 목록을 limit 이하 길이의 덩어리로 묶음 (한 번 순회, 긴 줄은 강제로 자름)"""
+    current: List[str] = []
+    size = 0
+    for line in lines:
+        while len(line) > limit:
+            if current:
+                yield '\n'.join(current)
+                current, size = [], 0
+            yield line[:limit]
+            line = line[limit:]
+        if not current and not line.strip():
+            # 덩어리 앞의 빈 줄은 버림
+            continue
+        added = len(line) + (1 if current else 0)
+        if size + added > limit:
+            yield '\n'.join(current)
+            current, size = [line], len(line)
+        else:
+            current.append(line)
+            size += added
+    if current:
+        yield '\n'.join(current)
+
+
+class SlackBlockRenderer:
+    """분석 결과를 Block Kit 블록으로 렌더링하고 메시지 제한에 맞게 페이로드로 묶음
+
+    헤드라인은 뉴스 섹션마다, 분석은 포인트마다 section 블록을 만들고,
+    긴 텍스트는 줄 단위로 3000자 이하 블록으로 나눈다.
+    """
+
+    @staticmethod
+    def header(text: str) -> Dict:
+        return {'type': 'header', 'text': {'type': 'plain_text', 'text': text[:MAX_HEADER_TEXT], 'emoji': True}}
+
+    @staticmethod
+    def sections(lines: Iterable[str]) -> List[Dict]:
+        """mrkdwn 줄 목록을 제한 길이 이하의 section 블록들로 변환"""
+        return [{'type': 'section', 'text': {'type': 'mrkdwn', 'text': chunk}}
+                for chunk in chunk_lines(lines, MAX_SECTION_TEXT)]
+
+    def headline_blocks(self, news_items: List[Dict]) -> List[Dict]:
+        """뉴스 섹션별 헤드라인 블록"""
+        news_by_section: Dict[str, List[Dict]] = {}
+        for news in news_items:
+            news_by_section.setdefault(news.get('section', '기타'), []).append(news)
+
+        blocks = [self.header(f"📰 주요 뉴스 헤드라인 ({len(news_items)}건)")]
+        for section, items in news_by_section.items():
+            lines = [f"*[{escape_mrkdwn(section)}]*"]
+            lines.extend(f"• <{news['link']}|{escape_mrkdwn(news['title'])}>" for news in items)
+            blocks.extend(self.sections(lines))
+        return blocks
+
+    def analysis_header_blocks(self) -> List[Dict]:
+        return [{'type': 'divider'}, self.header("📊 시장 영향도 분석")]
+
+    def analysis_point_blocks(self, idx: int, analysis: Dict) -> List[Dict]:
+        """분석 포인트 하나의 블록"""
+        impact_symbol = IMPACT_SYMBOLS.get(analysis['impact'], "⚪")
+        return self.sections([
+            f"*{idx}. {escape_mrkdwn(analysis['topic'])}* {impact_symbol}",
+            f"• 영향: {escape_mrkdwn(analysis['impact'])} ({analysis['score']})",
+            f"• 영향권: {escape_mrkdwn(', '.join(analysis['affected_sectors']))}",
+            f"• 지속기간: {escape_mrkdwn(analysis['duration'])}",
+            f"• 분석: {escape_mrkdwn(analysis['analysis'])}"
+        ])
+
+    def text_blocks(self, text: str) -> List[Dict]:
+        """포매팅된 일반 텍스트 섹션(사용 정보 등)을 구분선과 블록으로 변환"""
+        return [{'type': 'divider'}] + self.sections(escape_mrkdwn(text.strip('\n')).split('\n'))
+
+    def render(self, news_items: List[Dict], market_analysis: List[Dict], usage_text: str = '') -> List[Dict]:
+        """전체 분석 결과 블록"""
+        blocks = self.headline_blocks(news_items)
+        if market_analysis:
+            blocks.extend(self.analysis_header_blocks())
+            for idx, analysis in enumerate(market_analysis, 1):
+                blocks.extend(self.analysis_point_blocks(idx, analysis))
+        if usage_text:
+            blocks.extend(self.text_blocks(usage_text))
+        return blocks
+
+    @staticmethod
+    def fallback_text(blocks: List[Dict]) -> str:
+        """알림/미지원 클라이언트용 대체 텍스트 (첫 텍스트 블록)"""
+        for block in blocks:
+            if 'text' in block:
+                return block['text']['text'][:MAX_FALLBACK_TEXT]
+        return "뉴스 분석"
+
+    def pack(self, blocks: List[Dict]) -> List[Dict]:
+        """블록을 메시지당 블록 수 제한에 맞춰 순서대로 웹훅 페이로드로 묶음 (한 번 순회)"""
+        chunks: List[List[Dict]] = []
+        current: List[Dict] = []
+        for block in blocks:
+            if len(current) == MAX_BLOCKS:
+                # 제목/구분선이 메시지 끝에 홀로 남지 않도록 다음 메시지로 넘김
+                carried = []
+                while current and current[-1]['type'] in ('header', 'divider'):
+                    carried.insert(0, current.pop())
+                chunks.append(current or carried)
+                current = carried if current else []
+            current.append(block)
+        if current:
+            chunks.append(current)
+
+        return [{
+            'blocks': chunk,
+            'text': self.fallback_text(chunk),
+            'unfurl_links': False  # 링크 미리보기 비활성화
+        } for chunk in chunks]
@@ -0,0 +1,212 @@
+# modules/slack_delivery.py
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional
+from utils.logger import setup_logger
+from utils.metrics import PipelineMetrics
+
+logger = setup_logger(__name__)
+metrics = PipelineMetrics.get_instance()
+
+# 재시도 대상 HTTP 상태 (요청 한도 초과, 일시적 서버 오류)
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+
+
+class SlackDeliveryError(Exception):
+    """재시도 후에도 웹훅 전송에 실패한 경우 (retryable=False면 다시 보내도 실패하는 요청)"""
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class SlackOutbox:
+    """미발송 메시지를 로컬 디스크에 보관 (메시지당 JSON 파일 하나, 파일명 순서 = 등록 순서)"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+    def _path(self, entry_id: str) -> str:
+        return os.path.join(self.directory, f"{entry_id}.json")
+
+    def add(self, webhook_url: str, payloads: List[Dict]) -> str:
+        """전송 전 메시지 등록 후 항목 ID 반환"""
+        entry_id = f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}"
+        self.save(entry_id, {'webhook_url': webhook_url, 'payloads': payloads, 'sent': 0})
+        return entry_id
+
+    def pending(self) -> List[str]:
+        """미발송 항목 ID (등록 순)"""
+        return sorted(name[:-5] for name in os.listdir(self.directory) if name.endswith('.json'))
+
+    def load(self, entry_id: str) -> Optional[Dict]:
+        try:
+            with open(self._path(entry_id), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"슬랙 아웃박스 항목 로드 실패: {entry_id} ({str(e)})")
+            return None
+
+    def save(self, entry_id: str, entry: Dict) -> None:
+        """항목 저장 (임시 파일 작성 후 교체)"""
+        tmp_path = f"{self._path(entry_id)}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, self._path(entry_id))
+
+    def remove(self, entry_id: str) -> None:
+        try:
+            os.remove(self._path(entry_id))
+        except FileNotFoundError:
+            pass
+
+
+class SlackDelivery:
+    """슬랙 웹훅 전송 (keep-alive 세션, 웹훅별 전송 간격, 429 Retry-After 재시도, 디스크 아웃박스)
+
+    아웃박스를 사용하면 메시지를 먼저 디스크에 기록한 뒤 파트 단위로 전송 위치를 갱신한다.
+    전송에 실패한 메시지는 남겨 두었다가 다음 flush에서 남은 파트부터 이어서 보내며,
+    같은 웹훅의 이후 메시지는 앞선 메시지가 모두 전송될 때까지 대기하므로 순서가 유지된다.
+    """
+
+    # 같은 웹훅을 사용하는 인스턴스 간 공유되는 다음 전송 가능 시각
+    _next_slots: Dict[str, float] = {}
+    _slots_lock = threading.Lock()
+
+    def __init__(self, timeout: float = 10, min_interval: float = 1.0, max_retries: int = 3,
+                 retry_delay: float = 5, outbox_dir: Optional[str] = None):
+        self.timeout = timeout
+        self.min_interval = min_interval
+        self.max_retries = max(1, max_retries)
+        self.retry_delay = retry_delay
+
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        self.outbox = SlackOutbox(outbox_dir) if outbox_dir else None
+        self._flush_lock = threading.Lock()
+
+    @property
+    def session(self):
+        """keep-alive HTTP 세션 (requests는 첫 전송 시 import)"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    self._session = session
+        return self._session
+
+    def _wait_for_slot(self, webhook_url: str) -> None:
+        """웹훅별 최소 전송 간격 유지"""
+        with self._slots_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slots.get(webhook_url, 0.0))
+            self._next_slots[webhook_url] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def _defer(self, webhook_url: str, seconds: float) -> None:
+        """웹훅의 다음 전송 가능 시각을 seconds 이후로 미룸 (다른 전송에도 적용)"""
+        with self._slots_lock:
+            resume_at = time.monotonic() + seconds
+            self._next_slots[webhook_url] = max(self._next_slots.get(webhook_url, 0.0), resume_at)
+
+    @staticmethod
+    def retry_after(response) -> Optional[float]:
+        """Retry-After 헤더의 대기 시간 (초)"""
+        try:
+            return max(0.0, float(response.headers.get('Retry-After')))
+        except (TypeError, ValueError):
+            return None
+
+    def post_part(self, webhook_url: str, payload: Dict) -> None:
+        """파트 하나 전송 (429/5xx/연결 오류는 재시도, 실패 시 SlackDeliveryError)"""
+        import requests
+        for attempt in range(1, self.max_retries + 1):
+            self._wait_for_slot(webhook_url)
+            wait_time = self.retry_delay * attempt
+            try:
+                response = self.session.post(webhook_url, json=payload, timeout=self.timeout)
+            except requests.RequestException as e:
+                error = str(e)
+            else:
+                if response.status_code < 300:
+                    return
+                error = f"HTTP {response.status_code}: {response.text[:200]}"
+                if response.status_code not in RETRYABLE_STATUS:
+                    raise SlackDeliveryError(error, retryable=False)
+                if response.status_code == 429:
+                    wait_time = self.retry_after(response) or wait_time
+
+            if attempt < self.max_retries:
+                metrics.increment('retries')
+                logger.warning(f"슬랙 전송 실패 ({attempt}/{self.max_retries}), "
+                               f"{wait_time:.1f}초 후 재시도... 오류: {error}")
+                self._defer(webhook_url, wait_time)
+
+        raise SlackDeliveryError(f"슬랙 전송 최대 재시도 횟수 초과: {error}")
+
+    def deliver(self, webhook_url: str, payloads: List[Dict]) -> bool:
+        """파트를 순서대로 전송
+
+        아웃박스가 없으면 실패 시 SlackDeliveryError를 올린다.
+        아웃박스가 있으면 디스크에 기록 후 전송하며, 모두 전송되면 True,
+        다음 flush로 미뤄지면 False를 반환한다.
+        """
+        if self.outbox is None:
+            for payload in payloads:
+                self.post_part(webhook_url, payload)
+            return True
+
+        entry_id = self.outbox.add(webhook_url, payloads)
+        self.flush()
+        return entry_id not in self.outbox.pending()
+
+    def flush(self) -> int:
+        """아웃박스의 미발송 메시지를 등록 순서대로 전송하고 완료한 메시지 수 반환"""
+        if self.outbox is None:
+            return 0
+
+        delivered = 0
+        blocked = set()
+        with self._flush_lock:
+            for entry_id in self.outbox.pending():
+                entry = self.outbox.load(entry_id)
+                if entry is None or entry['webhook_url'] in blocked:
+                    continue
+                if self._send_entry(entry_id, entry):
+                    self.outbox.remove(entry_id)
+                    delivered += 1
+                else:
+                    # 순서 유지를 위해 같은 웹훅의 이후 메시지는 다음 flush로 미룸
+                    blocked.add(entry['webhook_url'])
+
+        if delivered:
+            logger.info(f"슬랙 아웃박스 전송 완료: {delivered}건")
+        return delivered
+
+    def _send_entry(self, entry_id: str, entry: Dict) -> bool:
+        """남은 파트를 전송하며 파트마다 전송 위치 기록 (재시도할 수 있는 실패면 False)"""
+        payloads = entry['payloads']
+        while entry['sent'] < len(payloads):
+            try:
+                self.post_part(entry['webhook_url'], payloads[entry['sent']])
+            except SlackDeliveryError as e:
+                if e.retryable:
+                    logger.warning(f"슬랙 아웃박스 전송 보류 ({entry['sent']}/{len(payloads)} 파트 전송됨): {str(e)}")
+                    return False
+                # 다시 보내도 실패하는 파트는 건너뜀
+                logger.error(f"슬랙 메시지 파트 전송 불가, 건너뜀: {str(e)}")
+            entry['sent'] += 1
+            self.outbox.save(entry_id, entry)
+        return True
@@ -0,0 +1,206 @@
+# modules/slack_router.py
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from modules.slack_sender import SlackSender, SlackStreamSession
+from utils.config import Config
+from utils.logger import setup_logger
+from utils.metrics import PipelineMetrics
+
+logger = setup_logger(__name__)
+config = Config.get_instance()
+metrics = PipelineMetrics.get_instance()
+
+
+def load_destinations(path: str) -> List[Dict]:
+    """슬랙 발송 목적지 JSON 파일 로드"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            destinations = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error(f"슬랙 목적지 파일 로드 실패: {path} ({str(e)})")
+        raise
+
+    if not isinstance(destinations, list) or not all(
+            isinstance(d, dict) and d.get('webhook_url') for d in destinations):
+        raise ValueError(f"슬랙 목적지 파일 형식이 올바르지 않습니다: {path}")
+    names = [d.get('name') for d in destinations]
+    if len(destinations) > 1 and (None in names or len(set(names)) != len(names)):
+        raise ValueError(f"여러 목적지를 사용할 때는 목적지마다 고유한 name이 필요합니다: {path}")
+    logger.info(f"슬랙 목적지 {len(destinations)}개 로드: {', '.join(str(name) for name in names)}")
+    return destinations
+
+
+class DestinationFilter:
+    """목적지별 뉴스/분석 포인트 필터 (섹션, 카테고리, 최소 영향 점수)"""
+
+    def __init__(self, sections: Optional[List[str]] = None, categories: Optional[List[str]] = None,
+                 min_score: int = 0, include_usage: bool = True):
+        self.sections = frozenset(sections) if sections else None
+        self.categories = frozenset(categories) if categories else None
+        self.min_score = min_score
+        self.include_usage = include_usage
+
+    @property
+    def key(self) -> tuple:
+        """같은 필터를 쓰는 목적지끼리 렌더링 결과를 공유하기 위한 키"""
+        return (self.sections, self.categories, self.min_score, self.include_usage)
+
+    def accepts_news(self, news: Dict) -> bool:
+        if self.sections is not None and news.get('section', '기타') not in self.sections:
+            return False
+        return self.categories is None or news.get('category', '기타') in self.categories
+
+    def accepts_analysis(self, analysis: Dict) -> bool:
+        """영향 점수 절댓값이 min_score 이상인 분석 포인트"""
+        try:
+            return abs(float(analysis.get('score', 0))) >= self.min_score
+        except (TypeError, ValueError):
+            return self.min_score <= 0
+
+    def apply(self, analysis_result: Dict) -> Dict:
+        """필터를 적용한 분석 결과 사본"""
+        return {
+            **analysis_result,
+            'news_items': [news for news in analysis_result.get('news_items', []) if self.accepts_news(news)],
+            'market_analysis': [analysis for analysis in analysis_result.get('market_analysis', [])
+                                if self.accepts_analysis(analysis)],
+            'usage_info': analysis_result.get('usage_info', {}) if self.include_usage else {}
+        }
+
+
+class _RouteGroup:
+    """형식과 필터가 같은 목적지 묶음 (렌더링은 그룹당 한 번)"""
+
+    def __init__(self, message_format: str, destination_filter: DestinationFilter):
+        self.message_format = message_format
+        self.filter = destination_filter
+        self.senders: List[SlackSender] = []
+        self.names: List[str] = []
+
+
+class SlackRouter:
+    """한 번의 분석 결과를 여러 슬랙 목적지로 동시에 발송
+
+    목적지마다 필터와 메시지 형식을 지정할 수 있으며, 형식과 필터가 같은 목적지는
+    한 번 렌더링한 페이로드를 공유한다. 목적지 설정이 없으면 slack.webhook_url 하나로 발송한다.
+    """
+
+    def __init__(self, destinations: List[Dict]):
+        if not destinations:
+            raise ValueError("슬랙 목적지가 없습니다")
+
+        groups: Dict[tuple, _RouteGroup] = {}
+        self.senders: List[SlackSender] = []
+        for destination in destinations:
+            name = destination.get('name')
+            sender = SlackSender(
+                destination['webhook_url'],
+                message_format=destination.get('format'),
+                outbox_name=name if len(destinations) > 1 else None
+            )
+            destination_filter = DestinationFilter(
+                sections=destination.get('sections'),
+                categories=destination.get('categories'),
+                min_score=destination.get('min_score', 0),
+                include_usage=destination.get('include_usage', True)
+            )
+            group_key = (sender.message_format, destination_filter.key)
+            if group_key not in groups:
+                groups[group_key] = _RouteGroup(sender.message_format, destination_filter)
+            groups[group_key].senders.append(sender)
+            groups[group_key].names.append(name or 'default')
+            self.senders.append(sender)
+
+        self.groups = list(groups.values())
+        self.executor = ThreadPoolExecutor(
+            max_workers=min(len(self.senders), 8),
+            thread_name_prefix='slack-router'
+        )
+
+    @classmethod
+    def from_config(cls) -> 'SlackRouter':
+        """slack.destinations_path가 있으면 목적지 파일, 없으면 slack.webhook_url 하나로 구성"""
+        path = config.get('slack.destinations_path')
+        if path:
+            return cls(load_destinations(path))
+        return cls([{'webhook_url': config.get('slack.webhook_url')}])
+
+    @property
+    def primary_sender(self) -> SlackSender:
+        """첫 번째 목적지 (단일 목적지 전용 경로에서 사용)"""
+        return self.senders[0]
+
+    def _send_group(self, group: _RouteGroup, analysis_result: Dict) -> bool:
+        filtered = group.filter.apply(analysis_result)
+        if not filtered['news_items'] and not filtered['market_analysis']:
+            logger.info(f"필터 결과가 비어 발송 생략: {', '.join(group.names)}")
+            return True
+
+        # 그룹당 한 번 렌더링 후 목적지별로 동시에 전송
+        with metrics.span('render', format=group.message_format) as span:
+            payloads = group.senders[0].build_summary_payloads(filtered)
+            span.set(payloads=len(payloads))
+        with metrics.span('slack_send', format=group.message_format) as span:
+            deliver = metrics.propagate(lambda sender: self._deliver(sender, payloads))
+            outcomes = list(self.executor.map(deliver, group.senders))
+            span.set(destinations=len(outcomes), failed_destinations=outcomes.count(False))
+        logger.info(f"슬랙 발송 ({group.message_format}, 뉴스 {len(filtered['news_items'])}건, "
+                    f"분석 {len(filtered['market_analysis'])}개): "
+                    f"{', '.join(name for name, ok in zip(group.names, outcomes) if ok)}")
+        return all(outcomes)
+
+    @staticmethod
+    def _deliver(sender: SlackSender, payloads: List[Dict]) -> bool:
+        try:
+            if not sender.deliver(payloads):
+                logger.warning(f"슬랙 메시지 전송 실패, 아웃박스에 보관 후 다음 주기에 재전송: {sender.webhook_url[:40]}")
+            return True
+        except Exception as e:
+            logger.error(f"슬랙 메시지 전송 오류: {str(e)}")
+            return False
+
+    def send_news_summary(self, analysis_result: Dict) -> bool:
+        """모든 목적지로 분석 결과 발송 (한 곳이라도 실패하면 False)"""
+        if len(self.groups) == 1:
+            outcomes = [self._send_group(self.groups[0], analysis_result)]
+        else:
+            # 그룹 안의 전송도 같은 풀을 쓰므로 그룹 단위는 별도 스레드에서 진행
+            send_group = metrics.propagate(lambda group: self._send_group(group, analysis_result))
+            with ThreadPoolExecutor(max_workers=len(self.groups), thread_name_prefix='slack-route') as executor:
+                outcomes = list(executor.map(send_group, self.groups))
+        return all(outcomes)
+
+    def stream_session(self) -> 'RoutedStreamSession':
+        return RoutedStreamSession(self)
+
+    def flush_outbox(self) -> int:
+        """모든 목적지의 아웃박스 재전송"""
+        return sum(sender.flush_outbox() for sender in self.senders)
+
+
+class RoutedStreamSession:
+    """스트리밍 발송을 목적지 그룹별로 필터링해 전달 (SlackStreamSession과 같은 인터페이스)"""
+
+    def __init__(self, router: SlackRouter):
+        self.routes = [
+            (group.filter, SlackStreamSession(group.senders[0], group.senders, router.executor))
+            for group in router.groups
+        ]
+
+    def send_headlines(self, news_items: List[Dict]) -> None:
+        for destination_filter, session in self.routes:
+            selected = [news for news in news_items if destination_filter.accepts_news(news)]
+            if selected:
+                session.send_headlines(selected)
+
+    def send_analysis(self, analysis: Dict) -> None:
+        for destination_filter, session in self.routes:
+            if destination_filter.accepts_analysis(analysis):
+                session.send_analysis(analysis)
+
+    def finish(self, usage_info: Dict) -> bool:
+        succeeded = True
+        for destination_filter, session in self.routes:
+            succeeded &= session.finish(usage_info if destination_filter.include_usage else {})
+        return succeeded
@@ -1,106 +1,248 @@
 # modules/slack_sender.py
-import requests
-from typing import Dict
+import os
+from concurrent.futures import Executor
+from typing import Dict, List, Optional
+from modules.slack_blocks import SlackBlockRenderer, chunk_lines
+from modules.slack_delivery import SlackDelivery
 from utils.config import Config
 from utils.logger import setup_logger
+from utils.metrics import PipelineMetrics
 
 logger = setup_logger(__name__)
 config = Config.get_instance()
+metrics = PipelineMetrics.get_instance()
 
 
 class SlackSender:
-    def __init__(self, webhook_url: str):
+    MESSAGE_FORMATS = ('text', 'blocks')
+
+    def __init__(self, webhook_url: str, message_format: Optional[str] = None, outbox_name: Optional[str] = None):
         self.webhook_url = webhook_url
+        self.message_format = message_format or config.get('slack.message_format', 'text')
+        if self.message_format not in self.MESSAGE_FORMATS:
+            raise ValueError(f"지원하지 않는 슬랙 메시지 형식입니다: {self.message_format}")
+        self.block_renderer = SlackBlockRenderer()
         self.max_retries = config.get('retry.max_retries', 3)
         self.retry_delay = config.get('retry.retry_delay', 5)
-
-    def format_news_message(self, analysis_result: Dict) -> str:
-        news_items = analysis_result.get('news_items', [])
-        market_analysis = analysis_result.get('market_analysis', [])
-        usage_info = analysis_result.get('usage_info', {})
-
+        self.delivery = SlackDelivery(
+            timeout=config.get('slack.timeout', 10),
+            min_interval=config.get('slack.min_interval', 1.0),
+            max_retries=self.max_retries,
+            retry_delay=self.retry_delay,
+            outbox_dir=self._outbox_dir(outbox_name)
+        )
+
+    @staticmethod
+    def _outbox_dir(outbox_name: Optional[str]) -> Optional[str]:
+        """아웃박스 디렉토리 (여러 목적지를 쓰면 목적지별 하위 디렉토리)"""
+        if not config.get('slack.outbox_enabled', False):
+            return None
+        outbox_dir = config.get('slack.outbox_dir')
+        return os.path.join(outbox_dir, outbox_name) if outbox_name else outbox_dir
+
+    def format_headlines(self, news_items: List[Dict]) -> str:
+        """뉴스 헤드라인 섹션 포매팅"""
         # 섹션별로 뉴스 그룹화
         news_by_section = {}
         for news in news_items:
-            section = news.get('section', '기타')
-            if section not in news_by_section:
-                news_by_section[section] = []
-            news_by_section[section].append(news)
+            news_by_section.setdefault(news.get('section', '기타'), []).append(news)
 
         # 뉴스 헤드라인 섹션 구성
-        message = f"📰 주요 뉴스 헤드라인 ({len(news_items)}건)\n"
+        lines = [f"📰 주요 뉴스 헤드라인 ({len(news_items)}건)", "----------------------------"]
+        for section, items in news_by_section.items():
+            lines.append(f"\n[{section}]")
+            # 링크 형식으로 제목 포맷팅
+            lines.extend(f"• <{news['link']}|{news['title']}>" for news in items)
+
+        return '\n'.join(lines) + '\n'
+
+    def format_analysis_header(self) -> str:
+        return "\n\n📊 시장 영향도 분석\n----------------------------\n"
+
+    def format_analysis_point(self, idx: int, analysis: Dict) -> str:
+        """시장 영향도 분석 포인트 하나 포매팅"""
+        impact_symbol = "🔴" if analysis['impact'] == "Negative" else "🟢" if analysis['impact'] == "Positive" else "⚪"
+        message = f"\n{idx}. {analysis['topic']} {impact_symbol}\n"
+        message += f"• 영향: {analysis['impact']} ({analysis['score']})\n"
+        message += f"• 영향권: {', '.join(analysis['affected_sectors'])}\n"
+        message += f"• 지속기간: {analysis['duration']}\n"
+        message += f"• 분석: {analysis['analysis']}\n"
+        return message
+
+    def format_usage_info(self, usage_info: Dict) -> str:
+        """API 사용 정보 섹션 포매팅"""
+        message = "\n\n⚙️ API 사용 정보\n"
         message += "----------------------------\n"
+        message += f"• 토큰 사용량: {usage_info.get('total_tokens', 0):,} tokens "
+        message += f"(입력: {usage_info.get('input_tokens', 0):,}, "
+        message += f"출력: {usage_info.get('output_tokens', 0):,})\n"
+        message += f"• API 호출 시간: {usage_info.get('api_time', 0):.1f}초\n"
+        message += f"• API 사용 비용: ${usage_info.get('cost_usd', 0):.4f}\n"
+        if 'projected_input_tokens' in usage_info:
+            message += f"• 예상 입력: {usage_info['projected_input_tokens']:,} tokens (${usage_info.get('projected_cost_usd', 0):.4f})"
+            if usage_info.get('trimmed_items'):
+                message += f", 예산 초과로 {usage_info['trimmed_items']}건 제외"
+            message += "\n"
+        if usage_info.get('cached'):
+            message += f"• 캐시된 분석 재사용 ({usage_info.get('cache_match')}, 절감 비용: ${usage_info.get('saved_cost_usd', 0):.4f})\n"
+        return message
 
-        for section, items in news_by_section.items():
-            message += f"\n[{section}]\n"
-            for news in items:
-                # 링크 형식으로 제목 포맷팅
-                message += f"• <{news['link']}|{news['title']}>\n"
+    def format_news_message(self, analysis_result: Dict) -> str:
+        news_items = analysis_result.get('news_items', [])
+        market_analysis = analysis_result.get('market_analysis', [])
+        usage_info = analysis_result.get('usage_info', {})
+
+        sections = [self.format_headlines(news_items)]
 
         # 시장 영향도 분석 섹션 구성
         if market_analysis:
-            message += "\n\n📊 시장 영향도 분석\n"
-            message += "----------------------------\n"
-
-            for idx, analysis in enumerate(market_analysis, 1):
-                impact_symbol = "🔴" if analysis['impact'] == "Negative" else "🟢" if analysis[
-                                                                                        'impact'] == "Positive" else "⚪"
-                message += f"\n{idx}. {analysis['topic']} {impact_symbol}\n"
-                message += f"• 영향: {analysis['impact']} ({analysis['score']})\n"
-                message += f"• 영향권: {', '.join(analysis['affected_sectors'])}\n"
-                message += f"• 지속기간: {analysis['duration']}\n"
-                message += f"• 분석: {analysis['analysis']}\n"
+            sections.append(self.format_analysis_header())
+            sections.extend(self.format_analysis_point(idx, analysis)
+                            for idx, analysis in enumerate(market_analysis, 1))
 
         # API 사용 정보 추가
         if usage_info:
-            message += "\n\n⚙️ API 사용 정보\n"
-            message += "----------------------------\n"
-            message += f"• 토큰 사용량: {usage_info.get('total_tokens', 0):,} tokens "
-            message += f"(입력: {usage_info.get('input_tokens', 0):,}, "
-            message += f"출력: {usage_info.get('output_tokens', 0):,})\n"
-            message += f"• API 호출 시간: {usage_info.get('api_time', 0):.1f}초\n"
-            message += f"• API 사용 비용: ${usage_info.get('cost_usd', 0):.4f}\n"
+            sections.append(self.format_usage_info(usage_info))
 
-        return message
+        return ''.join(sections)
+
+    def render_blocks(self, analysis_result: Dict) -> List[Dict]:
+        """분석 결과를 Block Kit 블록으로 렌더링"""
+        usage_info = analysis_result.get('usage_info', {})
+        return self.block_renderer.render(
+            analysis_result.get('news_items', []),
+            analysis_result.get('market_analysis', []),
+            self.format_usage_info(usage_info) if usage_info else ''
+        )
 
     def split_message(self, message: str, max_length: int = 3000) -> list:
-        """긴 메시지를 슬랙 제한에 맞게 분할"""
+        """긴 메시지를 슬랙 제한에 맞게 줄 단위로 분할"""
         if len(message) <= max_length:
             return [message]
-
-        parts = []
-        while message:
-            if len(message) <= max_length:
-                parts.append(message)
-                break
-
-            # 최대 길이에서 가장 가까운 줄바꿈 위치 찾기
-            split_index = message.rfind('\n', 0, max_length)
-            if split_index == -1:
-                split_index = max_length
-
-            parts.append(message[:split_index])
-            message = message[split_index:].lstrip()
-
-        return parts
+        return list(chunk_lines(message.split('\n'), max_length))
+
+    def build_payloads(self, message: str) -> List[Dict]:
+        """메시지를 분할하여 웹훅 요청 본문 목록 생성"""
+        return [{
+            'text': part,
+            'unfurl_links': False  # 링크 미리보기 비활성화
+        } for part in self.split_message(message)]
+
+    def deliver(self, payloads: List[Dict]) -> bool:
+        """페이로드를 순서대로 웹훅 전송 (아웃박스 보관 후 다음 주기로 미뤄지면 False)"""
+        return self.delivery.deliver(self.webhook_url, payloads)
+
+    def post_message(self, message: str) -> bool:
+        """메시지를 분할하여 순서대로 웹훅 전송"""
+        return self.deliver(self.build_payloads(message))
+
+    def post_blocks(self, blocks: List[Dict]) -> bool:
+        """블록을 메시지 제한에 맞게 묶어 순서대로 웹훅 전송"""
+        return self.deliver(self.block_renderer.pack(blocks))
+
+    def build_summary_payloads(self, analysis_result: Dict) -> List[Dict]:
+        """설정된 메시지 형식(text/blocks)으로 분석 결과 페이로드 생성"""
+        if self.message_format == 'blocks':
+            return self.block_renderer.pack(self.render_blocks(analysis_result))
+        return self.build_payloads(self.format_news_message(analysis_result))
+
+    def flush_outbox(self) -> int:
+        """아웃박스에 남은 미발송 메시지 재전송"""
+        try:
+            return self.delivery.flush()
+        except Exception as e:
+            logger.error(f"슬랙 아웃박스 재전송 오류: {str(e)}")
+            return 0
 
     def send_news_summary(self, analysis_result: Dict):
-        """분석된 뉴스 요약을 슬랙 웹훅으로 전송"""
+        """분석된 뉴스 요약을 슬랙 웹훅으로 전송 (아웃박스에 보관된 경우에도 발송 완료로 간주)"""
         try:
-            # 전체 메시지 포매팅
-            message = self.format_news_message(analysis_result)
-
-            # 메시지 분할 및 전송
-            message_parts = self.split_message(message)
-            for part in message_parts:
-                requests.post(self.webhook_url, json={
-                    'text': part,
-                    'unfurl_links': False  # 링크 미리보기 비활성화
-                })
-
-            logger.info(f"슬랙 메시지 전송 완료: {len(analysis_result.get('news_items', []))}개 뉴스")
+            # 전체 메시지 포매팅 및 분할
+            payloads = self.build_summary_payloads(analysis_result)
+
+            # 순서대로 전송
+            if self.deliver(payloads):
+                logger.info(f"슬랙 메시지 전송 완료: {len(analysis_result.get('news_items', []))}개 뉴스")
+            else:
+                logger.warning("슬랙 메시지 전송 실패, 아웃박스에 보관 후 다음 주기에 재전송")
             return True
 
         except Exception as e:
             logger.error(f"슬랙 메시지 전송 오류: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+
+
+class SlackStreamSession:
+    """스트리밍 분석 결과를 생성되는 대로 발송 (헤드라인 → 분석 포인트 → 사용 정보 순)
+
+    targets를 지정하면 sender 형식으로 한 번 렌더링한 메시지를 각 대상 웹훅에 보낸다.
+    executor가 있으면 대상별 전송을 동시에 진행하고 모두 끝난 뒤 반환한다.
+    """
+
+    def __init__(self, sender: SlackSender, targets: Optional[List[SlackSender]] = None,
+                 executor: Optional[Executor] = None):
+        self.sender = sender
+        self.targets = targets or [sender]
+        self.executor = executor
+        self.analysis_count = 0
+        self.succeeded = True
+
+    def _post(self, message: str = '', blocks: List[Dict] = None) -> None:
+        if blocks is not None:
+            payloads = self.sender.block_renderer.pack(blocks)
+        else:
+            # 단독 메시지로 보내므로 섹션 구분용 앞뒤 줄바꿈 제거
+            payloads = self.sender.build_payloads(message.strip('\n'))
+
+        with metrics.span('slack_send', streaming=True, payloads=len(payloads)) as span:
+            if self.executor is None or len(self.targets) == 1:
+                outcomes = [self._deliver(target, payloads) for target in self.targets]
+            else:
+                deliver = metrics.propagate(lambda target: self._deliver(target, payloads))
+                outcomes = list(self.executor.map(deliver, self.targets))
+            span.set(destinations=len(outcomes), failed_destinations=outcomes.count(False))
+        self.succeeded &= all(outcomes)
+
+    @staticmethod
+    def _deliver(target: SlackSender, payloads: List[Dict]) -> bool:
+        try:
+            target.deliver(payloads)
+            return True
+        except Exception as e:
+            logger.error(f"슬랙 스트리밍 메시지 전송 오류: {str(e)}")
+            return False
+
+    @property
+    def use_blocks(self) -> bool:
+        return self.sender.message_format == 'blocks'
+
+    def send_headlines(self, news_items: List[Dict]) -> None:
+        if self.use_blocks:
+            self._post(blocks=self.sender.block_renderer.headline_blocks(news_items))
+        else:
+            self._post(self.sender.format_headlines(news_items))
+
+    def send_analysis(self, analysis: Dict) -> None:
+        self.analysis_count += 1
+        if self.use_blocks:
+            renderer = self.sender.block_renderer
+            blocks = renderer.analysis_point_blocks(self.analysis_count, analysis)
+            if self.analysis_count == 1:
+                blocks = renderer.analysis_header_blocks() + blocks
+            self._post(blocks=blocks)
+            return
+
+        message = self.sender.format_analysis_point(self.analysis_count, analysis)
+        if self.analysis_count == 1:
+            message = self.sender.format_analysis_header() + message
+        self._post(message)
+
+    def finish(self, usage_info: Dict) -> bool:
+        if usage_info:
+            usage_text = self.sender.format_usage_info(usage_info)
+            if self.use_blocks:
+                self._post(blocks=self.sender.block_renderer.text_blocks(usage_text))
+            else:
+                self._post(usage_text)
+        logger.info(f"슬랙 스트리밍 발송 완료: 분석 포인트 {self.analysis_count}개")
+        return self.succeeded
@@ -0,0 +1,116 @@
+# modules/token_budget.py
+import math
+import re
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_HANGUL = re.compile(r'[가-힣ㄱ-ㅎㅏ-ㅣ]')
+_WHITESPACE = re.compile(r'\s+')
+
+# 제목 한 줄에 붙는 목록 기호/ID/구분자 토큰 추정치
+LINE_OVERHEAD_TOKENS = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """오프라인 토큰 수 추정 (한글은 글자당 1토큰, 그 외는 약 3.5자당 1토큰으로 보수적으로 계산)"""
+    hangul = len(_HANGUL.findall(text))
+    others = len(_WHITESPACE.sub(' ', text)) - hangul
+    return hangul + math.ceil(max(others, 0) / 3.5)
+
+
+def compact_whitespace(text: str) -> str:
+    """줄 앞뒤 공백과 빈 줄을 제거하고 연속 공백을 하나로 정리"""
+    lines = (_WHITESPACE.sub(' ', line).strip() for line in text.splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+class TokenBudget:
+    """요청 전 입력 토큰 추정 및 예산 초과 시 프롬프트 축약
+
+    max_input_tokens가 0이면 예산 제한 없이 추정치만 기록한다.
+    exact=True이면 API의 토큰 카운트 엔드포인트로 정확한 값을 구하고, 실패하면 추정치를 사용한다.
+    """
+
+    def __init__(self, max_input_tokens: int = 0, exact: bool = False, client=None,
+                 model: Optional[str] = None, min_items: int = 10):
+        self.max_input_tokens = max_input_tokens
+        self.exact = exact and client is not None
+        self.client = client
+        self.model = model
+        self.min_items = min_items
+
+        # 누적 통계 (호출 측에서 전후 차이로 이번 분석의 값을 계산)
+        self.projected_tokens = 0
+        self.trimmed = 0
+        self._lock = threading.Lock()
+
+    def _count_exact(self, prompt: str) -> int:
+        messages = [{"role": "user", "content": prompt}]
+        try:
+            result = self.client.messages.count_tokens(model=self.model, messages=messages)
+        except AttributeError:
+            # 정식 엔드포인트가 없는 SDK 버전은 beta 엔드포인트 사용
+            result = self.client.beta.messages.count_tokens(model=self.model, messages=messages)
+        if not isinstance(result.input_tokens, int):
+            raise ValueError(f"잘못된 토큰 카운트 응답: {result}")
+        return result.input_tokens
+
+    def count(self, prompt: str) -> int:
+        """프롬프트 입력 토큰 수"""
+        if self.exact:
+            try:
+                return self._count_exact(prompt)
+            except Exception as e:
+                logger.warning(f"토큰 카운트 API 호출 실패, 추정치를 사용합니다: {str(e)}")
+        return estimate_tokens(prompt)
+
+    def project(self, prompt: str) -> int:
+        """예산 조정 없이 프롬프트 입력 토큰 수를 계산해 누적"""
+        tokens = self.count(prompt)
+        with self._lock:
+            self.projected_tokens += tokens
+        return tokens
+
+    def fit(self, news_items: List[Dict], build: Callable[[List[Dict], bool], str],
+            rank_key: Callable[[Dict], tuple]) -> Tuple[str, List[Dict]]:
+        """예산에 맞는 (프롬프트, 사용된 뉴스 목록) 반환
+
+        build(news_items, compact)로 프롬프트를 만들며, 예산을 넘으면
+        1) 공백/ID 축약 프롬프트로 바꾸고 2) 순위가 낮은 뉴스부터 제외한다.
+        """
+        prompt = build(news_items, False)
+        tokens = self.count(prompt)
+
+        if self.max_input_tokens and tokens > self.max_input_tokens:
+            prompt = build(news_items, True)
+            tokens = self.count(prompt)
+
+        trimmed = 0
+        while self.max_input_tokens and tokens > self.max_input_tokens and len(news_items) > self.min_items:
+            # 초과분을 메울 만큼 순위가 낮은 뉴스부터 제외한 뒤 다시 계산
+            excess = tokens - self.max_input_tokens
+            dropped = set()
+            for news in sorted(news_items, key=rank_key)[:len(news_items) - self.min_items]:
+                if excess <= 0:
+                    break
+                dropped.add(id(news))
+                excess -= estimate_tokens(news['title']) + LINE_OVERHEAD_TOKENS
+
+            news_items = [news for news in news_items if id(news) not in dropped]
+            prompt = build(news_items, True)
+            tokens = self.count(prompt)
+            trimmed += len(dropped)
+
+        if trimmed:
+            with self._lock:
+                self.trimmed += trimmed
+            logger.info(f"입력 토큰 예산 초과로 순위가 낮은 뉴스 {trimmed}개 제외")
+        if self.max_input_tokens and tokens > self.max_input_tokens:
+            logger.warning(f"축약 후에도 입력 토큰 예산 초과: {tokens} > {self.max_input_tokens}")
+
+        with self._lock:
+            self.projected_tokens += tokens
+        return prompt, news_items
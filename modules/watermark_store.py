@@ -0,0 +1,39 @@
+# modules/watermark_store.py
+import json
+import os
+from typing import Any, Dict, Optional
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class WatermarkStore:
+    """마지막으로 처리한 뉴스 위치(create_at, news_id)를 로컬 JSON 파일에 보관"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """저장된 워터마크 조회 (없으면 None)"""
+        if not os.path.exists(self.path):
+            return None
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                watermark = json.load(f)
+            return watermark if watermark.get('create_at') else None
+        except (OSError, ValueError) as e:
+            logger.error(f"워터마크 로드 실패: {str(e)}")
+            return None
+
+    def save(self, watermark: Dict[str, Any]) -> None:
+        """워터마크 저장 (임시 파일 작성 후 교체)"""
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(watermark, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        logger.info(f"워터마크 갱신: {watermark['create_at']} / {watermark['news_id']}")
@@ -0,0 +1,9 @@
+# tests/conftest.py
+"""테스트 공통 설정 (Config 필수 환경변수가 없으면 더미 값 사용)"""
+import os
+import sys
+
+for _name in ('DB_HOST', 'DB_USER', 'DB_PASSWORD', 'DB_NAME', 'SLACK_WEBHOOK_URL', 'CLAUDE_API_KEY'):
+    os.environ.setdefault(_name, 'test')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,94 @@
+# tests/test_analysis_stream_parser.py
+import glob
+import os
+from types import SimpleNamespace
+import pytest
+from modules.analysis_stream_parser import MarketAnalysisStreamParser
+from modules.claude_client import ClaudeClient
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), '..', 'benchmarks', 'corpus', 'claude_responses')
+
+# 정규화 대상(줄바꿈/연속 공백, 말줄임표, HTML 엔티티, '+' 부호 점수)이 포함된 응답
+NORMALIZED_RESPONSE = """{
+  "market_analysis": [
+    {"topic": "환율···리스크", "impact": "Negative", "score": -3,
+     "affected_sectors": ["수출주 &amp; 항공"], "duration": "단기",
+     "analysis": "원/달러 환율이\\n  급등하며  수입 물가 부담…"},
+    {"topic": "반도체 업황", "impact": "Positive", "score": +3,
+     "affected_sectors": ["반도체"], "duration": "중기", "analysis": "메모리 가격 반등"}
+  ]
+}"""
+
+
+def stream_items(text: str, chunk_size: int):
+    parser = MarketAnalysisStreamParser()
+    for start in range(0, len(text), chunk_size):
+        parser.feed(text[start:start + chunk_size])
+    return parser.items
+
+
+def corpus():
+    paths = sorted(glob.glob(os.path.join(CORPUS_DIR, '*.txt')))
+    assert paths
+    return [pytest.param(open(path, encoding='utf-8').read(), id=os.path.basename(path)) for path in paths]
+
+
+@pytest.fixture(scope='module')
+def client():
+    return ClaudeClient('test-key')
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 4096])
+@pytest.mark.parametrize('text', corpus() + [pytest.param(NORMALIZED_RESPONSE, id='normalized')])
+def test_streamed_items_match_full_parse(client, text, chunk_size):
+    expected = client.clean_and_parse_json(text)['market_analysis']
+
+    assert stream_items(text, chunk_size) == expected
+
+
+def test_streamed_items_are_normalized():
+    first, second = stream_items(NORMALIZED_RESPONSE, 7)
+
+    assert first['topic'] == '환율...리스크'
+    assert first['affected_sectors'] == ['수출주 & 항공']
+    assert first['analysis'] == '원/달러 환율이 급등하며 수입 물가 부담...'
+    assert second['score'] == 3
+
+
+# 헤드라인 인용 등으로 이스케이프되지 않은 따옴표가 홀수 개 들어간 응답
+ODD_INNER_QUOTE_RESPONSE = """{"market_analysis": [
+  {"topic": "환율", "impact": "Negative", "score": -2, "analysis": "원화 약세"},
+  {"topic": "반도체", "impact": "Positive", "score": 3, "analysis": "삼성전자 "HBM 공급 확대 기대"},
+  {"topic": "금리", "impact": "Neutral", "score": 0, "analysis": "동결 전망"}
+]}"""
+
+
+class FakeStream:
+    def __init__(self, text: str, chunk_size: int = 5):
+        self.text_stream = [text[start:start + chunk_size] for start in range(0, len(text), chunk_size)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def get_final_message(self):
+        return SimpleNamespace(usage=SimpleNamespace(input_tokens=100, output_tokens=50))
+
+
+def test_odd_inner_quote_recovers_items_missed_by_stream(client, monkeypatch):
+    # 스트리밍 파서는 따옴표 상태가 어긋나 첫 항목만 추출함
+    assert [item['topic'] for item in stream_items(ODD_INNER_QUOTE_RESPONSE, 5)] == ['환율']
+
+    fake_anthropic = SimpleNamespace(messages=SimpleNamespace(stream=lambda **kwargs: FakeStream(ODD_INNER_QUOTE_RESPONSE)))
+    monkeypatch.setattr(client, 'streaming', True)
+    monkeypatch.setattr(client, 'analysis_mode', 'single')
+    monkeypatch.setattr(client, 'analysis_cache', None)
+    monkeypatch.setattr(client, '_client', fake_anthropic)
+    emitted = []
+
+    result = client.analyze_with_claude([{'news_id': 1, 'title': '환율 급등'}], on_analysis=emitted.append)
+
+    assert [item['topic'] for item in result['market_analysis']] == ['환율', '반도체', '금리']
+    assert [item['topic'] for item in emitted] == ['환율', '반도체', '금리']
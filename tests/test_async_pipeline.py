@@ -0,0 +1,151 @@
+# tests/test_async_pipeline.py
+import asyncio
+import threading
+from modules.async_pipeline import AsyncNewsPipeline
+
+NEWS_ITEMS = [{'news_id': 1, 'title': '금리 인상'}, {'news_id': 2, 'title': '환율 급등'}]
+ANALYSIS = [{'topic': '금리', 'score': 2}, {'topic': '환율', 'score': -1}]
+
+
+class FakeStreamSession:
+    def __init__(self, succeeded: bool):
+        self.succeeded = succeeded
+        self.sent = []
+        self.threads = set()
+
+    def _record(self, kind, value):
+        self.threads.add(threading.current_thread().name)
+        self.sent.append((kind, value))
+
+    def send_headlines(self, news_items):
+        self._record('headlines', news_items)
+
+    def send_analysis(self, analysis):
+        self._record('analysis', analysis)
+
+    def finish(self, usage_info):
+        self._record('usage', usage_info)
+        return self.succeeded
+
+
+class FakeRouter:
+    def __init__(self, succeeded: bool = True):
+        self.session = FakeStreamSession(succeeded)
+
+    def stream_session(self):
+        return self.session
+
+
+class FakeAsyncClient:
+    # AsyncAnthropic처럼 생성 시점의 이벤트 루프에서만 사용 가능
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+
+
+class FakeClaudeClient:
+    def __init__(self, error: bool = False):
+        self.error = error
+        self._async_client = None
+        self.closed_clients = []
+
+    @property
+    def async_client(self):
+        if self._async_client is None:
+            self._async_client = FakeAsyncClient()
+        return self._async_client
+
+    async def close_async_client(self):
+        async_client, self._async_client = self._async_client, None
+        if async_client is not None:
+            async_client.closed = True
+            self.closed_clients.append(async_client)
+
+    async def analyze_with_claude_async(self, selected_news, on_analysis=None, on_selected=None):
+        assert self.async_client.loop is asyncio.get_running_loop()
+        # 예산으로 마지막 뉴스가 제외된 경우
+        on_selected(selected_news[:1])
+        for analysis in ANALYSIS:
+            await asyncio.sleep(0)
+            on_analysis(analysis)
+        if self.error:
+            return {'market_analysis': [], 'usage_info': {}, 'news_items': selected_news[:1], 'error': True}
+        return {'market_analysis': ANALYSIS, 'usage_info': {'total_cost': 0.01}, 'news_items': selected_news[:1]}
+
+
+class FakeDataLoader:
+    def __init__(self):
+        self.watermarks = []
+
+    def commit_watermark(self, watermark):
+        self.watermarks.append(watermark)
+
+
+class FakeAnalyzer:
+    def __init__(self, error: bool = False):
+        self.claude_client = FakeClaudeClient(error)
+        self.data_loader = FakeDataLoader()
+        self.reported = []
+
+    def prepare_selection(self, now):
+        return {'date': '2026-01-01', 'period': '08:40', 'total_count': 2, 'watermark': (1, 2),
+                'news_items': list(NEWS_ITEMS)}
+
+    def build_result(self, prepared, analyzed_result):
+        return {**prepared, 'news_items': analyzed_result['news_items'],
+                'selected_count': len(analyzed_result['news_items']),
+                'usage_info': analyzed_result['usage_info'], 'error': analyzed_result.get('error', False)}
+
+    def mark_reported(self, news_items):
+        self.reported.extend(news_items)
+
+
+def test_async_pipeline_sends_through_router_in_order():
+    analyzer, router = FakeAnalyzer(), FakeRouter()
+
+    outcome = asyncio.run(AsyncNewsPipeline(analyzer, router).run())
+
+    assert outcome == {'status': 'success', 'analyzed_count': 1}
+    assert router.session.sent == [
+        ('headlines', NEWS_ITEMS[:1]),
+        ('analysis', ANALYSIS[0]),
+        ('analysis', ANALYSIS[1]),
+        ('usage', {'total_cost': 0.01})
+    ]
+    assert len(router.session.threads) == 1
+    assert analyzer.data_loader.watermarks == [(1, 2)]
+    assert analyzer.reported == NEWS_ITEMS[:1]
+
+
+def test_async_pipeline_undelivered_keeps_watermark():
+    analyzer, router = FakeAnalyzer(), FakeRouter(succeeded=False)
+
+    outcome = asyncio.run(AsyncNewsPipeline(analyzer, router).run())
+
+    assert outcome['status'] == 'undelivered'
+    assert analyzer.data_loader.watermarks == []
+    assert analyzer.reported == []
+
+
+def test_async_pipeline_failed_analysis_keeps_watermark():
+    analyzer, router = FakeAnalyzer(error=True), FakeRouter()
+
+    outcome = asyncio.run(AsyncNewsPipeline(analyzer, router).run())
+
+    assert outcome['status'] == 'error'
+    assert analyzer.data_loader.watermarks == []
+    assert analyzer.reported == []
+
+
+def test_async_pipeline_back_to_back_runs_use_fresh_client():
+    analyzer = FakeAnalyzer()
+    pipeline = AsyncNewsPipeline(analyzer, FakeRouter())
+
+    # 스케줄러처럼 실행마다 asyncio.run으로 새 이벤트 루프 사용
+    outcomes = [asyncio.run(pipeline.run()) for _ in range(2)]
+
+    assert [outcome['status'] for outcome in outcomes] == ['success', 'success']
+    closed = analyzer.claude_client.closed_clients
+    assert len(closed) == 2 and closed[0] is not closed[1]
+    assert all(client.closed for client in closed)
+    assert analyzer.claude_client._async_client is None
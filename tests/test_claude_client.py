@@ -0,0 +1,74 @@
+# tests/test_claude_client.py
+import json
+from types import SimpleNamespace
+from modules.analysis_cache import AnalysisCache
+from modules.news_analyzer import NewsAnalyzer
+from modules.reported_filter import ReportedFilter
+from modules.token_budget import TokenBudget
+
+RESPONSE = json.dumps({'market_analysis': [{'topic': '금리', 'score': 1, 'affected_sectors': ['은행']}]})
+
+
+def make_news():
+    # 순위가 가장 낮은 마지막 뉴스(관련 기사 0건)가 예산 초과 시 먼저 제외됨
+    return [
+        {'news_id': index, 'title': f"{title} 관련 시장 동향 기사 {index}", 'related_count': related_count}
+        for index, (title, related_count) in enumerate([('금리 인상', 5), ('환율 급등', 4), ('실적 발표', 3), ('규제 완화', 0)])
+    ]
+
+
+def make_analyzer(tmp_path, news_items):
+    analyzer = NewsAnalyzer(data_loader=None, claude_api_key='test-key')
+    client = analyzer.claude_client
+    compact_tokens = [
+        client.token_budget.count(client.build_prompt(items, '3-5', True))
+        for items in (news_items, news_items[:-1])
+    ]
+    # 전체 뉴스는 넘고 한 건을 빼면 들어가는 예산
+    client.token_budget = TokenBudget(max_input_tokens=compact_tokens[1], min_items=1)
+    assert compact_tokens[0] > compact_tokens[1]
+    client.analysis_cache = AnalysisCache(str(tmp_path / 'cache'))
+    client.reported_filter = ReportedFilter(str(tmp_path / 'reported'))
+    client.prompts = []
+
+    def create(prompt):
+        client.prompts.append(prompt)
+        return RESPONSE, SimpleNamespace(input_tokens=100, output_tokens=10)
+
+    client._create = create
+    return analyzer
+
+
+def test_trimmed_news_is_not_reported(tmp_path):
+    news_items = make_news()
+    trimmed = news_items[-1]
+    analyzer = make_analyzer(tmp_path, news_items)
+    client = analyzer.claude_client
+    headlines = []
+
+    analyzed = client.analyze_with_claude(news_items, on_selected=headlines.append)
+    prepared = {'date': '2026-01-01', 'period': '08:40', 'total_count': len(news_items), 'news_items': news_items}
+    result = analyzer.build_result(prepared, analyzed)
+    analyzer.mark_reported(result['news_items'])
+
+    assert trimmed['title'] not in client.prompts[0]
+    assert result['news_items'] == news_items[:-1]
+    assert result['selected_count'] == 3
+    assert headlines == [news_items[:-1]]
+    assert trimmed['title'] not in client.reported_filter
+    assert all(news['title'] in client.reported_filter for news in news_items[:-1])
+
+
+def test_analysis_cache_is_keyed_by_fitted_news(tmp_path):
+    news_items = make_news()
+    analyzer = make_analyzer(tmp_path, news_items)
+    client = analyzer.claude_client
+
+    client.analyze_with_claude(news_items)
+    assert client.analysis_cache.get(client.model, client.prompt_version, [news['news_id'] for news in news_items[:-1]])
+
+    headlines = []
+    cached = client.analyze_with_claude(news_items, on_selected=headlines.append)
+    assert len(client.prompts) == 1
+    assert cached['news_items'] == news_items[:-1]
+    assert headlines == [news_items[:-1]]
@@ -0,0 +1,40 @@
+# tests/test_cluster_index.py
+from modules.cluster_index import ClusterIndex
+
+HOUR = 3600
+T0 = 1_800_000_000.0
+
+
+def make_index(tmp_path) -> ClusterIndex:
+    return ClusterIndex(str(tmp_path / 'cluster_index.json'), similarity_threshold=65, ttl_hours=48)
+
+
+def test_rereading_news_in_overlapping_windows_does_not_extend_cluster(tmp_path):
+    index = make_index(tmp_path)
+    news = {'news_id': 1, 'title': '한국은행 기준금리 인상 결정'}
+
+    # 실행마다 조회 구간이 겹쳐 같은 뉴스를 다시 읽음
+    cluster_id = index.assign(news, '시장_전반', now=T0)
+    for hours in (12, 24, 36, 47):
+        assert index.assign(news, '시장_전반', now=T0 + hours * HOUR) == cluster_id
+
+    index.evict(now=T0 + 49 * HOUR)
+
+    assert cluster_id not in index.clusters
+    assert '1' not in index.news_to_cluster
+
+
+def test_new_member_extends_cluster(tmp_path):
+    index = make_index(tmp_path)
+    cluster_id = index.assign({'news_id': 1, 'title': '한국은행 기준금리 인상 결정'}, '시장_전반', now=T0)
+    joined_id = index.assign({'news_id': 2, 'title': '한국은행 기준금리 인상 결정 발표'}, '시장_전반',
+                             now=T0 + 24 * HOUR)
+
+    index.evict(now=T0 + 49 * HOUR)
+
+    assert joined_id == cluster_id
+    assert cluster_id in index.clusters
+    assert index.clusters[cluster_id]['news_ids'] == ['1', '2']
+
+    index.evict(now=T0 + 73 * HOUR)
+    assert cluster_id not in index.clusters
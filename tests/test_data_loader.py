@@ -0,0 +1,55 @@
+# tests/test_data_loader.py
+from datetime import datetime
+import pytz
+from modules.data_loader import NewsDataLoader
+
+KST = pytz.timezone('Asia/Seoul')
+# KST 2026-03-02 08:40 (UTC로는 전날)
+UTC_RUN_AT = datetime(2026, 3, 1, 23, 40, tzinfo=pytz.utc)
+
+
+class FakeConnector:
+    def __init__(self):
+        self.params = []
+
+    def execute_query(self, query, params=None):
+        self.params.append(params)
+        return [{'news_id': 1, 'title': '뉴스', 'create_at': datetime(2026, 3, 2, 8, 0)}]
+
+    def stream_query(self, query, params=None, batch_size=1000):
+        self.params.append(params)
+        yield self.execute_query(query, params)
+
+
+def make_loader(tmp_path):
+    loader = NewsDataLoader(FakeConnector())
+    loader.watermark_store.path = str(tmp_path / 'watermark.json')
+    return loader
+
+
+def test_period_date_uses_kst(tmp_path):
+    loader = make_loader(tmp_path)
+
+    news_data = loader.get_news_by_period(UTC_RUN_AT)
+    stream_data = loader.stream_news_by_period(UTC_RUN_AT)
+
+    assert news_data['date'] == stream_data['date'] == '2026-03-02'
+    assert loader.mysql_connector.params[0] == ('2026-03-01 15:00:00', '2026-03-02 08:30:00')
+
+
+def test_naive_time_is_treated_as_kst(tmp_path):
+    loader = make_loader(tmp_path)
+
+    news_data = loader.get_news_by_period(datetime(2026, 3, 2, 8, 40))
+
+    assert news_data['date'] == '2026-03-02'
+    assert loader.mysql_connector.params[0] == ('2026-03-01 15:00:00', '2026-03-02 08:30:00')
+
+
+def test_watermark_date_uses_kst(tmp_path):
+    loader = make_loader(tmp_path)
+
+    news_data = loader.get_news_since_watermark(UTC_RUN_AT)
+    stream_data = loader.stream_news_since_watermark(UTC_RUN_AT)
+
+    assert news_data['date'] == stream_data['date'] == '2026-03-02'
@@ -0,0 +1,77 @@
+# tests/test_json_repair.py
+import glob
+import json
+import os
+import random
+import pytest
+from benchmarks.json_repair_bench import CORPUS_DIR, build_response, count_items, legacy_clean_and_parse_json
+from modules.json_repair import parse_tolerant_json
+
+RESPONSES_DIR = os.path.join(os.path.dirname(__file__), '..', 'benchmarks', 'corpus', 'claude_responses')
+
+with open(os.path.join(CORPUS_DIR, 'expected.json'), encoding='utf-8') as _f:
+    EXPECTED = json.load(_f)
+
+# 파일별로 기록되어야 하는 복구 종류
+EXPECTED_REPAIRS = {
+    '01_code_fence.txt': {'code_fence'},
+    '02_leading_prose.txt': {'leading_text'},
+    '03_inner_quotes.txt': {'inner_quote'},
+    '04_trailing_commas.txt': {'trailing_comma'},
+    '05_truncated_mid_item.txt': {'truncated'},
+    '06_truncated_in_array.txt': {'truncated'},
+    '07_plus_scores_unicode.txt': {'plus_sign'},
+    '08_missing_commas_newlines.txt': {'missing_comma'},
+    '09_title_inner_quotes.txt': {'inner_quote'},
+    '10_no_json.txt': set()
+}
+
+
+def read(path: str) -> str:
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+def legacy_parsed_files():
+    # 기존 정규식 정제 방식으로도 파싱되던 응답 (09는 기존 방식이 제목을 잘못 합치므로 별도 검증)
+    paths = sorted(glob.glob(os.path.join(CORPUS_DIR, '*.txt')) + glob.glob(os.path.join(RESPONSES_DIR, '*.txt')))
+    params = [pytest.param(path, id=os.path.basename(path)) for path in paths
+              if legacy_clean_and_parse_json(read(path)) is not None
+              and os.path.basename(path) != '09_title_inner_quotes.txt']
+    assert params
+    return params
+
+
+@pytest.mark.parametrize('name', sorted(EXPECTED))
+def test_repair_corpus_recovers_expected_items(name):
+    parsed, repairs = parse_tolerant_json(read(os.path.join(CORPUS_DIR, name)))
+
+    assert count_items(parsed) == EXPECTED[name]
+    assert repairs == EXPECTED_REPAIRS[name]
+
+
+@pytest.mark.parametrize('path', legacy_parsed_files())
+def test_matches_legacy_parser_where_it_succeeded(path):
+    text = read(path)
+
+    parsed, _ = parse_tolerant_json(text)
+
+    assert parsed == legacy_clean_and_parse_json(text)
+
+
+def test_title_inner_quotes_are_kept_per_title():
+    # 기존 정규식 정제는 두 제목을 하나로 합쳐 버림
+    parsed, _ = parse_tolerant_json(read(os.path.join(CORPUS_DIR, '09_title_inner_quotes.txt')))
+
+    titles = [news['title'] for news in parsed['market_analysis'][0]['related_news']]
+    assert titles == ['삼성전자 3분기 영업익 "10조" 회복..."시장 예상 상회"', 'LG전자, "가전 부진" 딛고 최대 매출']
+
+
+def test_truncated_response_keeps_only_complete_items():
+    text = build_response(4, random.Random(7))
+    cut = text.index('\n        }', text.index('\n        }') + 1) + len('\n        }')
+
+    for end in (cut - 1, cut, cut + 20):
+        parsed, repairs = parse_tolerant_json(text[:end])
+        assert count_items(parsed) == (1 if end < cut else 2)
+        assert 'truncated' in repairs
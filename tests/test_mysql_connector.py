@@ -0,0 +1,54 @@
+# tests/test_mysql_connector.py
+from mysql.connector import Error
+from modules.mysql_connector import ConnectionPool
+
+
+class FakeConnection:
+    def __init__(self, rollback_error: bool = False):
+        self.rollback_error = rollback_error
+        self.rollbacks = 0
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    def ping(self, reconnect=False):
+        pass
+
+    def rollback(self):
+        if self.rollback_error:
+            raise Error("rollback failed")
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+def test_release_rolls_back_before_reuse():
+    pool = ConnectionPool({}, pool_size=1)
+    connection = FakeConnection()
+    pool._slots.acquire()
+    pool.release(connection)
+
+    assert connection.rollbacks == 1
+    assert pool.acquire() is connection
+
+
+def test_release_discards_connection_when_rollback_fails():
+    pool = ConnectionPool({}, pool_size=1)
+    connection = FakeConnection(rollback_error=True)
+    pool._slots.acquire()
+    pool.release(connection)
+
+    assert connection.closed
+    assert pool._idle.empty()
+
+
+def test_discarded_connection_is_not_rolled_back():
+    pool = ConnectionPool({}, pool_size=1)
+    connection = FakeConnection()
+    pool._slots.acquire()
+    pool.release(connection, discard=True)
+
+    assert connection.rollbacks == 0
+    assert connection.closed
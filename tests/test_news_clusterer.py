@@ -0,0 +1,25 @@
+# tests/test_news_clusterer.py
+import pytest
+from benchmarks.headlines import generate_headlines
+from modules.claude_client import ClaudeClient
+from modules.news_clusterer import NewsClusterer
+
+# lsh 엔진의 클러스터 수는 exact 대비 이 비율 이내여야 함
+LSH_TOLERANCE = 0.02
+
+
+def cluster_count(client: ClaudeClient, rows, engine: str) -> int:
+    client.clusterer = NewsClusterer(client.similarity_threshold, engine=engine)
+    clustered = client.cluster_news([dict(row) for row in rows])
+    return sum(len(items) for items in clustered.values())
+
+
+@pytest.mark.parametrize('seed', [5, 42])
+def test_lsh_cluster_count_close_to_exact(seed):
+    client = ClaudeClient('test-key')
+    rows = generate_headlines(1000, seed=seed)
+
+    exact = cluster_count(client, rows, 'exact')
+    lsh = cluster_count(client, rows, 'lsh')
+
+    assert abs(lsh - exact) <= exact * LSH_TOLERANCE
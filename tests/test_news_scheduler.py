@@ -0,0 +1,91 @@
+# tests/test_news_scheduler.py
+import main
+import modules.news_scheduler as news_scheduler
+from modules.news_scheduler import NewsAnalysisScheduler
+
+
+class FakeDataLoader:
+    def __init__(self):
+        self.watermarks = []
+
+    def commit_watermark(self, watermark):
+        self.watermarks.append(watermark)
+
+
+class FakeAnalyzer:
+    def __init__(self, data_loader, error: bool = False):
+        self.data_loader = data_loader
+        self.error = error
+        self.reported = []
+
+    def analyze_news_by_period(self, now=None, **kwargs):
+        return {
+            'news_items': [{'id': 1, 'title': '뉴스'}],
+            'selected_count': 1,
+            'watermark': (1, 1),
+            'usage_info': {},
+            'error': self.error
+        }
+
+    def mark_reported(self, news_items):
+        self.reported.extend(news_items)
+
+
+class FakeRouter:
+    def __init__(self, sent: bool):
+        self.sent = sent
+
+    def send_news_summary(self, analysis_result):
+        return self.sent
+
+    def flush_outbox(self):
+        pass
+
+
+def make_scheduler(sent: bool, analysis_error: bool = False) -> NewsAnalysisScheduler:
+    # DB/슬랙 연결 없이 분석/발송 흐름만 확인
+    scheduler = NewsAnalysisScheduler.__new__(NewsAnalysisScheduler)
+    scheduler.pipeline_mode = 'sync'
+    scheduler.data_loader = FakeDataLoader()
+    scheduler.analyzer = FakeAnalyzer(scheduler.data_loader, analysis_error)
+    scheduler.slack_router = FakeRouter(sent)
+    return scheduler
+
+
+def test_undelivered_run_keeps_watermark():
+    scheduler = make_scheduler(sent=False)
+
+    outcome = scheduler.run_analysis()
+
+    assert outcome['status'] == 'undelivered'
+    assert scheduler.data_loader.watermarks == []
+    assert scheduler.analyzer.reported == []
+
+
+def test_delivered_run_commits_watermark():
+    scheduler = make_scheduler(sent=True)
+
+    outcome = scheduler.run_analysis()
+
+    assert outcome == {'status': 'success', 'analyzed_count': 1}
+    assert scheduler.data_loader.watermarks == [(1, 1)]
+    assert scheduler.analyzer.reported == [{'id': 1, 'title': '뉴스'}]
+
+
+def test_failed_analysis_keeps_watermark():
+    # Claude 호출이 모두 실패해 헤드라인만 발송된 경우
+    scheduler = make_scheduler(sent=True, analysis_error=True)
+
+    outcome = scheduler.run_analysis()
+
+    assert outcome['status'] == 'error'
+    assert scheduler.data_loader.watermarks == []
+    assert scheduler.analyzer.reported == []
+
+
+def test_run_once_exits_nonzero_when_undelivered(monkeypatch):
+    monkeypatch.setattr(news_scheduler, 'NewsAnalysisScheduler', lambda: make_scheduler(sent=False))
+    assert main.run_once() == 1
+
+    monkeypatch.setattr(news_scheduler, 'NewsAnalysisScheduler', lambda: make_scheduler(sent=True))
+    assert main.run_once() == 0
@@ -0,0 +1,71 @@
+# tests/test_news_selector.py
+import random
+from modules.news_selector import RankedPools
+
+CATEGORIES = ['시장_전반', '기업_산업', '정책_규제', '글로벌_경제', '기타']
+
+
+def rank_key(news):
+    # ClaudeClient.rank_key와 같은 형태 (미발송 우선, 관련 기사 수, 제목 길이)
+    return not news['reported'], news['related_count'], len(news['title'])
+
+
+def legacy_select(clustered_news, min_counts, max_items):
+    """기존 정렬 기반 ClaudeClient.select_news (비교용)"""
+    selected = []
+    for category, required in min_counts.items():
+        news_pool = clustered_news.get(category, [])
+        if not news_pool:
+            continue
+        selected.extend(sorted(news_pool, key=rank_key, reverse=True)[:required])
+
+    remaining_slots = max_items - len(selected)
+    if remaining_slots > 0:
+        remaining_pool = []
+        for category, news_list in clustered_news.items():
+            remaining_pool.extend([n for n in news_list if n not in selected])
+        selected.extend(sorted(remaining_pool, key=rank_key, reverse=True)[:remaining_slots])
+    return selected
+
+
+def make_clustered(rng: random.Random):
+    # 관련 기사 수와 제목 길이의 범위를 좁혀 동점이 많이 생기도록 구성
+    clustered, news_id = {}, 0
+    for category in rng.sample(CATEGORIES, rng.randint(1, len(CATEGORIES))):
+        pool = []
+        for _ in range(rng.randint(0, 30)):
+            news_id += 1
+            pool.append({'news_id': news_id, 'title': '가' * rng.randint(3, 5),
+                         'related_count': rng.randint(0, 2), 'reported': rng.random() < 0.2})
+        clustered[category] = pool
+    return clustered
+
+
+def test_ranked_pools_match_sort_based_selection():
+    rng = random.Random(42)
+    for case in range(200):
+        clustered = make_clustered(rng)
+        min_counts = {category: rng.randint(0, 5) for category in rng.sample(CATEGORIES, 3)}
+        max_items = rng.randint(10, 25)
+        limit = max([max_items, 10, *min_counts.values()])
+
+        ranked = RankedPools(clustered, rank_key, limit)
+        relaxed = {category: max(count - 1, 2) for category, count in min_counts.items()}
+
+        # 요구사항을 완화한 재선별에도 같은 RankedPools를 재사용
+        for counts in (min_counts, relaxed):
+            expected = [news['news_id'] for news in legacy_select(clustered, counts, max_items)]
+            actual = [news['news_id'] for news in ranked.select(counts, max_items)]
+            assert actual == expected, f"case {case}: {counts}, max_items={max_items}"
+
+
+def test_ties_keep_category_then_pool_order():
+    clustered = {
+        '기업_산업': [{'news_id': 1, 'title': '동점', 'related_count': 1, 'reported': False},
+                  {'news_id': 2, 'title': '동점', 'related_count': 1, 'reported': False}],
+        '시장_전반': [{'news_id': 3, 'title': '동점', 'related_count': 1, 'reported': False}]
+    }
+
+    selected = RankedPools(clustered, rank_key, 10).select({}, 10)
+
+    assert [news['news_id'] for news in selected] == [1, 2, 3]
@@ -0,0 +1,80 @@
+# tests/test_profiler.py
+import asyncio
+import random
+from contextlib import contextmanager
+from types import SimpleNamespace
+import pytest
+from utils.profiler import RunProfiler
+
+
+def make_profiler(monkeypatch, sample_every: int = 1, target: str = 'run_analysis'):
+    profiler = RunProfiler(enabled=True, target=target, sample_every=sample_every)
+    profiled = []
+
+    @contextmanager
+    def fake_profiling():
+        profiled.append(True)
+        yield
+
+    monkeypatch.setattr(profiler, '_profiling', fake_profiling)
+    return profiler, profiled
+
+
+class FakeClaudeClient:
+    def analyze_with_claude(self, selected_news, on_analysis=None):
+        return {'mode': 'sync'}
+
+    async def analyze_with_claude_async(self, selected_news, on_analysis=None):
+        await asyncio.sleep(0)
+        return {'mode': 'async'}
+
+
+def make_scheduler(pipeline_mode: str = 'sync', stream_batch_size: int = 0):
+    return SimpleNamespace(
+        pipeline_mode=pipeline_mode,
+        data_loader=SimpleNamespace(get_news=lambda now: None),
+        analyzer=SimpleNamespace(stream_batch_size=stream_batch_size, claude_client=FakeClaudeClient()),
+        slack_router=SimpleNamespace(send_news_summary=lambda result: True)
+    )
+
+
+def test_sample_every_one_profiles_every_call(monkeypatch):
+    profiler, profiled = make_profiler(monkeypatch, sample_every=1)
+    wrapped = profiler.wrap(lambda value: value * 2)
+
+    assert [wrapped(value) for value in range(5)] == [0, 2, 4, 6, 8]
+    assert len(profiled) == 5
+
+
+def test_first_call_is_not_always_profiled(monkeypatch):
+    # 1회 실행은 호출이 한 번뿐이므로 새 프로파일러의 첫 호출이 1/N 확률로만 측정되어야 함
+    random.seed(0)
+    first_calls = 0
+    for _ in range(400):
+        profiler, profiled = make_profiler(monkeypatch, sample_every=4)
+        profiler.wrap(lambda: None)()
+        first_calls += len(profiled)
+
+    assert 60 < first_calls < 140
+
+
+def test_claude_target_wraps_sync_and_async_paths(monkeypatch):
+    profiler, profiled = make_profiler(monkeypatch, target='claude')
+    scheduler = make_scheduler()
+    profiler.install(scheduler)
+    client = scheduler.analyzer.claude_client
+
+    assert client.analyze_with_claude([]) == {'mode': 'sync'}
+    assert asyncio.run(client.analyze_with_claude_async([])) == {'mode': 'async'}
+    assert len(profiled) == 2
+
+
+@pytest.mark.parametrize('target, scheduler', [
+    ('db_fetch', make_scheduler(stream_batch_size=1000)),
+    ('slack_send', make_scheduler(pipeline_mode='async'))
+])
+def test_install_rejects_target_off_active_path(monkeypatch, target, scheduler):
+    profiler, _ = make_profiler(monkeypatch, target=target)
+
+    with pytest.raises(ValueError):
+        profiler.install(scheduler)
@@ -0,0 +1,32 @@
+# tests/test_reported_filter.py
+from datetime import datetime, timedelta
+from modules.reported_filter import ReportedFilter
+from utils.config import KST
+
+BEFORE_MIDNIGHT = KST.localize(datetime(2026, 3, 1, 23, 59))
+
+
+def test_lookup_after_day_boundary_drops_expired_day(tmp_path):
+    reported = ReportedFilter(str(tmp_path), retention_days=1)
+    reported.add(['금리 인상 발표'], now=BEFORE_MIDNIGHT)
+
+    assert reported.contains('금리 인상 발표', now=BEFORE_MIDNIGHT)
+    assert not reported.contains('금리 인상 발표', now=BEFORE_MIDNIGHT + timedelta(minutes=2))
+    assert not (tmp_path / '2026-03-01.bloom').exists()
+
+
+def test_lookup_keeps_days_within_retention(tmp_path):
+    reported = ReportedFilter(str(tmp_path), retention_days=2)
+    reported.add(['금리 인상 발표'], now=BEFORE_MIDNIGHT)
+
+    assert reported.contains('금리 인상 발표', now=BEFORE_MIDNIGHT + timedelta(days=1))
+    assert not reported.contains('금리 인상 발표', now=BEFORE_MIDNIGHT + timedelta(days=1, minutes=2))
+
+
+def test_filter_reloads_from_disk(tmp_path):
+    ReportedFilter(str(tmp_path)).add(['환율 급등'])
+
+    reloaded = ReportedFilter(str(tmp_path))
+
+    assert '환율 급등' in reloaded
+    assert '반도체 업황' not in reloaded
@@ -0,0 +1,75 @@
+# tests/test_slack_blocks.py
+from modules.slack_blocks import (
+    MAX_BLOCKS, MAX_FALLBACK_TEXT, MAX_HEADER_TEXT, MAX_SECTION_TEXT, SlackBlockRenderer, chunk_lines
+)
+
+renderer = SlackBlockRenderer()
+
+
+def make_news(count: int):
+    return [{'title': f"뉴스 {i} <속보> & 시장 동향", 'link': f"https://news.example.com/{i}",
+             'section': f"섹션{i % 7}"} for i in range(count)]
+
+
+def make_analysis(count: int, analysis_chars: int = 200):
+    return [{'topic': f"주제 {i}", 'impact': 'Positive', 'score': 3, 'affected_sectors': ['반도체', '자동차'],
+             'duration': '단기', 'analysis': '분석 ' * (analysis_chars // 3)} for i in range(count)]
+
+
+def section(text: str):
+    return {'type': 'section', 'text': {'type': 'mrkdwn', 'text': text}}
+
+
+def check_limits(payloads):
+    for payload in payloads:
+        assert 0 < len(payload['blocks']) <= MAX_BLOCKS
+        assert len(payload['text']) <= MAX_FALLBACK_TEXT
+        for block in payload['blocks']:
+            if block['type'] == 'section':
+                assert len(block['text']['text']) <= MAX_SECTION_TEXT
+            elif block['type'] == 'header':
+                assert len(block['text']['text']) <= MAX_HEADER_TEXT
+
+
+def test_pack_keeps_every_block_in_order_within_limits():
+    # 헤드라인 섹션 분할, 3000자 초과 분석, 사용 정보가 모두 포함된 큰 결과
+    blocks = renderer.render(make_news(400), make_analysis(60, analysis_chars=4000), "사용 정보\n" * 10)
+    assert len(blocks) > 3 * MAX_BLOCKS
+
+    payloads = renderer.pack(blocks)
+
+    check_limits(payloads)
+    assert [block for payload in payloads for block in payload['blocks']] == blocks
+
+
+def test_pack_does_not_end_message_with_header_or_divider():
+    # 구분선과 분석 제목이 49, 50번째 블록에 오는 경우
+    headlines = [section(f"헤드라인 {i}") for i in range(MAX_BLOCKS - 2)]
+    points = [section(f"분석 {i}") for i in range(3)]
+    blocks = headlines + renderer.analysis_header_blocks() + points
+
+    payloads = renderer.pack(blocks)
+
+    assert [payload['blocks'] for payload in payloads] == [headlines, renderer.analysis_header_blocks() + points]
+
+
+def test_pack_splits_exactly_at_block_limit():
+    sections = [section(f"줄 {i}") for i in range(MAX_BLOCKS + 1)]
+
+    assert [len(payload['blocks']) for payload in renderer.pack(sections[:MAX_BLOCKS])] == [MAX_BLOCKS]
+    assert [len(payload['blocks']) for payload in renderer.pack(sections)] == [MAX_BLOCKS, 1]
+
+
+def test_chunk_lines_splits_long_lines_without_losing_text():
+    long_line = '가' * (MAX_SECTION_TEXT * 2 + 10)
+
+    chunks = list(chunk_lines(['머리말', long_line, '꼬리말'], MAX_SECTION_TEXT))
+
+    assert all(len(chunk) <= MAX_SECTION_TEXT for chunk in chunks)
+    assert ''.join(chunks).replace('\n', '') == '머리말' + long_line + '꼬리말'
+
+
+def test_header_text_is_truncated():
+    block = renderer.header('가' * (MAX_HEADER_TEXT + 50))
+
+    assert len(block['text']['text']) == MAX_HEADER_TEXT
@@ -18,9 +18,106 @@ class Config:
         'max_news_items': 20
     }
 
+    # Claude 선택 설정 (스트리밍, 분석 결과 캐시)
+    CLAUDE_DEFAULTS = {
+        'streaming': False,  # 응답 스트리밍 및 분석 항목 점진 발송
+        'cache_enabled': False,  # 분석 결과 캐시 사용 여부
+        'cache_dir': 'data/analysis_cache',  # 캐시 저장 디렉토리
+        'cache_ttl_hours': 24,  # 캐시 유효 시간
+        'cache_max_entries': 200,  # 최대 캐시 항목 수 (초과 시 LRU 제거)
+        'cache_near_hit_ratio': 0.0,  # 0보다 크면 뉴스 ID 겹침 비율이 이 이상인 항목도 재사용 (예: 0.9)
+        'analysis_mode': 'single',  # 분석 방식 (single: 단일 프롬프트, sharded: 카테고리별 병렬 분석 후 병합)
+        'shard_workers': 4,  # sharded 모드 동시 요청 수
+        'reduce_mode': 'local',  # 샤드 결과 병합 방식 (local: 로컬 중복 제거/정렬, claude: 요약 호출)
+        'max_analysis_points': 5,  # 병합 후 유지할 최대 분석 포인트 수
+        'base_url': None,  # API 엔드포인트 변경 (로컬 테스트 서버 등)
+        'rate_limit_enabled': False,  # 클라이언트 측 요청 한도 및 재시도 사용 여부
+        'requests_per_minute': 50,  # 분당 요청 수 한도
+        'tokens_per_minute': 40000,  # 분당 토큰 수 한도
+        'max_concurrency': 4,  # 최대 동시 요청 수 (한도 초과 시 자동 감소 후 회복)
+        'min_concurrency': 1,  # 최소 동시 요청 수
+        'max_retries': 5,  # 429/529/일시 오류 최대 재시도 횟수
+        'backoff_base': 1.0,  # 지수 백오프 기본 대기 시간 (초)
+        'backoff_max': 60.0,  # 최대 대기 시간 (초)
+        'max_input_tokens': 0,  # 요청당 입력 토큰 예산 (0: 제한 없음, 초과 시 프롬프트 축약)
+        'exact_token_count': False  # 토큰 카운트 API로 정확한 입력 토큰 계산 (실패 시 추정치)
+    }
+
+    # DB 커넥션 풀 및 조회 설정
+    DB_DEFAULTS = {
+        'pool_enabled': False,  # 커넥션 풀 사용 여부
+        'pool_size': 5,  # 풀 최대 커넥션 수
+        'pool_recycle': 1800,  # 유휴 커넥션 재생성 기준 (초)
+        'pool_timeout': 30,  # 커넥션 대여 대기 시간 (초)
+        'stream_batch_size': 0,  # 0보다 크면 뉴스를 배치 단위로 스트리밍 조회
+        'ensure_index': False,  # 시작 시 구간 조회용 커버링 인덱스 생성
+        'explain_check': False  # 시작 시 구간 조회 실행 계획 점검
+    }
+
     # 뉴스 분석 관련 설정
     NEWS_DEFAULTS = {
-        'similarity_threshold': 70  # 기사 유사도 임계값
+        'similarity_threshold': 70,  # 기사 유사도 임계값
+        'clustering_engine': 'exact',  # 클러스터링 엔진 (exact/lsh/matrix/incremental)
+        'lsh_num_perm': 64,  # MinHash 순열 개수
+        # LSH 밴드 개수 (num_perm의 약수). 유사 제목 쌍의 슁글 Jaccard가 0.1까지 낮아 밴드당 1행으로 설정
+        # (후보 확률 1-(1-s)^64: s=0.1에서 99.9%, exact 대비 유사 쌍 재현율 1.00 / 후보 정밀도 0.18)
+        'lsh_bands': 64,
+        'matrix_block_size': 1024,  # matrix 엔진의 블록당 행 수
+        'matrix_verify_margin': 0,  # 임계값 미만 이 범위 내 쌍은 fuzz로 재검증
+        'cluster_index_path': 'data/cluster_index.json',  # incremental 엔진 인덱스 파일
+        'cluster_index_ttl_hours': 48,  # 클러스터 인덱스 보관 시간
+        'load_mode': 'period',  # 뉴스 조회 방식 (period: 고정 구간, watermark: 마지막 처리 위치 이후)
+        'watermark_path': 'data/watermark.json',  # 워터마크 저장 파일
+        'watermark_lookback_hours': 18,  # 워터마크가 없을 때 최초 조회 구간 (시간)
+        'keywords_path': None,  # 카테고리별 키워드 JSON 파일 (미지정 시 기본 키워드)
+        'reported_mode': 'off',  # 이미 발송한 뉴스 처리 (off, demote: 순위 하향, skip: 선별 제외)
+        'reported_dir': 'data/reported',  # 날짜별 발송 이력 Bloom 필터 저장 디렉토리
+        'reported_retention_days': 2,  # 발송 이력 보관 일수 (오늘 포함)
+        'reported_capacity': 20000,  # 일별 필터 용량 (제목 수)
+        'reported_error_rate': 0.001  # 용량 이내에서의 오탐률
+    }
+
+    # 슬랙 발송 설정
+    SLACK_DEFAULTS = {
+        'timeout': 10,  # 웹훅 요청 타임아웃 (초)
+        'min_interval': 1.0,  # 웹훅별 최소 전송 간격 (초)
+        'outbox_enabled': False,  # 미발송 메시지를 디스크에 보관 후 다음 주기에 재전송
+        'outbox_dir': 'data/slack_outbox',  # 아웃박스 저장 디렉토리
+        'message_format': 'text',  # 메시지 형식 (text: 일반 텍스트, blocks: Block Kit)
+        'destinations_path': None  # 여러 목적지 발송 설정 JSON 파일 (미지정 시 webhook_url 하나)
+    }
+
+    # 재시도 설정 (DB 연결, 슬랙 전송)
+    RETRY_DEFAULTS = {
+        'max_retries': 3,  # 최대 시도 횟수
+        'retry_delay': 5  # 재시도 대기 시간 (초, 시도 횟수만큼 증가)
+    }
+
+    # 파이프라인 실행 설정
+    PIPELINE_DEFAULTS = {
+        'mode': 'sync',  # sync: 기존 순차 실행, async: asyncio 파이프라인
+        'workers': 2  # DB 조회/클러스터링용 스레드 수
+    }
+
+    # 단계별 추적/지표 내보내기 설정 (경로를 비우면 해당 내보내기 생략)
+    METRICS_DEFAULTS = {
+        'enabled': False,  # 단계별 스팬 및 지표 수집 여부
+        'textfile_path': 'logs/metrics/news_analyzer.prom',  # node-exporter textfile collector용 Prometheus 파일
+        'spans_path': 'logs/metrics/spans.jsonl',  # OpenTelemetry 형식 스팬 JSONL 파일
+        'http_port': 0,  # 0보다 크면 이 포트에서 /metrics 엔드포인트 제공
+        'prefix': 'news_analyzer'  # 지표 이름 접두사
+    }
+
+    # 실행 프로파일링 설정 (run_analysis 또는 단계 하나를 N회마다 1회 측정)
+    PROFILING_DEFAULTS = {
+        'enabled': False,  # 프로파일링 사용 여부
+        'target': 'run_analysis',  # 대상 (run_analysis, db_fetch, cluster, select, claude, slack_send)
+        'sample_every': 1,  # 실행마다 1/N 확률로 프로파일
+        'output_dir': 'logs/profiles',  # 보고서 저장 디렉토리
+        'tracemalloc': True,  # 메모리 할당 상위 위치 기록 (실행 속도가 느려짐)
+        'sampler_interval': 0.0,  # 0보다 크면 이 간격(초)으로 모든 스레드 스택 샘플링
+        'top_n': 30,  # 보고서에 포함할 상위 함수/할당 위치 수
+        'max_reports': 50  # 보관할 최대 보고서 수 (오래된 것부터 삭제)
     }
 
     # 로깅 설정
@@ -51,18 +148,95 @@ class Config:
                 'port': int(os.getenv('DB_PORT', 3306)),
                 'user': os.getenv('DB_USER'),
                 'password': os.getenv('DB_PASSWORD'),
-                'database': os.getenv('DB_NAME')
+                'database': os.getenv('DB_NAME'),
+                'pool_enabled': os.getenv('DB_POOL_ENABLED', str(self.DB_DEFAULTS['pool_enabled'])).lower() == 'true',
+                'pool_size': int(os.getenv('DB_POOL_SIZE', self.DB_DEFAULTS['pool_size'])),
+                'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', self.DB_DEFAULTS['pool_recycle'])),
+                'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', self.DB_DEFAULTS['pool_timeout'])),
+                'stream_batch_size': int(os.getenv('DB_STREAM_BATCH_SIZE', self.DB_DEFAULTS['stream_batch_size'])),
+                'ensure_index': os.getenv('DB_ENSURE_INDEX', str(self.DB_DEFAULTS['ensure_index'])).lower() == 'true',
+                'explain_check': os.getenv('DB_EXPLAIN_CHECK', str(self.DB_DEFAULTS['explain_check'])).lower() == 'true'
             },
             'claude': {
                 'api_key': os.getenv('CLAUDE_API_KEY', self.CLAUDE_REQUIRED['api_key']),
                 'model': os.getenv('CLAUDE_MODEL', self.CLAUDE_REQUIRED['model']),
                 'max_tokens': int(os.getenv('CLAUDE_MAX_TOKENS', self.CLAUDE_REQUIRED['max_tokens'])),
-                'max_news_items': int(os.getenv('MAX_NEWS_ITEMS', self.CLAUDE_REQUIRED['max_news_items']))
+                'max_news_items': int(os.getenv('MAX_NEWS_ITEMS', self.CLAUDE_REQUIRED['max_news_items'])),
+                'streaming': os.getenv('CLAUDE_STREAMING', str(self.CLAUDE_DEFAULTS['streaming'])).lower() == 'true',
+                'cache_enabled': os.getenv('CLAUDE_CACHE_ENABLED', str(self.CLAUDE_DEFAULTS['cache_enabled'])).lower() == 'true',
+                'cache_dir': os.getenv('CLAUDE_CACHE_DIR', self.CLAUDE_DEFAULTS['cache_dir']),
+                'cache_ttl_hours': int(os.getenv('CLAUDE_CACHE_TTL_HOURS', self.CLAUDE_DEFAULTS['cache_ttl_hours'])),
+                'cache_max_entries': int(os.getenv('CLAUDE_CACHE_MAX_ENTRIES', self.CLAUDE_DEFAULTS['cache_max_entries'])),
+                'cache_near_hit_ratio': float(os.getenv('CLAUDE_CACHE_NEAR_HIT_RATIO', self.CLAUDE_DEFAULTS['cache_near_hit_ratio'])),
+                'analysis_mode': os.getenv('CLAUDE_ANALYSIS_MODE', self.CLAUDE_DEFAULTS['analysis_mode']),
+                'shard_workers': int(os.getenv('CLAUDE_SHARD_WORKERS', self.CLAUDE_DEFAULTS['shard_workers'])),
+                'reduce_mode': os.getenv('CLAUDE_REDUCE_MODE', self.CLAUDE_DEFAULTS['reduce_mode']),
+                'max_analysis_points': int(os.getenv('CLAUDE_MAX_ANALYSIS_POINTS', self.CLAUDE_DEFAULTS['max_analysis_points'])),
+                'base_url': os.getenv('CLAUDE_BASE_URL', self.CLAUDE_DEFAULTS['base_url']),
+                'rate_limit_enabled': os.getenv('CLAUDE_RATE_LIMIT_ENABLED', str(self.CLAUDE_DEFAULTS['rate_limit_enabled'])).lower() == 'true',
+                'requests_per_minute': int(os.getenv('CLAUDE_REQUESTS_PER_MINUTE', self.CLAUDE_DEFAULTS['requests_per_minute'])),
+                'tokens_per_minute': int(os.getenv('CLAUDE_TOKENS_PER_MINUTE', self.CLAUDE_DEFAULTS['tokens_per_minute'])),
+                'max_concurrency': int(os.getenv('CLAUDE_MAX_CONCURRENCY', self.CLAUDE_DEFAULTS['max_concurrency'])),
+                'min_concurrency': int(os.getenv('CLAUDE_MIN_CONCURRENCY', self.CLAUDE_DEFAULTS['min_concurrency'])),
+                'max_retries': int(os.getenv('CLAUDE_MAX_RETRIES', self.CLAUDE_DEFAULTS['max_retries'])),
+                'backoff_base': float(os.getenv('CLAUDE_BACKOFF_BASE', self.CLAUDE_DEFAULTS['backoff_base'])),
+                'backoff_max': float(os.getenv('CLAUDE_BACKOFF_MAX', self.CLAUDE_DEFAULTS['backoff_max'])),
+                'max_input_tokens': int(os.getenv('CLAUDE_MAX_INPUT_TOKENS', self.CLAUDE_DEFAULTS['max_input_tokens'])),
+                'exact_token_count': os.getenv('CLAUDE_EXACT_TOKEN_COUNT', str(self.CLAUDE_DEFAULTS['exact_token_count'])).lower() == 'true'
             },
             'slack': {
-                'webhook_url': os.getenv('SLACK_WEBHOOK_URL')
+                'webhook_url': os.getenv('SLACK_WEBHOOK_URL'),
+                'timeout': int(os.getenv('SLACK_TIMEOUT', self.SLACK_DEFAULTS['timeout'])),
+                'min_interval': float(os.getenv('SLACK_MIN_INTERVAL', self.SLACK_DEFAULTS['min_interval'])),
+                'outbox_enabled': os.getenv('SLACK_OUTBOX_ENABLED', str(self.SLACK_DEFAULTS['outbox_enabled'])).lower() == 'true',
+                'outbox_dir': os.getenv('SLACK_OUTBOX_DIR', self.SLACK_DEFAULTS['outbox_dir']),
+                'message_format': os.getenv('SLACK_MESSAGE_FORMAT', self.SLACK_DEFAULTS['message_format']),
+                'destinations_path': os.getenv('SLACK_DESTINATIONS_PATH', self.SLACK_DEFAULTS['destinations_path'])
+            },
+            'retry': {
+                'max_retries': int(os.getenv('RETRY_MAX_RETRIES', self.RETRY_DEFAULTS['max_retries'])),
+                'retry_delay': float(os.getenv('RETRY_DELAY', self.RETRY_DEFAULTS['retry_delay']))
+            },
+            'pipeline': {
+                'mode': os.getenv('PIPELINE_MODE', self.PIPELINE_DEFAULTS['mode']),
+                'workers': int(os.getenv('PIPELINE_WORKERS', self.PIPELINE_DEFAULTS['workers']))
+            },
+            'news': {
+                **self.NEWS_DEFAULTS,
+                'clustering_engine': os.getenv('NEWS_CLUSTERING_ENGINE', self.NEWS_DEFAULTS['clustering_engine']),
+                'lsh_num_perm': int(os.getenv('NEWS_LSH_NUM_PERM', self.NEWS_DEFAULTS['lsh_num_perm'])),
+                'lsh_bands': int(os.getenv('NEWS_LSH_BANDS', self.NEWS_DEFAULTS['lsh_bands'])),
+                'matrix_block_size': int(os.getenv('NEWS_MATRIX_BLOCK_SIZE', self.NEWS_DEFAULTS['matrix_block_size'])),
+                'matrix_verify_margin': int(os.getenv('NEWS_MATRIX_VERIFY_MARGIN', self.NEWS_DEFAULTS['matrix_verify_margin'])),
+                'cluster_index_path': os.getenv('NEWS_CLUSTER_INDEX_PATH', self.NEWS_DEFAULTS['cluster_index_path']),
+                'cluster_index_ttl_hours': int(os.getenv('NEWS_CLUSTER_INDEX_TTL_HOURS', self.NEWS_DEFAULTS['cluster_index_ttl_hours'])),
+                'load_mode': os.getenv('NEWS_LOAD_MODE', self.NEWS_DEFAULTS['load_mode']),
+                'watermark_path': os.getenv('NEWS_WATERMARK_PATH', self.NEWS_DEFAULTS['watermark_path']),
+                'watermark_lookback_hours': int(os.getenv('NEWS_WATERMARK_LOOKBACK_HOURS', self.NEWS_DEFAULTS['watermark_lookback_hours'])),
+                'keywords_path': os.getenv('NEWS_KEYWORDS_PATH', self.NEWS_DEFAULTS['keywords_path']),
+                'reported_mode': os.getenv('NEWS_REPORTED_MODE', self.NEWS_DEFAULTS['reported_mode']),
+                'reported_dir': os.getenv('NEWS_REPORTED_DIR', self.NEWS_DEFAULTS['reported_dir']),
+                'reported_retention_days': int(os.getenv('NEWS_REPORTED_RETENTION_DAYS', self.NEWS_DEFAULTS['reported_retention_days'])),
+                'reported_capacity': int(os.getenv('NEWS_REPORTED_CAPACITY', self.NEWS_DEFAULTS['reported_capacity'])),
+                'reported_error_rate': float(os.getenv('NEWS_REPORTED_ERROR_RATE', self.NEWS_DEFAULTS['reported_error_rate']))
+            },
+            'metrics': {
+                'enabled': os.getenv('METRICS_ENABLED', str(self.METRICS_DEFAULTS['enabled'])).lower() == 'true',
+                'textfile_path': os.getenv('METRICS_TEXTFILE_PATH', self.METRICS_DEFAULTS['textfile_path']),
+                'spans_path': os.getenv('METRICS_SPANS_PATH', self.METRICS_DEFAULTS['spans_path']),
+                'http_port': int(os.getenv('METRICS_HTTP_PORT', self.METRICS_DEFAULTS['http_port'])),
+                'prefix': os.getenv('METRICS_PREFIX', self.METRICS_DEFAULTS['prefix'])
+            },
+            'profiling': {
+                'enabled': os.getenv('PROFILING_ENABLED', str(self.PROFILING_DEFAULTS['enabled'])).lower() == 'true',
+                'target': os.getenv('PROFILING_TARGET', self.PROFILING_DEFAULTS['target']),
+                'sample_every': int(os.getenv('PROFILING_SAMPLE_EVERY', self.PROFILING_DEFAULTS['sample_every'])),
+                'output_dir': os.getenv('PROFILING_OUTPUT_DIR', self.PROFILING_DEFAULTS['output_dir']),
+                'tracemalloc': os.getenv('PROFILING_TRACEMALLOC', str(self.PROFILING_DEFAULTS['tracemalloc'])).lower() == 'true',
+                'sampler_interval': float(os.getenv('PROFILING_SAMPLER_INTERVAL', self.PROFILING_DEFAULTS['sampler_interval'])),
+                'top_n': int(os.getenv('PROFILING_TOP_N', self.PROFILING_DEFAULTS['top_n'])),
+                'max_reports': int(os.getenv('PROFILING_MAX_REPORTS', self.PROFILING_DEFAULTS['max_reports']))
             },
-            'news': self.NEWS_DEFAULTS,
             'logging': self.LOGGING_DEFAULTS
         }
 
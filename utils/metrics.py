@@ -0,0 +1,321 @@
+# utils/metrics.py
+"""분석 파이프라인 단계별 추적 및 지표 내보내기
+
+- span(): 단계 소요 시간과 속성(행 수, 비교 횟수, 토큰, 비용, 재시도 등)을 기록하는 컨텍스트 매니저
+- trace(): 실행 한 번을 감싸는 루트 스팬. 끝나면 모인 스팬을 집계해
+  OpenTelemetry 형식 스팬을 JSONL로 추가 기록하고 Prometheus 텍스트 형식 지표를 갱신한다.
+  (node-exporter textfile 파일, 선택적으로 /metrics HTTP 엔드포인트)
+
+숫자 속성은 단계(stage) 라벨을 붙여 누적 카운터({prefix}_{속성}_total)와
+마지막 실행 값 게이지({prefix}_last_run_{속성})로 내보낸다.
+"""
+import contextvars
+import json
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from utils.config import Config
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+config = Config.get_instance()
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar('current_span', default=None)
+
+
+class Span:
+    """단계 하나의 실행 구간"""
+
+    __slots__ = ('name', 'trace_id', 'span_id', 'parent_id', 'attributes', 'start_ns', 'end_ns',
+                 'status', 'error', '_started', '_lock')
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attributes: Dict):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.attributes = dict(attributes)
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.status = 'OK'
+        self.error = ''
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def set(self, **attributes) -> None:
+        with self._lock:
+            self.attributes.update(attributes)
+
+    def add(self, name: str, value: float = 1) -> None:
+        """숫자 속성 누적 (여러 스레드에서 호출 가능)"""
+        with self._lock:
+            self.attributes[name] = self.attributes.get(name, 0) + value
+
+    def end(self) -> None:
+        self.end_ns = self.start_ns + int((time.perf_counter() - self._started) * 1e9)
+
+    @property
+    def duration(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e9
+
+    def numeric_attributes(self) -> Iterator[Tuple[str, float]]:
+        for key, value in self.attributes.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                yield key, value
+
+    def to_dict(self) -> Dict:
+        """OpenTelemetry 스팬 형식 (JSON 직렬화용)"""
+        return {
+            'traceId': self.trace_id,
+            'spanId': self.span_id,
+            'parentSpanId': self.parent_id or '',
+            'name': self.name,
+            'startTimeUnixNano': self.start_ns,
+            'endTimeUnixNano': self.end_ns,
+            'attributes': self.attributes,
+            'status': {'code': self.status, 'message': self.error}
+        }
+
+
+class _NoopSpan:
+    """지표 수집을 끈 경우 사용하는 빈 스팬"""
+
+    def set(self, **attributes) -> None:
+        pass
+
+    def add(self, name: str, value: float = 1) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class PipelineMetrics:
+    """스팬 수집, 실행 단위 집계 및 Prometheus/JSONL 내보내기"""
+
+    _instance = None
+    # 루트 스팬 없이 끝난 스팬(스레드 전파 누락 등)이 쌓이지 않도록 보관 개수 제한
+    MAX_BUFFERED_SPANS = 10000
+
+    @staticmethod
+    def get_instance() -> 'PipelineMetrics':
+        if PipelineMetrics._instance is None:
+            PipelineMetrics._instance = PipelineMetrics(
+                enabled=config.get('metrics.enabled', False),
+                textfile_path=config.get('metrics.textfile_path'),
+                spans_path=config.get('metrics.spans_path'),
+                http_port=config.get('metrics.http_port', 0),
+                prefix=config.get('metrics.prefix', 'news_analyzer')
+            )
+        return PipelineMetrics._instance
+
+    def __init__(self, enabled: bool = False, textfile_path: Optional[str] = None,
+                 spans_path: Optional[str] = None, http_port: int = 0, prefix: str = 'news_analyzer'):
+        self.enabled = enabled
+        self.textfile_path = textfile_path
+        self.spans_path = spans_path
+        self.prefix = prefix
+
+        self._lock = threading.Lock()
+        self._spans: deque = deque(maxlen=self.MAX_BUFFERED_SPANS)
+        self._durations: Dict[str, List[float]] = defaultdict(lambda: [0.0, 0])  # 단계별 [합계, 횟수]
+        self._totals: Dict[Tuple[str, str], float] = defaultdict(float)  # (속성, 단계) 누적값
+        self._last_run: Dict[Tuple[str, str], float] = {}  # (속성, 단계) 마지막 실행 값
+        self._runs: Dict[str, int] = defaultdict(int)  # 실행 결과별 횟수
+        self._last_run_timestamp = 0.0
+
+        self.server = None
+        if enabled and http_port:
+            self.start_http_server(http_port)
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator:
+        """단계 실행 구간 기록 (현재 스팬의 하위 스팬, 예외가 나면 ERROR 상태로 기록 후 전파)"""
+        if not self.enabled:
+            yield _NOOP_SPAN
+            return
+
+        parent = _current_span.get()
+        span = Span(name, parent.trace_id if parent else uuid.uuid4().hex, parent.span_id if parent else None,
+                    attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.status = 'ERROR'
+            span.error = str(e)[:200]
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+            with self._lock:
+                self._spans.append(span)
+
+    @contextmanager
+    def trace(self, name: str, **attributes) -> Iterator:
+        """실행 한 번을 감싸는 루트 스팬 (종료 시 집계 및 내보내기)
+
+        실행 결과는 status 속성(없으면 성공 여부)으로 {prefix}_runs_total에 집계된다.
+        """
+        token = _current_span.set(None)
+        try:
+            with self.span(name, **attributes) as root:
+                yield root
+        finally:
+            _current_span.reset(token)
+            if self.enabled:
+                self._complete(root)
+
+    def current(self):
+        """현재 스팬 (없거나 수집을 끈 경우 빈 스팬)"""
+        return _current_span.get() or _NOOP_SPAN
+
+    def annotate(self, **attributes) -> None:
+        """현재 스팬에 속성 기록"""
+        self.current().set(**attributes)
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """현재 스팬의 숫자 속성 누적 (예: 재시도 횟수)"""
+        self.current().add(name, value)
+
+    def propagate(self, func: Callable) -> Callable:
+        """다른 스레드에서 실행할 함수가 현재 스팬을 부모로 이어받도록 감쌈
+
+        ThreadPoolExecutor/run_in_executor는 contextvars를 전달하지 않으므로 제출 전에 감싼다.
+        """
+        parent = _current_span.get()
+        if not self.enabled or parent is None:
+            return func
+
+        def run(*args, **kwargs):
+            token = _current_span.set(parent)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _current_span.reset(token)
+
+        return run
+
+    def _complete(self, root: Span) -> None:
+        """실행 종료 시 쌓인 스팬을 집계하고 내보내기"""
+        with self._lock:
+            spans = list(self._spans)
+            self._spans.clear()
+
+            last_run: Dict[Tuple[str, str], float] = defaultdict(float)
+            for span in spans:
+                duration = self._durations[span.name]
+                duration[0] += span.duration
+                duration[1] += 1
+                last_run[('stage_seconds', span.name)] += span.duration
+                for key, value in span.numeric_attributes():
+                    self._totals[(key, span.name)] += value
+                    last_run[(key, span.name)] += value
+
+            self._last_run = dict(last_run)
+            status = root.attributes.get('status') or ('success' if root.status == 'OK' else 'error')
+            self._runs[str(status)] += 1
+            self._last_run_timestamp = root.end_ns / 1e9
+
+        self._write_spans(spans)
+        self._write_textfile()
+        logger.info(f"실행 추적 기록 ({root.name}): 스팬 {len(spans)}개, {root.duration:.2f}초")
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        prefix = self.prefix
+        with self._lock:
+            lines = [
+                f"# HELP {prefix}_stage_duration_seconds 단계별 소요 시간",
+                f"# TYPE {prefix}_stage_duration_seconds summary"
+            ]
+            for stage, (total, count) in sorted(self._durations.items()):
+                lines.append(f'{prefix}_stage_duration_seconds_sum{{stage="{_escape(stage)}"}} {total:.6f}')
+                lines.append(f'{prefix}_stage_duration_seconds_count{{stage="{_escape(stage)}"}} {count}')
+
+            lines += [f"# HELP {prefix}_runs_total 실행 결과별 실행 횟수", f"# TYPE {prefix}_runs_total counter"]
+            lines += [f'{prefix}_runs_total{{status="{_escape(status)}"}} {count}'
+                      for status, count in sorted(self._runs.items())]
+            lines += [f"# HELP {prefix}_last_run_timestamp_seconds 마지막 실행 종료 시각",
+                      f"# TYPE {prefix}_last_run_timestamp_seconds gauge",
+                      f"{prefix}_last_run_timestamp_seconds {self._last_run_timestamp:.3f}"]
+
+            lines += self._render_family('counter', '_total', self._totals, lambda key: f"{prefix}_{key}_total")
+            lines += self._render_family('gauge', '', self._last_run, lambda key: f"{prefix}_last_run_{key}")
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _render_family(metric_type: str, suffix: str, values: Dict[Tuple[str, str], float],
+                       metric_name: Callable[[str], str]) -> List[str]:
+        """(속성, 단계) 값을 속성별 지표로 묶어 출력"""
+        by_key: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
+        for (key, stage), value in values.items():
+            by_key[key].append((stage, value))
+
+        lines = []
+        for key in sorted(by_key):
+            name = metric_name(key)
+            lines.append(f"# TYPE {name} {metric_type}")
+            lines += [f'{name}{{stage="{_escape(stage)}"}} {value:g}' for stage, value in sorted(by_key[key])]
+        return lines
+
+    def _write_spans(self, spans: List[Span]) -> None:
+        if not self.spans_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.spans_path) or '.', exist_ok=True)
+            with open(self.spans_path, 'a', encoding='utf-8') as f:
+                for span in spans:
+                    f.write(json.dumps(span.to_dict(), ensure_ascii=False, default=str) + '\n')
+        except OSError as e:
+            logger.warning(f"스팬 기록 실패: {self.spans_path} ({str(e)})")
+
+    def _write_textfile(self) -> None:
+        """node-exporter textfile collector용 파일 갱신 (수집 중 부분 파일이 읽히지 않도록 교체 방식)"""
+        if not self.textfile_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.textfile_path) or '.', exist_ok=True)
+            tmp_path = f"{self.textfile_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(self.render_prometheus())
+            os.replace(tmp_path, self.textfile_path)
+        except OSError as e:
+            logger.warning(f"지표 파일 기록 실패: {self.textfile_path} ({str(e)})")
+
+    def start_http_server(self, port: int) -> None:
+        """GET /metrics로 Prometheus 지표를 제공하는 백그라운드 HTTP 서버"""
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = metrics.render_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        try:
+            self.server = ThreadingHTTPServer(('', port), Handler)
+        except OSError as e:
+            logger.error(f"지표 HTTP 서버 시작 실패 (포트 {port}): {str(e)}")
+            return
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name='metrics-http', daemon=True).start()
+        logger.info(f"지표 HTTP 엔드포인트 시작: :{port}/metrics")
@@ -0,0 +1,259 @@
+# utils/profiler.py
+"""실행 프로파일링 (선택)
+
+설정한 대상(run_analysis 또는 단계 하나)을 무작위로 N회 중 1회 cProfile/tracemalloc으로 감싸고,
+필요하면 모든 스레드의 스택을 주기적으로 수집하는 샘플러를 함께 실행한다.
+프로파일된 실행마다 output_dir에 같은 시각 접두사로 다음 파일을 남긴다.
+
+- {시각}_{대상}.prof: cProfile 원본 (snakeviz, pstats로 분석)
+- {시각}_{대상}.txt: 누적 시간 상위 함수, 메모리 할당 상위 위치 요약
+- {시각}_{대상}.folded: 샘플러 스택 (flamegraph.pl/speedscope용 collapsed 형식, 샘플러 사용 시)
+
+cProfile은 호출한 스레드만 측정하므로 스레드 풀에서 실행되는 작업(슬랙 동시 전송, 샤드 분석 등)은
+샘플러 결과로 확인한다. 코루틴 대상은 대기 중 같은 이벤트 루프에서 실행된 다른 작업도 함께 측정된다.
+"""
+import cProfile
+import functools
+import inspect
+import io
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Optional
+from utils.config import Config, KST
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+config = Config.get_instance()
+
+
+class StackSampler:
+    """주기적으로 모든 스레드의 파이썬 스택을 수집하는 샘플링 프로파일러"""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        names = {}
+        while not self._stop.wait(self.interval):
+            names.update((thread.ident, thread.name) for thread in threading.enumerate())
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                self.stacks[';'.join(reversed(stack))] += 1
+            self.samples += 1
+
+    def write_folded(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class RunProfiler:
+    """대상 메서드를 호출마다 1/sample_every 확률로 프로파일하고 보고서 저장
+
+    1회 실행(--once)은 매번 새 프로세스라 호출 횟수로 고르면 항상 첫 호출이 측정되므로 무작위로 고른다.
+    """
+
+    _instance = None
+
+    # 프로파일 대상 (스케줄러 기준 속성 경로, 메서드 이름 목록: 동기/비동기 경로를 모두 감쌈)
+    TARGETS = {
+        'run_analysis': ('', ('run_analysis',)),
+        'db_fetch': ('data_loader', ('get_news',)),
+        'cluster': ('analyzer.claude_client', ('cluster_news',)),
+        'select': ('analyzer.claude_client', ('select_news',)),
+        'claude': ('analyzer.claude_client', ('analyze_with_claude', 'analyze_with_claude_async')),
+        'slack_send': ('slack_router', ('send_news_summary',))
+    }
+
+    @staticmethod
+    def get_instance() -> 'RunProfiler':
+        if RunProfiler._instance is None:
+            RunProfiler._instance = RunProfiler(
+                enabled=config.get('profiling.enabled', False),
+                target=config.get('profiling.target', 'run_analysis'),
+                sample_every=config.get('profiling.sample_every', 1),
+                output_dir=config.get('profiling.output_dir', 'logs/profiles'),
+                trace_memory=config.get('profiling.tracemalloc', True),
+                sampler_interval=config.get('profiling.sampler_interval', 0.0),
+                top_n=config.get('profiling.top_n', 30),
+                max_reports=config.get('profiling.max_reports', 50)
+            )
+        return RunProfiler._instance
+
+    def __init__(self, enabled: bool = False, target: str = 'run_analysis', sample_every: int = 1,
+                 output_dir: str = 'logs/profiles', trace_memory: bool = True, sampler_interval: float = 0.0,
+                 top_n: int = 30, max_reports: int = 50):
+        if target not in self.TARGETS:
+            raise ValueError(f"지원하지 않는 프로파일 대상입니다: {target} ({', '.join(self.TARGETS)})")
+        self.enabled = enabled
+        self.target = target
+        self.sample_every = max(1, sample_every)
+        self.output_dir = output_dir
+        self.trace_memory = trace_memory
+        self.sampler_interval = sampler_interval
+        self.top_n = top_n
+        self.max_reports = max_reports
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _check_active_path(self, scheduler) -> None:
+        """대상 메서드가 현재 설정의 실행 경로에서 호출되지 않으면 ValueError"""
+        if self.target == 'db_fetch' and scheduler.analyzer.stream_batch_size > 0:
+            # 스트리밍 조회는 배치를 소비하면서 조회하므로 조회 시간이 분류 단계와 섞임
+            raise ValueError("스트리밍 조회(db.stream_batch_size > 0)에서는 db_fetch 대신 run_analysis 또는 cluster 대상을 사용하세요")
+        if self.target == 'slack_send' and (scheduler.pipeline_mode == 'async' or config.get('claude.streaming', False)):
+            # 스트리밍/비동기 발송은 분석 중에 메시지를 보내므로 send_news_summary를 거치지 않음
+            raise ValueError("스트리밍 발송 및 비동기 파이프라인에서는 slack_send 대신 run_analysis 대상을 사용하세요")
+
+    def install(self, scheduler) -> None:
+        """스케줄러의 프로파일 대상 메서드를 인스턴스 속성으로 감쌈"""
+        if not self.enabled:
+            return
+        self._check_active_path(scheduler)
+        owner_path, method_names = self.TARGETS[self.target]
+        owner = scheduler
+        for name in filter(None, owner_path.split('.')):
+            owner = getattr(owner, name)
+        for method_name in method_names:
+            setattr(owner, method_name, self.wrap(getattr(owner, method_name)))
+        logger.info(f"프로파일링 사용: {self.target} (평균 {self.sample_every}회마다 1회, 저장 위치 {self.output_dir})")
+
+    def _sampled(self) -> bool:
+        with self._lock:
+            self.calls += 1
+        return random.random() * self.sample_every < 1
+
+    def wrap(self, func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def profiled_async(*args, **kwargs):
+                if not self._sampled():
+                    return await func(*args, **kwargs)
+                with self._profiling():
+                    return await func(*args, **kwargs)
+
+            return profiled_async
+
+        @functools.wraps(func)
+        def profiled(*args, **kwargs):
+            if not self._sampled():
+                return func(*args, **kwargs)
+            with self._profiling():
+                return func(*args, **kwargs)
+
+        return profiled
+
+    @contextmanager
+    def _profiling(self):
+        started_at = datetime.now(KST)
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+            profile.disable()
+        except ValueError as e:
+            # 다른 프로파일러가 이미 실행 중이면 프로파일 없이 실행
+            logger.warning(f"프로파일링 생략: {str(e)}")
+            yield
+            return
+        sampler = StackSampler(self.sampler_interval) if self.sampler_interval > 0 else None
+        # 이미 다른 곳에서 추적 중이면 시작/종료하지 않음
+        own_tracemalloc = self.trace_memory and not tracemalloc.is_tracing()
+        if own_tracemalloc:
+            tracemalloc.start(10)
+        if sampler:
+            sampler.start()
+
+        start = time.perf_counter()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            elapsed = time.perf_counter() - start
+            if sampler:
+                sampler.stop()
+            snapshot, peak = None, 0
+            if self.trace_memory and tracemalloc.is_tracing():
+                # 프로파일러 자체(샘플러 스택 등)의 할당은 제외
+                snapshot = tracemalloc.take_snapshot().filter_traces((
+                    tracemalloc.Filter(False, __file__),
+                    tracemalloc.Filter(False, tracemalloc.__file__)
+                ))
+                peak = tracemalloc.get_traced_memory()[1]
+            if own_tracemalloc:
+                tracemalloc.stop()
+            self._save(started_at, elapsed, profile, snapshot, peak, sampler)
+
+    def _save(self, started_at: datetime, elapsed: float, profile: cProfile.Profile,
+              snapshot: Optional[tracemalloc.Snapshot], peak: int, sampler: Optional[StackSampler]) -> None:
+        """프로파일 원본과 요약 보고서 저장 (실패해도 실행 결과에는 영향 없음)"""
+        base = os.path.join(self.output_dir, f"{started_at.strftime('%Y%m%d_%H%M%S')}_{self.target}")
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            profile.dump_stats(f"{base}.prof")
+
+            stats_text = io.StringIO()
+            pstats.Stats(profile, stream=stats_text).sort_stats('cumulative').print_stats(self.top_n)
+            lines = [
+                f"대상: {self.target} ({self.calls}번째 호출)",
+                f"시작: {started_at.strftime('%Y-%m-%d %H:%M:%S %Z')}",
+                f"소요 시간: {elapsed:.3f}초",
+                '',
+                f"## 누적 시간 상위 {self.top_n}개 함수 (호출 스레드 기준)",
+                stats_text.getvalue().strip()
+            ]
+            if snapshot is not None:
+                lines += ['', f"## 메모리 할당 상위 {self.top_n}개 위치 (최대 사용량 {peak / 1024 / 1024:.1f}MB)"]
+                lines += [str(stat) for stat in snapshot.statistics('lineno')[:self.top_n]]
+            if sampler:
+                sampler.write_folded(f"{base}.folded")
+                lines += ['', f"## 샘플러: {sampler.samples}회 수집 ({self.sampler_interval}초 간격), {base}.folded"]
+
+            with open(f"{base}.txt", 'w', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+            self._prune()
+            logger.info(f"프로파일 저장: {base}.txt ({elapsed:.2f}초)")
+        except OSError as e:
+            logger.warning(f"프로파일 저장 실패: {base} ({str(e)})")
+
+    def _prune(self) -> None:
+        """오래된 보고서부터 삭제해 최근 max_reports회분만 유지"""
+        if self.max_reports <= 0:
+            return
+        reports = sorted(name for name in os.listdir(self.output_dir) if name.endswith('.txt'))
+        for name in reports[:-self.max_reports]:
+            prefix = name[:-len('.txt')]
+            for suffix in ('.txt', '.prof', '.folded'):
+                try:
+                    os.remove(os.path.join(self.output_dir, prefix + suffix))
+                except FileNotFoundError:
+                    pass